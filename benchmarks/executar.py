@@ -0,0 +1,267 @@
+"""
+Executa a suíte de benchmarks offline do GoogleMapsExtractor.
+
+Uso:
+    python -m benchmarks.executar
+    python -m benchmarks.executar --atualizar-baseline
+    python -m benchmarks.executar --cenario busca_pequena --limiar 0.3
+
+O baseline (benchmarks/baselines.json) depende da máquina e não é versionado:
+grave-o com --atualizar-baseline antes de comparar.
+"""
+
+import json
+import platform
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.servidor_maps import ServidorMapsFalso
+from extrator_leads.core.config import Configuracao
+from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+from extrator_leads.utils.memoria import rss_descendentes_mb, rss_processo_mb
+
+BASELINE_PADRAO = Path(__file__).parent / "baselines.json"
+
+# Cenários: quantidade de resultados no feed, latência por requisição e limite de leads
+CENARIOS: Dict[str, dict] = {
+    "busca_pequena": {"resultados": 20, "latencia_ms": 0, "limit": None},
+    "busca_media": {"resultados": 60, "latencia_ms": 50, "limit": 40},
+    "busca_lenta": {"resultados": 40, "latencia_ms": 250, "limit": 20},
+}
+
+# Métricas comparadas com o baseline: True = maior é melhor
+METRICAS: Dict[str, bool] = {
+    "leads_por_segundo": True,
+    "tempo_primeiro_lead_s": False,
+    "pico_rss_mb": False,
+    "pico_navegador_mb": False,
+}
+
+app = typer.Typer(add_completion=False)
+console = Console()
+
+
+class AmostradorMemoria:
+    """Amostra periodicamente o RSS do processo e dos processos do navegador."""
+
+    def __init__(self, intervalo: float = 0.1):
+        """
+        Inicializa o amostrador.
+
+        Args:
+            intervalo: Intervalo entre amostras em segundos
+        """
+        self.intervalo = intervalo
+        self.pico_rss_mb: Optional[float] = None
+        self.pico_navegador_mb: Optional[float] = None
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._executar, daemon=True)
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            rss = rss_processo_mb()
+            navegador = rss_descendentes_mb()
+            if rss is not None:
+                self.pico_rss_mb = max(self.pico_rss_mb or 0.0, rss)
+            if navegador is not None:
+                self.pico_navegador_mb = max(self.pico_navegador_mb or 0.0, navegador)
+            self._parar.wait(self.intervalo)
+
+    def __enter__(self) -> "AmostradorMemoria":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._parar.set()
+        self._thread.join()
+
+
+def medir_extracao(nome: str, url: str, limit: Optional[int] = None, **opcoes) -> dict:
+    """
+    Executa uma extração do Google Maps medindo vazão, latência e memória.
+
+    Args:
+        nome: Nome do cenário
+        url: URL da busca
+        limit: Limite de leads a extrair
+        **opcoes: Opções repassadas ao GoogleMapsExtractor (ex: har_path)
+
+    Returns:
+        Dicionário com as métricas medidas
+    """
+    inicio = time.perf_counter()
+    primeiro_lead: List[float] = []
+    on_lead = opcoes.pop("on_lead", None)
+
+    def registrar_lead(lead):
+        if not primeiro_lead:
+            primeiro_lead.append(time.perf_counter() - inicio)
+        if on_lead:
+            on_lead(lead)
+
+    # Estatísticas de seletores só em memória: o markup falso não deve afetar as do usuário
+    opcoes.setdefault("seletores_path", None)
+    # Configuração fixa (balanced): o .env da máquina não deve distorcer a comparação com o baseline
+    opcoes.setdefault("config", Configuracao())
+
+    # URLs locais não passam por ExtractorFactory.pode_extrair, então instancia direto
+    extractor = GoogleMapsExtractor(url, limit=limit, on_lead=registrar_lead, **opcoes)
+
+    with AmostradorMemoria() as amostrador:
+        leads = extractor.extract()
+    duracao = time.perf_counter() - inicio
+
+    return {
+        "cenario": nome,
+        "leads": len(leads),
+        "duracao_s": round(duracao, 3),
+        "leads_por_segundo": round(len(leads) / duracao, 3) if duracao else 0.0,
+        "tempo_primeiro_lead_s": round(primeiro_lead[0], 3) if primeiro_lead else None,
+        "pico_rss_mb": round(amostrador.pico_rss_mb, 1) if amostrador.pico_rss_mb else None,
+        "pico_navegador_mb": round(amostrador.pico_navegador_mb, 1) if amostrador.pico_navegador_mb else None,
+    }
+
+
+def executar_cenario(nome: str, resultados: int, latencia_ms: int, limit: Optional[int]) -> dict:
+    """
+    Executa um cenário de benchmark contra o servidor falso.
+
+    Args:
+        nome: Nome do cenário
+        resultados: Quantidade de estabelecimentos no feed
+        latencia_ms: Latência artificial por requisição
+        limit: Limite de leads a extrair
+
+    Returns:
+        Dicionário com as métricas medidas
+    """
+    with ServidorMapsFalso(total_resultados=resultados, latencia_ms=latencia_ms) as servidor:
+        return medir_extracao(nome, servidor.url_busca(), limit=limit)
+
+
+def comparar_com_baseline(atual: dict, baseline: dict, limiar: float) -> List[str]:
+    """
+    Compara as métricas de um cenário com o baseline registrado.
+
+    Args:
+        atual: Métricas medidas agora
+        baseline: Métricas registradas no baseline
+        limiar: Piora relativa tolerada (ex: 0.2 = 20%)
+
+    Returns:
+        Lista de descrições das regressões encontradas (vazia se nenhuma)
+    """
+    regressoes = []
+    for metrica, maior_melhor in METRICAS.items():
+        valor = atual.get(metrica)
+        referencia = baseline.get(metrica)
+        if valor is None or not referencia:
+            continue
+
+        variacao = (valor - referencia) / referencia
+        piora = -variacao if maior_melhor else variacao
+        if piora > limiar:
+            regressoes.append(
+                f"{atual['cenario']}: {metrica} {referencia} → {valor} "
+                f"({piora:+.0%} pior, limiar {limiar:.0%})"
+            )
+    return regressoes
+
+
+def carregar_baseline(caminho: Path) -> dict:
+    """Carrega o arquivo de baseline (vazio se não existir)."""
+    if not caminho.exists():
+        return {}
+    return json.loads(caminho.read_text(encoding="utf-8")).get("cenarios", {})
+
+
+def salvar_baseline(caminho: Path, resultados: List[dict]) -> None:
+    """Grava os resultados como novo baseline."""
+    dados = {
+        "ambiente": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+        },
+        "cenarios": {r["cenario"]: r for r in resultados},
+    }
+    caminho.write_text(json.dumps(dados, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+@app.command()
+def main(
+    cenario: Optional[List[str]] = typer.Option(
+        None, "--cenario", "-c", help="Cenário a executar (pode repetir; padrão: todos)"
+    ),
+    baseline: Path = typer.Option(BASELINE_PADRAO, "--baseline", help="Arquivo JSON de baseline"),
+    atualizar_baseline: bool = typer.Option(
+        False, "--atualizar-baseline", help="Grava os resultados como novo baseline"
+    ),
+    limiar: float = typer.Option(0.2, "--limiar", help="Piora relativa tolerada antes de falhar"),
+    replay_har: Optional[Path] = typer.Option(
+        None, "--replay-har", help="Arquivo HAR gravado com 'extract --record' (cenário 'replay')"
+    ),
+    replay_url: Optional[str] = typer.Option(None, "--replay-url", help="URL da busca gravada no HAR"),
+    replay_limit: Optional[int] = typer.Option(None, "--replay-limit", help="Limite de leads no cenário 'replay'"),
+):
+    """Executa os benchmarks e falha se houver regressão acima do limiar."""
+    if bool(replay_har) != bool(replay_url):
+        console.print("[bold red]Use --replay-har junto com --replay-url.[/bold red]")
+        raise typer.Exit(code=2)
+
+    nomes = cenario or ([] if replay_har else list(CENARIOS))
+    desconhecidos = [n for n in nomes if n not in CENARIOS]
+    if desconhecidos:
+        console.print(f"[bold red]Cenário(s) desconhecido(s):[/bold red] {', '.join(desconhecidos)}")
+        raise typer.Exit(code=2)
+
+    resultados = []
+    for nome in nomes:
+        console.print(f"[dim]Executando {nome}...[/dim]")
+        resultados.append(executar_cenario(nome, **CENARIOS[nome]))
+
+    if replay_har:
+        console.print("[dim]Executando replay...[/dim]")
+        resultados.append(medir_extracao(
+            "replay", replay_url, limit=replay_limit, har_path=str(replay_har), har_modo="reproduzir"
+        ))
+
+    table = Table(show_header=True, header_style="bold magenta")
+    for coluna in ["cenario", "leads", "duracao_s", *METRICAS]:
+        table.add_column(coluna)
+    for r in resultados:
+        table.add_row(*(str(r.get(c)) for c in ["cenario", "leads", "duracao_s", *METRICAS]))
+    console.print(table)
+
+    if atualizar_baseline:
+        salvar_baseline(baseline, resultados)
+        console.print(f"\n[green]✓[/green] Baseline salvo em: [bold]{baseline}[/bold]\n")
+        return
+
+    referencias = carregar_baseline(baseline)
+    if not referencias:
+        console.print("\n[yellow]Nenhum baseline encontrado. Use --atualizar-baseline para registrar.[/yellow]\n")
+        return
+
+    regressoes = []
+    for r in resultados:
+        if r["cenario"] in referencias:
+            regressoes.extend(comparar_com_baseline(r, referencias[r["cenario"]], limiar))
+
+    if regressoes:
+        console.print("\n[bold red]Regressões de desempenho:[/bold red]")
+        for regressao in regressoes:
+            console.print(f"  ✗ {regressao}")
+        console.print()
+        raise typer.Exit(code=1)
+
+    console.print("\n[green]✓[/green] Nenhuma regressão acima do limiar.\n")
+
+
+if __name__ == "__main__":
+    app()
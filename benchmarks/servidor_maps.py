@@ -0,0 +1,247 @@
+"""Servidor HTTP local que imita as páginas de busca e de estabelecimento do Google Maps."""
+
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, unquote_plus, urlparse
+
+
+PAGINA_BUSCA = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head><meta charset="utf-8"><title>{termo} - Google Maps</title>
+<style>
+  body {{ margin: 0; display: flex; font-family: sans-serif; }}
+  div[role="feed"] {{ width: 420px; height: 900px; overflow-y: auto; }}
+  div[role="feed"] a {{ display: block; height: 120px; border-bottom: 1px solid #ddd; }}
+  #painel {{ flex: 1; padding: 16px; }}
+</style>
+</head>
+<body>
+<div role="feed" aria-label="Resultados para {termo}">{itens}</div>
+<div id="painel" role="main"></div>
+<script>
+  const feed = document.querySelector('div[role="feed"]');
+  const painel = document.getElementById('painel');
+  let offset = {carregados};
+  let carregando = false;
+  let fim = {fim};
+
+  feed.addEventListener('scroll', async () => {{
+    if (fim || carregando) return;
+    if (feed.scrollTop + feed.clientHeight < feed.scrollHeight - 10) return;
+    carregando = true;
+    const resp = await fetch('/api/feed?q={termo_url}&offset=' + offset);
+    const dados = await resp.json();
+    feed.insertAdjacentHTML('beforeend', dados.html);
+    offset += dados.quantidade;
+    fim = dados.fim;
+    carregando = false;
+  }});
+
+  feed.addEventListener('click', async (evento) => {{
+    const link = evento.target.closest('a[href*="/maps/place/"]');
+    if (!link) return;
+    evento.preventDefault();
+    const resp = await fetch(link.getAttribute('href') + '?painel=1');
+    painel.innerHTML = await resp.text();
+  }});
+</script>
+</body>
+</html>
+"""
+
+PAGINA_ESTABELECIMENTO = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head><meta charset="utf-8"><title>{nome} - Google Maps</title></head>
+<body><div id="painel" role="main">{painel}</div></body>
+</html>
+"""
+
+
+class ServidorMapsFalso:
+    """
+    Servidor local que gera feeds de busca e painéis de estabelecimentos sintéticos.
+
+    A marcação imita o que o GoogleMapsExtractor usa: o feed
+    `div[role="feed"]` com rolagem infinita, links `/maps/place/`,
+    o título `h1.DUwDvf` e os botões com `data-item-id`.
+    """
+
+    def __init__(
+        self,
+        total_resultados: int = 60,
+        latencia_ms: int = 0,
+        tamanho_lote: int = 20,
+        host: str = "127.0.0.1",
+        porta: int = 0
+    ):
+        """
+        Inicializa o servidor (sem iniciá-lo).
+
+        Args:
+            total_resultados: Quantidade de estabelecimentos na busca
+            latencia_ms: Latência artificial aplicada a cada requisição
+            tamanho_lote: Quantidade de resultados carregados por rolagem
+            host: Endereço de escuta
+            porta: Porta de escuta (0 = escolhe uma porta livre)
+        """
+        self.total_resultados = total_resultados
+        self.latencia_ms = latencia_ms
+        self.tamanho_lote = tamanho_lote
+        self._httpd = ThreadingHTTPServer((host, porta), self._criar_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Retorna a URL base do servidor."""
+        host, porta = self._httpd.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    def url_busca(self, termo: str = "advogados sobral") -> str:
+        """Retorna a URL de uma página de busca."""
+        return f"{self.base_url}/maps/search/{quote_plus(termo)}"
+
+    def url_estabelecimento(self, indice: int) -> str:
+        """Retorna a URL da página de um estabelecimento."""
+        return f"{self.base_url}{self._caminho_estabelecimento(indice)}"
+
+    def iniciar(self) -> "ServidorMapsFalso":
+        """Inicia o servidor em uma thread em segundo plano."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def parar(self) -> None:
+        """Encerra o servidor."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "ServidorMapsFalso":
+        return self.iniciar()
+
+    def __exit__(self, *args) -> None:
+        self.parar()
+
+    # Geração de dados sintéticos
+
+    @staticmethod
+    def nome_estabelecimento(indice: int) -> str:
+        """Nome sintético do estabelecimento de índice informado."""
+        return f"Estabelecimento Teste {indice:04d}"
+
+    @staticmethod
+    def telefone_estabelecimento(indice: int) -> str | None:
+        """Telefone sintético (1 a cada 10 estabelecimentos não tem telefone)."""
+        if indice % 10 == 9:
+            return None
+        return f"0885550{indice:04d}"
+
+    @staticmethod
+    def website_estabelecimento(indice: int) -> str | None:
+        """Website sintético (3 a cada 10 estabelecimentos não têm website)."""
+        if indice % 10 < 3:
+            return None
+        return f"https://estabelecimento-{indice:04d}.example.org/"
+
+    def _caminho_estabelecimento(self, indice: int) -> str:
+        nome = quote_plus(self.nome_estabelecimento(indice))
+        return f"/maps/place/{nome}/data=!4m2!3m1!1s0x0:0x{indice:x}"
+
+    def _html_item_feed(self, indice: int) -> str:
+        nome = html.escape(self.nome_estabelecimento(indice))
+        href = html.escape(self.url_estabelecimento(indice))
+        return (
+            f'<a class="hfpxzc" href="{href}" aria-label="{nome}">'
+            f'<div class="qBF1Pd fontHeadlineSmall">{nome}</div></a>'
+        )
+
+    def _html_lote(self, offset: int) -> tuple[str, int, bool]:
+        fim_lote = min(offset + self.tamanho_lote, self.total_resultados)
+        itens = "".join(self._html_item_feed(i) for i in range(offset, fim_lote))
+        return itens, fim_lote - offset, fim_lote >= self.total_resultados
+
+    def _html_painel(self, indice: int) -> str:
+        nome = html.escape(self.nome_estabelecimento(indice))
+        partes = [f'<h1 class="DUwDvf lfPIob">{nome}</h1>']
+
+        telefone = self.telefone_estabelecimento(indice)
+        if telefone:
+            partes.append(
+                f'<button class="CsEnBe" data-item-id="phone:tel:{telefone}" '
+                f'aria-label="Telefone: {telefone}">{telefone}</button>'
+            )
+
+        website = self.website_estabelecimento(indice)
+        if website:
+            partes.append(
+                f'<a class="CsEnBe" data-item-id="authority" href="{html.escape(website)}" '
+                f'aria-label="Website: {html.escape(website)}">Website</a>'
+            )
+
+        return "\n".join(partes)
+
+    def _indice_do_caminho(self, caminho: str) -> int | None:
+        try:
+            return int(caminho.rsplit(":0x", 1)[1], 16)
+        except (IndexError, ValueError):
+            return None
+
+    def _criar_handler(self):
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _responder(self, corpo: str, tipo: str = "text/html", status: int = 200):
+                dados = corpo.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", f"{tipo}; charset=utf-8")
+                self.send_header("Content-Length", str(len(dados)))
+                self.end_headers()
+                self.wfile.write(dados)
+
+            def do_GET(self):
+                if servidor.latencia_ms:
+                    time.sleep(servidor.latencia_ms / 1000)
+
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+
+                if url.path.startswith("/maps/search/"):
+                    termo = unquote_plus(url.path[len("/maps/search/"):])
+                    itens, quantidade, fim = servidor._html_lote(0)
+                    self._responder(PAGINA_BUSCA.format(
+                        termo=html.escape(termo),
+                        termo_url=quote_plus(termo),
+                        itens=itens,
+                        carregados=quantidade,
+                        fim="true" if fim else "false",
+                    ))
+                elif url.path == "/api/feed":
+                    offset = int(params.get("offset", ["0"])[0])
+                    itens, quantidade, fim = servidor._html_lote(offset)
+                    self._responder(
+                        json.dumps({"html": itens, "quantidade": quantidade, "fim": fim}),
+                        tipo="application/json"
+                    )
+                elif url.path.startswith("/maps/place/"):
+                    indice = servidor._indice_do_caminho(url.path)
+                    if indice is None or indice >= servidor.total_resultados:
+                        self._responder("Não encontrado", status=404)
+                        return
+                    painel = servidor._html_painel(indice)
+                    if "painel" in params:
+                        self._responder(painel)
+                    else:
+                        nome = html.escape(servidor.nome_estabelecimento(indice))
+                        self._responder(PAGINA_ESTABELECIMENTO.format(nome=nome, painel=painel))
+                else:
+                    self._responder("Não encontrado", status=404)
+
+        return Handler
@@ -1,14 +1,20 @@
 """Interface CLI para extração de leads."""
 
 import typer
-from typing import Optional
+from contextlib import nullcontext
+from datetime import datetime
+from typing import List, Optional
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from pathlib import Path
 
+from extrator_leads.core.config import PRESETS, Configuracao, carregar_configuracao
 from extrator_leads.core.extractor_factory import ExtractorFactory
 from extrator_leads.core.csv_exporter import CSVExporter
+from extrator_leads.core.profiler import ProfilerExtracao
+from extrator_leads.painel import PainelExtracao, tabela_leads
 
 app = typer.Typer(
     name="extrator",
@@ -18,8 +24,67 @@ app = typer.Typer(
 console = Console()
 
 
+@app.callback()
+def main(
+    ctx: typer.Context,
+    preset: Optional[str] = typer.Option(
+        None,
+        "--preset",
+        help=f"Preset de desempenho: {', '.join(PRESETS)} (padrão: EXTRATOR_PRESET ou balanced)"
+    ),
+    env_file: str = typer.Option(".env", "--env-file", help="Arquivo .env com as configurações"),
+    setting: Optional[List[str]] = typer.Option(
+        None,
+        "--set",
+        help="Sobrescreve um campo da configuração, no formato campo=valor (pode repetir)"
+    )
+):
+    """
+    Ferramenta CLI para extração de leads de múltiplas plataformas.
+    """
+    sobrescritas = {}
+    for item in setting or []:
+        campo, separador, valor = item.partition("=")
+        if not separador:
+            console.print(f"[bold red]Erro:[/bold red] Use --set campo=valor (recebido: {item})\n")
+            raise typer.Exit(code=1)
+        sobrescritas[campo.strip()] = valor.strip()
+
+    try:
+        ctx.obj = carregar_configuracao(preset=preset, env_file=env_file, sobrescritas=sobrescritas)
+    except ValueError as e:
+        console.print(f"[bold red]Erro na configuração:[/bold red] {str(e)}\n")
+        raise typer.Exit(code=1)
+
+
+def _ler_paginas_facebook(url: str, caminho: Path) -> List[str]:
+    """Lê as URLs de --urls-file (uma por linha, '#' comenta), todas do Facebook."""
+    from extrator_leads.extractors.facebook import FacebookExtractor
+
+    try:
+        linhas = caminho.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        console.print(f"[bold red]Erro:[/bold red] Não foi possível ler {caminho}: {str(e)}\n")
+        raise typer.Exit(code=1)
+
+    paginas = [linha.strip() for linha in linhas if linha.strip() and not linha.strip().startswith("#")]
+    invalidas = [pagina for pagina in [url] + paginas if not FacebookExtractor.pode_extrair(pagina)]
+    if invalidas:
+        console.print(
+            f"[bold red]Erro:[/bold red] --urls-file só aceita páginas do Facebook: {escape(invalidas[0])}\n"
+        )
+        raise typer.Exit(code=1)
+    return paginas
+
+
+def _configuracao(ctx: typer.Context) -> Configuracao:
+    """Configuração montada pelo callback principal."""
+    return ctx.obj if isinstance(ctx.obj, Configuracao) else carregar_configuracao()
+
+
 @app.command()
 def extract(
+    ctx: typer.Context,
     url: str = typer.Argument(..., help="URL da página para extrair leads"),
     output: Optional[str] = typer.Option(
         None,
@@ -44,6 +109,101 @@ def extract(
         "--limit",
         "-l",
         help="Número máximo de leads a extrair (padrão: todos os disponíveis)"
+    ),
+    urls_file: Optional[Path] = typer.Option(
+        None,
+        "--urls-file",
+        help="Arquivo com outras páginas do Facebook (uma URL por linha) extraídas no mesmo lote"
+    ),
+    recycle_every: Optional[int] = typer.Option(
+        None,
+        "--recycle-every",
+        help="Recicla o contexto do navegador a cada N estabelecimentos (limita o uso de memória)"
+    ),
+    max_browser_mb: Optional[float] = typer.Option(
+        None,
+        "--max-browser-mb",
+        help="Recicla o contexto do navegador quando seu RSS passar deste valor em MB"
+    ),
+    user_data_dir: Optional[str] = typer.Option(
+        None,
+        "--user-data-dir",
+        help="Perfil persistente do navegador (reaproveita cache e cookies entre execuções)"
+    ),
+    max_profile_mb: Optional[float] = typer.Option(
+        None,
+        "--max-profile-mb",
+        help="Purga os caches do perfil persistente antes da execução se ele passar deste tamanho"
+    ),
+    record: Optional[str] = typer.Option(
+        None,
+        "--record",
+        help="Grava todas as respostas da execução em um arquivo HAR"
+    ),
+    replay: Optional[str] = typer.Option(
+        None,
+        "--replay",
+        help="Reproduz as respostas de um arquivo HAR gravado, sem acessar a rede"
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Captura o perfil Python (cProfile) da extração e salva em output_dir"
+    ),
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help="Grava também um trace do Playwright (implica --profile; abrir com 'playwright show-trace')"
+    ),
+    delta: bool = typer.Option(
+        False,
+        "--delta",
+        help="Grava também um CSV só com os leads novos, alterados e removidos desde a última execução"
+    ),
+    delta_only: bool = typer.Option(
+        False,
+        "--delta-only",
+        help="Grava apenas o CSV delta, sem o CSV completo"
+    ),
+    state: Optional[str] = typer.Option(
+        None,
+        "--state",
+        help="Arquivo de estado usado pelo delta (padrão: <output-dir>/estado_leads.db)"
+    ),
+    compress: Optional[str] = typer.Option(
+        None,
+        "--compress",
+        help="Grava os leads em segmentos comprimidos à medida que são extraídos: gzip ou zstd"
+    ),
+    rotate_rows: Optional[int] = typer.Option(
+        None,
+        "--rotate-rows",
+        help="Fecha o segmento atual a cada N leads (leads_0001.csv.gz, leads_0002.csv.gz, ...)"
+    ),
+    rotate_mb: Optional[float] = typer.Option(
+        None,
+        "--rotate-mb",
+        help="Fecha o segmento atual quando ele passar deste tamanho em MB"
+    ),
+    check_email: bool = typer.Option(
+        False,
+        "--check-email",
+        help="Verifica os registros MX/A do domínio de cada email (coluna email_status)"
+    ),
+    dns_server: Optional[str] = typer.Option(
+        None,
+        "--dns-server",
+        help="Servidor DNS usado por --check-email, no formato host[:porta] ou [IPv6]:porta (padrão: o do sistema)"
+    ),
+    time_budget: Optional[float] = typer.Option(
+        None,
+        "--time-budget",
+        help="Orçamento de tempo em segundos: a extração se ajusta e salva o que tiver antes do fim"
+    ),
+    live: bool = typer.Option(
+        True,
+        "--live/--no-live",
+        help="Painel ao vivo (leads recentes, taxa, erros e ETA) em vez de uma linha por mensagem"
     )
 ):
     """
@@ -54,9 +214,57 @@ def extract(
     """
     console.print(f"\n[bold cyan]Extrator de Leads v0.3.3[/bold cyan]\n")
 
+    if record and replay:
+        console.print("[bold red]Erro:[/bold red] Use --record ou --replay, não ambos.\n")
+        raise typer.Exit(code=1)
+
+    from extrator_leads.core.prazo import Prazo
+
     try:
+        # O prazo começa a contar antes de abrir o navegador
+        prazo = Prazo(time_budget) if time_budget else None
+    except ValueError as e:
+        console.print(f"[bold red]Erro:[/bold red] {str(e)}\n")
+        raise typer.Exit(code=1)
+
+    config = _configuracao(ctx)
+    profiler = ProfilerExtracao(output_dir=output_dir, trace=trace) if profile or trace else None
+
+    escritor = None
+    if compress or rotate_rows or rotate_mb:
+        from extrator_leads.core.segmentos import EscritorSegmentos
+
+        try:
+            escritor = EscritorSegmentos(
+                output_dir=output_dir,
+                prefixo=Path(output).stem if output else f"leads_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                compressao=compress,
+                max_linhas=rotate_rows,
+                max_bytes=int(rotate_mb * 1024 * 1024) if rotate_mb else None,
+                callback=lambda caminho: console.print(f"[green]✓[/green] Segmento finalizado: [bold]{caminho}[/bold]")
+            )
+        except ValueError as e:
+            console.print(f"[bold red]Erro:[/bold red] {str(e)}\n")
+            raise typer.Exit(code=1)
+
+    verificador = None
+    if check_email:
+        from extrator_leads.core.verificacao_email import VerificadorEmails
+
+        from extrator_leads.utils.dns import interpretar_servidor
+
+        try:
+            verificador = VerificadorEmails(servidor=interpretar_servidor(dns_server) if dns_server else None)
+        except ValueError:
+            console.print(f"[bold red]Erro:[/bold red] Servidor DNS inválido: {dns_server}\n")
+            raise typer.Exit(code=1)
+
+    try:
+        # Fora de um terminal (ex: saída redirecionada), mantém as mensagens linha a linha
+        painel = PainelExtracao(console) if live and console.is_terminal else None
+
         # Cria o extractor apropriado
-        with Progress(
+        with painel or Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
@@ -65,10 +273,48 @@ def extract(
 
             def progress_callback(msg: str):
                 """Callback para exibir logs de progresso."""
-                progress.console.print(f"[dim]{msg}[/dim]")
+                if painel:
+                    painel.registrar_mensagem(msg)
+                else:
+                    progress.console.print(f"[dim]{msg}[/dim]")
+
+            # Opções específicas de extractors com navegador só são repassadas se informadas
+            opcoes = {"config": config}
+            if recycle_every:
+                opcoes["reciclar_a_cada"] = recycle_every
+            if max_browser_mb:
+                opcoes["limite_memoria_mb"] = max_browser_mb
+            if user_data_dir:
+                opcoes["user_data_dir"] = user_data_dir
+                _purgar_perfil_se_necessario(user_data_dir, max_profile_mb)
+            if record or replay:
+                opcoes["har_path"] = record or replay
+                opcoes["har_modo"] = "gravar" if record else "reproduzir"
+            if prazo:
+                opcoes["prazo"] = prazo
+            if urls_file:
+                opcoes["paginas"] = _ler_paginas_facebook(url, urls_file)
+            verificacao = None
+            if escritor and verificador:
+                # Segmentos recebem cada lead já verificado, sem que o DNS segure a extração
+                from extrator_leads.core.verificacao_email import VerificacaoEmSegundoPlano
+
+                verificacao = VerificacaoEmSegundoPlano(verificador, escritor.escrever)
+                opcoes["on_lead"] = verificacao.enviar
+            elif escritor:
+                opcoes["on_lead"] = escritor.escrever
+            if painel:
+                opcoes["on_lead"] = _encadear(opcoes.get("on_lead"), painel.registrar_lead)
+                opcoes["on_falha"] = painel.registrar_falha
 
             try:
-                extractor = ExtractorFactory.criar_extractor(url, limit=limit, callback=progress_callback)
+                extractor = ExtractorFactory.criar_extractor(
+                    url,
+                    limit=limit,
+                    callback=progress_callback,
+                    trace_path=str(profiler.caminho_trace) if profiler and profiler.caminho_trace else None,
+                    **opcoes
+                )
             except ValueError as e:
                 console.print(f"\n[bold red]Erro:[/bold red] {str(e)}\n")
                 raise typer.Exit(code=1)
@@ -79,7 +325,9 @@ def extract(
             progress.add_task(description=f"Extraindo dados de {extractor.fonte}...", total=None)
 
             try:
-                leads = extractor.extract()
+                # A verificação termina de entregar os leads antes de o último segmento fechar
+                with escritor or nullcontext(), verificacao or nullcontext(), profiler or nullcontext():
+                    leads = extractor.extract()
             except NotImplementedError as e:
                 console.print(f"\n[bold yellow]Aviso:[/bold yellow] {str(e)}\n")
                 raise typer.Exit(code=1)
@@ -87,6 +335,18 @@ def extract(
                 console.print(f"\n[bold red]Erro na extração:[/bold red] {str(e)}\n")
                 raise typer.Exit(code=1)
 
+            if extractor.falhas:
+                _exibir_falhas(extractor.falhas)
+
+            if verificador and not escritor and leads and prazo and prazo.esgotado:
+                prazo.registrar_pulo("verificação de emails")
+            elif verificador and not escritor and leads:
+                progress.add_task(description="Verificando domínios dos emails...", total=None)
+                verificador.verificar(leads)
+
+            if prazo:
+                _exibir_resumo_prazo(prazo)
+
             if not leads:
                 console.print("\n[bold yellow]Nenhum lead encontrado na URL fornecida.[/bold yellow]\n")
                 raise typer.Exit(code=1)
@@ -102,12 +362,26 @@ def extract(
         # Exporta para CSV
         exporter = CSVExporter(output_dir=output_dir)
 
-        try:
-            caminho = exporter.exportar(leads, filename=output, append=append)
-            console.print(f"\n[green]✓[/green] {len(leads)} lead(s) salvo(s) em: [bold]{caminho}[/bold]\n")
-        except Exception as e:
-            console.print(f"\n[bold red]Erro ao salvar CSV:[/bold red] {str(e)}\n")
-            raise typer.Exit(code=1)
+        if escritor:
+            console.print(
+                f"\n[green]✓[/green] {escritor.total} lead(s) salvo(s) em {len(escritor.segmentos)} segmento(s) "
+                f"em: [bold]{output_dir}[/bold]\n"
+            )
+        elif not delta_only:
+            try:
+                caminho = exporter.exportar(leads, filename=output, append=append)
+                console.print(f"\n[green]✓[/green] {len(leads)} lead(s) salvo(s) em: [bold]{caminho}[/bold]\n")
+            except Exception as e:
+                console.print(f"\n[bold red]Erro ao salvar CSV:[/bold red] {str(e)}\n")
+                raise typer.Exit(code=1)
+
+        if delta or delta_only:
+            # Execuções parciais não devem marcar como removidos os leads não vistos
+            completo = limit is None and not extractor.falhas and not (prazo and prazo.pulos)
+            _exportar_delta(url, leads, exporter, output, state, completo)
+
+        if profiler:
+            _exibir_resumo_profile(profiler)
 
     except typer.Exit:
         raise
@@ -119,6 +393,86 @@ def extract(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def expand(
+    ctx: typer.Context,
+    keyword: Optional[List[str]] = typer.Option(None, "--keyword", "-k", help="Termo de busca (pode repetir)"),
+    location: Optional[List[str]] = typer.Option(None, "--location", "-L", help="Localidade (pode repetir)"),
+    keywords_file: Optional[Path] = typer.Option(None, "--keywords-file", help="Arquivo com um termo por linha"),
+    locations_file: Optional[Path] = typer.Option(None, "--locations-file", help="Arquivo com uma localidade por linha"),
+    pairs_csv: Optional[Path] = typer.Option(
+        None, "--csv", help="CSV com as colunas 'termo' e 'local' (pares explícitos em vez de combinações)"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Navegadores simultâneos (padrão: o do preset)"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Máximo de lugares por busca"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Nome do arquivo CSV de saída"),
+    output_dir: str = typer.Option("data", "--output-dir", "-d", help="Diretório onde o CSV será salvo")
+):
+    """
+    Busca cada termo em cada localidade no Google Maps e extrai os lugares sem repetição.
+
+    Exemplo:
+        extrator expand -k advogados -k contadores -L "Sobral CE" -L "Fortaleza CE"
+    """
+    from extrator_leads.core.expansao import ExpansorBuscas, gerar_urls_busca, ler_pares_csv
+
+    def _ler_linhas(arquivo: Optional[Path]) -> List[str]:
+        if not arquivo:
+            return []
+        return [linha.strip() for linha in arquivo.read_text(encoding="utf-8").splitlines() if linha.strip()]
+
+    try:
+        urls = ler_pares_csv(str(pairs_csv)) if pairs_csv else []
+    except (OSError, ValueError) as e:
+        console.print(f"\n[bold red]Erro:[/bold red] {str(e)}\n")
+        raise typer.Exit(code=1)
+
+    termos = (keyword or []) + _ler_linhas(keywords_file)
+    locais = (location or []) + _ler_linhas(locations_file)
+    if termos or locais:
+        if not (termos and locais):
+            console.print("\n[bold red]Erro:[/bold red] Informe pelo menos um termo e uma localidade.\n")
+            raise typer.Exit(code=1)
+        urls += [url for url in gerar_urls_busca(termos, locais) if url not in urls]
+
+    if not urls:
+        console.print("\n[bold red]Erro:[/bold red] Informe termos e localidades (ou --csv).\n")
+        raise typer.Exit(code=1)
+
+    config = _configuracao(ctx)
+    workers = workers or config.workers
+    console.print(f"\n[bold cyan]Expandindo {len(urls)} busca(s) com {workers} navegador(es)[/bold cyan]\n")
+
+    try:
+        resultado = ExpansorBuscas(
+            urls,
+            workers=workers,
+            limit=limit,
+            headless=config.headless,
+            callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+            opcoes_extractor={"config": config}
+        ).executar()
+    except (RuntimeError, ValueError) as e:
+        console.print(f"\n[bold red]Erro:[/bold red] {str(e)}\n")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"\n[green]✓[/green] {resultado.encontrados} resultado(s) em {resultado.buscas} busca(s), "
+        f"{resultado.unicos} lugar(es) único(s), {len(resultado.leads)} lead(s) extraído(s)\n"
+    )
+    if resultado.falhas:
+        _exibir_falhas(resultado.falhas)
+
+    if not resultado.leads:
+        console.print("[bold yellow]Nenhum lead encontrado.[/bold yellow]\n")
+        raise typer.Exit(code=1)
+
+    caminho = CSVExporter(output_dir=output_dir).exportar(resultado.leads, filename=output)
+    console.print(f"[green]✓[/green] {len(resultado.leads)} lead(s) salvo(s) em: [bold]{caminho}[/bold]\n")
+
+
 @app.command()
 def list_files(
     output_dir: str = typer.Option(
@@ -126,15 +480,20 @@ def list_files(
         "--output-dir",
         "-d",
         help="Diretório para listar arquivos"
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Registra no manifesto os CSVs criados ou alterados por fora do extrator"
     )
 ):
     """
-    Lista todos os arquivos CSV gerados.
+    Lista todos os arquivos CSV gerados, com os metadados do manifesto.
     """
     console.print(f"\n[bold cyan]Arquivos CSV em {output_dir}/[/bold cyan]\n")
 
     exporter = CSVExporter(output_dir=output_dir)
-    arquivos = exporter.listar_arquivos()
+    arquivos = exporter.manifesto.catalogo(atualizar=refresh)
 
     if not arquivos:
         console.print("[yellow]Nenhum arquivo CSV encontrado.[/yellow]\n")
@@ -143,14 +502,448 @@ def list_files(
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("#", style="dim", width=6)
     table.add_column("Arquivo")
+    table.add_column("Leads", justify="right")
+    table.add_column("Tamanho", justify="right")
+    table.add_column("Fontes")
+    table.add_column("Período", style="dim")
+
+    sem_metadados = 0
+    for idx, entrada in enumerate(arquivos, 1):
+        if "linhas" not in entrada:
+            sem_metadados += 1
+            table.add_row(str(idx), entrada["arquivo"], "-", "-", "-", "-")
+            continue
+
+        fontes = ", ".join(f"{fonte} ({n})" for fonte, n in entrada["fontes"].items())
+        periodo = entrada["criado_em"].replace("T", " ")
+        if entrada["atualizado_em"] != entrada["criado_em"]:
+            periodo += f" → {entrada['atualizado_em'].replace('T', ' ')}"
+        table.add_row(
+            str(idx),
+            entrada["arquivo"],
+            str(entrada["linhas"]),
+            f"{entrada['bytes'] / 1024:.1f} KB",
+            fontes,
+            periodo
+        )
+
+    console.print(table)
+    if sem_metadados:
+        console.print(f"\n[dim]{sem_metadados} arquivo(s) fora do manifesto; use --refresh para registrá-los.[/dim]")
+    console.print()
+
+
+@app.command()
+def query(
+    fonte: Optional[str] = typer.Option(None, "--fonte", "-f", help="Fonte dos leads (ex: google_maps)"),
+    com: Optional[List[str]] = typer.Option(
+        None, "--has", help="Campo que deve estar preenchido: telefone, email, website ou place_id (pode repetir)"
+    ),
+    sem: Optional[List[str]] = typer.Option(
+        None, "--missing", help="Campo que deve estar vazio (pode repetir)"
+    ),
+    nome: Optional[str] = typer.Option(None, "--name", help="Trecho do nome"),
+    dominio: Optional[str] = typer.Option(None, "--domain", help="Trecho do domínio do website"),
+    desde: Optional[datetime] = typer.Option(None, "--since", help="Exportados a partir de (AAAA-MM-DD)"),
+    ate: Optional[datetime] = typer.Option(None, "--until", help="Exportados até (AAAA-MM-DD)"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Número máximo de resultados"),
+    formato: str = typer.Option("csv", "--format", help="Formato da saída: csv ou json (uma linha por lead)"),
+    output_dir: str = typer.Option("data", "--output-dir", "-d", help="Diretório dos CSVs"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Reconstrói o índice antes de consultar")
+):
+    """
+    Consulta os leads de todas as exportações usando o índice SQLite.
+
+    Exemplo (com telefone e sem website, do Google Maps):
+        extrator query --fonte google_maps --has telefone --missing website
+    """
+    import csv
+    import json
+    import sys
+    from extrator_leads.core.indice import IndiceLeads
+
+    if formato not in ("csv", "json"):
+        console.print(f"[bold red]Formato inválido:[/bold red] {formato} (use csv ou json)")
+        raise typer.Exit(code=2)
+
+    indice = IndiceLeads(output_dir)
+    # O índice é atualizado a cada exportação; a sincronização só pega o que mudou por fora
+    if rebuild:
+        indice.reconstruir()
+    else:
+        indice.sincronizar()
+
+    # Se o ate não tiver hora, inclui o dia inteiro
+    if ate and ate.time() == datetime.min.time():
+        ate = ate.replace(hour=23, minute=59, second=59)
+
+    try:
+        resultados = indice.consultar(
+            fonte=fonte, com=com or [], sem=sem or [], nome=nome, dominio=dominio, desde=desde, ate=ate, limite=limit
+        )
+        escritor = None
+        for dados in resultados:
+            if formato == "json":
+                sys.stdout.write(json.dumps(dados, ensure_ascii=False) + "\n")
+                continue
+            if escritor is None:
+                escritor = csv.DictWriter(sys.stdout, fieldnames=list(dados))
+                escritor.writeheader()
+            escritor.writerow(dados)
+    except ValueError as e:
+        console.print(f"[bold red]Erro:[/bold red] {str(e)}")
+        raise typer.Exit(code=2)
+    except BrokenPipeError:
+        # Saída redirecionada para um comando que encerrou antes (ex: head)
+        pass
+
+
+@app.command()
+def merge(
+    arquivos: Optional[List[str]] = typer.Argument(
+        None,
+        help="CSVs a consolidar (padrão: todos do diretório, do mais recente ao mais antigo)"
+    ),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Nome do arquivo consolidado"),
+    output_dir: str = typer.Option("data", "--output-dir", "-d", help="Diretório dos CSVs"),
+    chunk_size: int = typer.Option(50000, "--chunk-size", help="Linhas lidas por vez de cada arquivo")
+):
+    """
+    Consolida os CSVs exportados em um único arquivo, sem leads duplicados.
+
+    Leads são considerados iguais se tiverem o mesmo telefone, o mesmo domínio
+    de website ou o mesmo nome na mesma fonte; vence o primeiro arquivo da lista.
+    """
+    from extrator_leads.core.merger import MescladorLeads
+
+    exporter = CSVExporter(output_dir=output_dir)
+    if arquivos:
+        caminhos = [a if Path(a).exists() else exporter.obter_caminho_completo(a) for a in arquivos]
+    else:
+        caminhos = [exporter.obter_caminho_completo(a) for a in exporter.listar_arquivos()]
+
+    inexistentes = [c for c in caminhos if not Path(c).exists()]
+    if inexistentes:
+        console.print(f"\n[bold red]Arquivo(s) não encontrado(s):[/bold red] {', '.join(inexistentes)}\n")
+        raise typer.Exit(code=1)
+    if not caminhos:
+        console.print("\n[yellow]Nenhum arquivo CSV encontrado.[/yellow]\n")
+        raise typer.Exit(code=1)
+
+    nome = output or f"consolidado_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    if not nome.endswith(".csv"):
+        nome += ".csv"
+    destino = exporter.obter_caminho_completo(nome)
+
+    with console.status("[cyan]Consolidando...[/cyan]") as status:
+        resumo = MescladorLeads(tamanho_bloco=chunk_size).mesclar(
+            caminhos,
+            destino,
+            callback=lambda msg: status.update(f"[cyan]{msg}[/cyan]")
+        )
+        exporter.manifesto.registrar_arquivo(destino)
+
+    console.print(
+        f"\n[green]✓[/green] {resumo.gravados} lead(s) únicos de {resumo.lidos} linha(s) "
+        f"em {resumo.arquivos} arquivo(s) salvos em: [bold]{resumo.caminho}[/bold]"
+    )
+    console.print(f"[dim]{resumo.duplicados} duplicado(s) e {resumo.invalidos} inválido(s) descartados.[/dim]")
+    if resumo.ignorados:
+        console.print(f"[dim]Ignorado(s), por não serem listas de leads: {', '.join(resumo.ignorados)}[/dim]")
+    console.print()
+
+
+@app.command()
+def serve(
+    ctx: typer.Context,
+    host: str = typer.Option("127.0.0.1", "--host", help="Endereço de escuta da API"),
+    port: int = typer.Option(8000, "--port", "-p", help="Porta da API"),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Quantidade de navegadores aquecidos (padrão: o do preset)"
+    )
+):
+    """
+    Inicia um serviço HTTP local que executa jobs de extração em navegadores aquecidos.
+
+    Exemplo:
+        extrator serve --port 8000 --workers 4
+    """
+    from extrator_leads.service.api import ServidorExtracao
+    from extrator_leads.service.jobs import PoolNavegadores
+
+    console.print(f"\n[bold cyan]Extrator de Leads v0.3.3 - Serviço[/bold cyan]\n")
+
+    config = _configuracao(ctx)
+    workers = workers or config.workers
+    pool = PoolNavegadores(workers=workers, headless=config.headless, config=config)
+    with console.status(f"Iniciando {workers} navegador(es)..."):
+        try:
+            pool.iniciar()
+        except RuntimeError as e:
+            console.print(f"\n[bold red]Erro:[/bold red] {str(e)}\n")
+            raise typer.Exit(code=1)
+
+    servidor = ServidorExtracao((host, port), pool)
+    console.print(f"[green]✓[/green] {workers} navegador(es) pronto(s)")
+    console.print(f"[green]✓[/green] API disponível em [bold]http://{host}:{port}/jobs[/bold]\n")
+    console.print("[dim]Pressione Ctrl+C para encerrar.[/dim]\n")
+
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Encerrando serviço...[/yellow]\n")
+    finally:
+        servidor.server_close()
+        pool.encerrar()
+
+
+@app.command()
+def enqueue(
+    urls: Optional[list[str]] = typer.Argument(None, help="URLs de busca ou de estabelecimento"),
+    queue: str = typer.Option("data/fila.db", "--queue", "-q", help="Arquivo SQLite da fila"),
+    arquivo: Optional[Path] = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Arquivo texto com uma URL por linha"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Número máximo de leads por URL")
+):
+    """
+    Adiciona URLs à fila de trabalho compartilhada.
+
+    Exemplo:
+        extrator enqueue "https://www.google.com/maps/search/advogados+sobral" -q /mnt/compartilhado/fila.db
+    """
+    from extrator_leads.fila.sqlite import FilaSQLite
+
+    todas = list(urls or [])
+    if arquivo:
+        todas.extend(l.strip() for l in arquivo.read_text(encoding="utf-8").splitlines() if l.strip())
+
+    if not todas:
+        console.print("\n[bold red]Erro:[/bold red] Informe URLs ou --file\n")
+        raise typer.Exit(code=1)
+
+    fila = FilaSQLite(queue)
+    adicionadas = 0
+    for url in todas:
+        try:
+            ExtractorFactory.criar_extractor(url)
+        except ValueError:
+            console.print(f"[yellow]⚠[/yellow] URL não suportada, ignorada: {url}")
+            continue
+        adicionadas += fila.enfileirar(url, limit=limit)
+
+    console.print(f"\n[green]✓[/green] {adicionadas} URL(s) adicionada(s) à fila [bold]{queue}[/bold]")
+    if adicionadas < len(todas):
+        console.print(f"[dim]{len(todas) - adicionadas} URL(s) ignorada(s) (duplicadas ou não suportadas)[/dim]")
+    console.print()
+
+
+@app.command()
+def worker(
+    ctx: typer.Context,
+    queue: str = typer.Option("data/fila.db", "--queue", "-q", help="Arquivo SQLite da fila"),
+    sink: str = typer.Option("data/leads.db", "--sink", "-s", help="Arquivo SQLite onde os leads são gravados"),
+    visibility: float = typer.Option(
+        600.0,
+        "--visibility",
+        help="Timeout de visibilidade do arrendamento em segundos"
+    ),
+    max_items: Optional[int] = typer.Option(None, "--max-items", help="Número máximo de itens a processar"),
+    exit_when_empty: bool = typer.Option(
+        False,
+        "--exit-when-empty",
+        help="Encerra quando a fila não tiver itens disponíveis"
+    ),
+    user_data_dir: Optional[str] = typer.Option(
+        None,
+        "--user-data-dir",
+        help="Perfil persistente do navegador (workers concorrentes usam cópias isoladas)"
+    )
+):
+    """
+    Processa itens da fila de trabalho (pode rodar em vários nós ao mesmo tempo).
+
+    Exemplo:
+        extrator worker -q /mnt/compartilhado/fila.db -s /mnt/compartilhado/leads.db
+    """
+    from extrator_leads.fila.sqlite import DestinoSQLite, FilaSQLite
+    from extrator_leads.fila.worker import WorkerFila
+
+    console.print(f"\n[bold cyan]Extrator de Leads v0.3.3 - Worker[/bold cyan]\n")
+
+    worker_fila = WorkerFila(
+        FilaSQLite(queue),
+        DestinoSQLite(sink),
+        visibilidade=visibility,
+        callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+        opcoes_extractor={"config": _configuracao(ctx), **({"user_data_dir": user_data_dir} if user_data_dir else {})}
+    )
+
+    try:
+        processados = worker_fila.executar(max_itens=max_items, parar_quando_vazia=exit_when_empty)
+    except KeyboardInterrupt:
+        console.print("\n\n[yellow]Worker interrompido. Itens em andamento serão arrendados novamente.[/yellow]\n")
+        raise typer.Exit(code=130)
+
+    console.print(f"\n[green]✓[/green] {processados} item(ns) processado(s)\n")
+
+
+@app.command()
+def queue_status(
+    queue: str = typer.Option("data/fila.db", "--queue", "-q", help="Arquivo SQLite da fila")
+):
+    """
+    Exibe a situação da fila de trabalho.
+    """
+    from extrator_leads.fila.sqlite import FilaSQLite
+
+    fila = FilaSQLite(queue)
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Status", style="cyan")
+    table.add_column("Itens", justify="right")
+    for status, total in fila.estatisticas().items():
+        table.add_row(status, str(total))
+
+    console.print(f"\n[bold cyan]Fila {queue}[/bold cyan]\n")
+    console.print(table)
+
+    for falha in fila.falhas():
+        console.print(f"[red]✗[/red] {falha['url']} ({falha['tentativas']}x): {falha['erro']}")
+    console.print()
+
+
+@app.command()
+def queue_export(
+    sink: str = typer.Option("data/leads.db", "--sink", "-s", help="Arquivo SQLite com os leads"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Nome do arquivo CSV de saída"),
+    output_dir: str = typer.Option("data", "--output-dir", "-d", help="Diretório onde o CSV será salvo")
+):
+    """
+    Exporta para CSV os leads gravados pelos workers.
+    """
+    from extrator_leads.fila.sqlite import DestinoSQLite
+
+    leads = list(DestinoSQLite(sink).ler_leads())
+    if not leads:
+        console.print("\n[yellow]Nenhum lead gravado.[/yellow]\n")
+        raise typer.Exit(code=1)
+
+    caminho = CSVExporter(output_dir=output_dir).exportar(leads, filename=output)
+    console.print(f"\n[green]✓[/green] {len(leads)} lead(s) salvo(s) em: [bold]{caminho}[/bold]\n")
+
+
+@app.command()
+def profile_warm(
+    user_data_dir: str = typer.Option(..., "--user-data-dir", help="Diretório do perfil persistente"),
+    urls: Optional[list[str]] = typer.Option(
+        None,
+        "--url",
+        "-u",
+        help="URL a visitar (pode repetir; padrão: página inicial do Google Maps)"
+    )
+):
+    """
+    Pré-aquece o perfil persistente do navegador (cache de JS e cookies de consentimento).
+
+    Exemplo:
+        extrator profile-warm --user-data-dir ~/.cache/extrator/perfil -u "https://www.google.com/maps/search/advogados"
+    """
+    from extrator_leads.extractors.perfil import PerfilNavegador
 
-    for idx, arquivo in enumerate(arquivos, 1):
-        caminho_completo = Path(output_dir) / arquivo
-        size = caminho_completo.stat().st_size if caminho_completo.exists() else 0
-        size_kb = size / 1024
-        table.add_row(str(idx), f"{arquivo} ({size_kb:.1f} KB)")
+    perfil = PerfilNavegador(user_data_dir)
+    try:
+        perfil.aquecer(
+            urls or ["https://www.google.com/maps"],
+            callback=lambda msg: console.print(f"[dim]{msg}[/dim]")
+        )
+    except Exception as e:
+        console.print(f"\n[bold red]Erro ao aquecer perfil:[/bold red] {str(e)}\n")
+        raise typer.Exit(code=1)
+
+    console.print(f"\n[green]✓[/green] Perfil aquecido: [bold]{user_data_dir}[/bold] ({perfil.tamanho_mb():.1f} MB)\n")
+
+
+@app.command()
+def profile_purge(
+    user_data_dir: str = typer.Option(..., "--user-data-dir", help="Diretório do perfil persistente"),
+    max_mb: Optional[float] = typer.Option(
+        None,
+        "--max-mb",
+        help="Só purga se o perfil passar deste tamanho (padrão: purga sempre)"
+    )
+):
+    """
+    Remove os caches do perfil persistente do navegador.
+    """
+    from extrator_leads.extractors.perfil import PerfilNavegador
+
+    perfil = PerfilNavegador(user_data_dir)
+    antes = perfil.tamanho_mb()
+    try:
+        purgado = perfil.purgar(limite_mb=max_mb)
+    except RuntimeError as e:
+        console.print(f"\n[bold red]Erro:[/bold red] {str(e)}\n")
+        raise typer.Exit(code=1)
+
+    if purgado:
+        console.print(f"\n[green]✓[/green] Perfil purgado: {antes:.1f} MB → {perfil.tamanho_mb():.1f} MB\n")
+    else:
+        console.print(f"\n[dim]Perfil com {antes:.1f} MB, abaixo do limite; nada a purgar.[/dim]\n")
+
+
+@app.command()
+def selectors(
+    caminho: Optional[str] = typer.Option(
+        None,
+        "--path",
+        help="Arquivo de estatísticas dos seletores (padrão: ~/.cache/extrator-leads/seletores.json)"
+    ),
+    reset: bool = typer.Option(False, "--reset", help="Descarta as estatísticas acumuladas")
+):
+    """
+    Mostra a taxa de acerto dos seletores do Google Maps e os que pararam de funcionar.
+    """
+    from extrator_leads.core.seletores import CAMINHO_PADRAO, ResolvedorSeletores
+    from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+
+    resolvedor = ResolvedorSeletores(
+        {campo: lista for campo, lista in GoogleMapsExtractor.SELECTORS.items() if isinstance(lista, list)},
+        caminho=caminho or str(CAMINHO_PADRAO),
+        ordem_fixa=GoogleMapsExtractor.SELETORES_ORDEM_FIXA
+    )
+
+    if reset:
+        resolvedor.limpar()
+        console.print("\n[green]✓[/green] Estatísticas de seletores descartadas.\n")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Campo", style="cyan")
+    table.add_column("Seletor")
+    table.add_column("Acertos", justify="right")
+    table.add_column("Tentativas", justify="right")
+    table.add_column("Taxa", justify="right")
+
+    for linha in resolvedor.resumo():
+        seletor = f"{linha['seletor']} [dim](primário)[/dim]" if linha["primario"] else linha["seletor"]
+        taxa = f"{linha['taxa']:.0%}" if linha["taxa"] is not None else "-"
+        table.add_row(linha["campo"], seletor, str(linha["acertos"]), str(linha["tentativas"]), taxa)
 
+    console.print()
     console.print(table)
+
+    alertas = resolvedor.alertas()
+    if alertas:
+        console.print("\n[bold yellow]Seletores com problema:[/bold yellow]")
+        for alerta in alertas:
+            console.print(f"  ⚠ {alerta}")
     console.print()
 
 
@@ -163,7 +956,7 @@ def platforms():
 
     plataformas_info = [
         ("Google Maps", "google_maps", "✓ Disponível", "green"),
-        ("Facebook", "facebook", "⚠ Em desenvolvimento", "yellow"),
+        ("Facebook", "facebook", "✓ Disponível", "green"),
         ("LinkedIn", "linkedin", "⚠ Em desenvolvimento", "yellow"),
     ]
 
@@ -179,6 +972,31 @@ def platforms():
     console.print()
 
 
+@app.command("config")
+def show_config(ctx: typer.Context):
+    """
+    Exibe a configuração de desempenho efetiva (preset, .env, ambiente e --set).
+
+    Exemplo:
+        extrator --preset fast --set workers=8 config
+    """
+    configuracao = _configuracao(ctx)
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Campo", style="cyan")
+    table.add_column("Valor")
+    table.add_column("Preset balanced", style="dim")
+    padrao = Configuracao()
+    for campo, valor in configuracao.model_dump().items():
+        referencia = getattr(padrao, campo)
+        texto = escape(str(valor))
+        table.add_row(campo, f"[bold]{texto}[/bold]" if valor != referencia else texto, escape(str(referencia)))
+
+    console.print(f"\n[bold cyan]Configuração ({configuracao.preset})[/bold cyan]\n")
+    console.print(table)
+    console.print()
+
+
 @app.command()
 def version():
     """
@@ -189,6 +1007,103 @@ def version():
     console.print("Autor: Marcos <marcosf63@gmail.com>\n")
 
 
+def _purgar_perfil_se_necessario(user_data_dir: str, max_profile_mb: Optional[float]):
+    """Purga o perfil persistente se ele passar do tamanho máximo."""
+    if max_profile_mb is None:
+        return
+
+    from extrator_leads.extractors.perfil import PerfilNavegador
+
+    perfil = PerfilNavegador(user_data_dir)
+    antes = perfil.tamanho_mb()
+    try:
+        purgado = perfil.purgar(limite_mb=max_profile_mb)
+    except RuntimeError:
+        # Outra execução está usando o perfil: a purga fica para a próxima
+        console.print("[dim]Perfil em uso por outra execução; purga adiada.[/dim]")
+        return
+
+    if purgado:
+        console.print(f"[dim]Perfil purgado: {antes:.1f} MB → {perfil.tamanho_mb():.1f} MB[/dim]")
+
+
+def _exibir_resumo_prazo(prazo):
+    """Exibe quanto do orçamento de tempo foi usado e o que foi pulado."""
+    console.print(f"\n[cyan]⏱[/cyan] {prazo.decorrido():.0f}s de {prazo.segundos:.0f}s do orçamento de tempo")
+    for linha in prazo.resumo():
+        console.print(f"[yellow]  ⚠ Pulado pelo prazo[/yellow] - {linha}")
+
+
+def _exportar_delta(url: str, leads, exporter: CSVExporter, output: Optional[str], state: Optional[str], completo: bool):
+    """Compara os leads com a execução anterior e grava o CSV delta."""
+    from extrator_leads.core.delta import EstadoLeads, exportar_delta
+
+    estado = EstadoLeads(state or exporter.obter_caminho_completo("estado_leads.db"))
+    mudancas = estado.registrar(url, leads, completo=completo)
+
+    if output:
+        nome = f"{Path(output).stem}_delta.csv"
+    else:
+        nome = f"delta_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    caminho = exportar_delta(mudancas, exporter.obter_caminho_completo(nome))
+    exporter.manifesto.registrar_arquivo(caminho)
+
+    console.print(
+        f"[green]✓[/green] Delta: {len(mudancas.novos)} novo(s), {len(mudancas.alterados)} alterado(s), "
+        f"{len(mudancas.removidos)} removido(s) em: [bold]{caminho}[/bold]"
+    )
+    if not completo:
+        console.print("[dim]Execução parcial (limite ou falhas): removidos não foram calculados.[/dim]")
+    console.print()
+
+
+def _exibir_resumo_profile(profiler: ProfilerExtracao):
+    """Exibe as funções mais quentes e as operações de página mais lentas."""
+    console.print("[bold cyan]Perfil da execução[/bold cyan]\n")
+
+    table = Table(show_header=True, header_style="bold magenta", title="Funções mais quentes (tempo próprio)")
+    table.add_column("Função", style="cyan")
+    table.add_column("Chamadas", justify="right")
+    table.add_column("Tempo (s)", justify="right", style="green")
+    for nome, chamadas, tempo in profiler.funcoes_quentes(top=10):
+        table.add_row(nome[:70], str(chamadas), f"{tempo:.3f}")
+    console.print(table)
+
+    operacoes = profiler.operacoes_pagina(top=10)
+    if operacoes:
+        table = Table(show_header=True, header_style="bold magenta", title="Operações de página mais lentas (tempo acumulado)")
+        table.add_column("Operação", style="cyan")
+        table.add_column("Chamadas", justify="right")
+        table.add_column("Tempo (s)", justify="right", style="green")
+        for nome, chamadas, tempo in operacoes:
+            table.add_row(nome, str(chamadas), f"{tempo:.3f}")
+        console.print(table)
+
+    console.print(f"\n[green]✓[/green] Perfil salvo em: [bold]{profiler.caminho_stats}[/bold]")
+    console.print(f"[green]✓[/green] Relatório salvo em: [bold]{profiler.caminho_resumo}[/bold]")
+    if profiler.caminho_trace and profiler.caminho_trace.exists():
+        console.print(f"[green]✓[/green] Trace salvo em: [bold]{profiler.caminho_trace}[/bold]")
+    console.print()
+
+
+def _exibir_falhas(falhas):
+    """Exibe os estabelecimentos que falharam mesmo após as retentativas."""
+    table = Table(
+        show_header=True,
+        header_style="bold magenta",
+        title=f"{len(falhas)} estabelecimento(s) não extraído(s)"
+    )
+    table.add_column("URL", style="dim")
+    table.add_column("Tentativas", justify="right", width=10)
+    table.add_column("Motivo", style="red")
+
+    for falha in falhas:
+        table.add_row(falha.url[:60], str(falha.tentativas), falha.motivo[:60])
+
+    console.print(table)
+    console.print()
+
+
 def _exibir_lead(lead):
     """Exibe os dados do lead em uma tabela."""
     table = Table(show_header=True, header_style="bold magenta")
@@ -205,22 +1120,19 @@ def _exibir_lead(lead):
 
 
 def _exibir_leads_tabela(leads):
-    """Exibe múltiplos leads em uma tabela compacta."""
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Nome", style="cyan")
-    table.add_column("Telefone", style="green")
-    table.add_column("Website", style="blue")
+    """Exibe múltiplos leads em uma tabela compacta (apenas o resumo para muitos leads)."""
+    console.print(tabela_leads(leads))
 
-    for idx, lead in enumerate(leads, 1):
-        table.add_row(
-            str(idx),
-            lead.nome[:40] + "..." if len(lead.nome) > 40 else lead.nome,
-            lead.telefone or "[dim]N/A[/dim]",
-            str(lead.website)[:30] + "..." if lead.website and len(str(lead.website)) > 30 else (str(lead.website) if lead.website else "[dim]N/A[/dim]")
-        )
 
-    console.print(table)
+def _encadear(*funcoes):
+    """Combina callbacks de lead em um só (ignorando os ausentes)."""
+    funcoes = [f for f in funcoes if f]
+
+    def chamar(lead):
+        for funcao in funcoes:
+            funcao(lead)
+
+    return chamar
 
 
 if __name__ == "__main__":
@@ -0,0 +1,178 @@
+"""Configuração de desempenho (esperas, concorrência, bloqueio de recursos e retentativas)."""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+from dotenv import dotenv_values
+from pydantic import BaseModel, field_validator
+
+PRESET_PADRAO = "balanced"
+
+# Valores de cada preset que diferem do padrão (balanced = comportamento histórico)
+PRESETS: Dict[str, dict] = {
+    "fast": {
+        "timeout_navegacao": 20000,
+        "espera_carregamento": 1000,
+        "espera_rolagem": 800,
+        "rolagens_sem_novos": 2,
+        "timeout_feed": 6000,
+        "timeout_nome": 6000,
+        "espera_clique": 100,
+        "espera_painel": 1500,
+        "espera_botoes": 500,
+        "espera_website": 0,
+        "workers": 4,
+        "bloquear_recursos": ["image", "media", "font"],
+        "max_retentativas": 1,
+        "espera_retentativa": 1.0,
+    },
+    "balanced": {},
+    "thorough": {
+        "timeout_navegacao": 60000,
+        "espera_carregamento": 5000,
+        "espera_rolagem": 2500,
+        "rolagens_sem_novos": 5,
+        "timeout_feed": 20000,
+        "timeout_nome": 20000,
+        "espera_clique": 500,
+        "espera_painel": 6000,
+        "espera_botoes": 2000,
+        "espera_website": 1000,
+        "workers": 1,
+        "max_retentativas": 4,
+        "espera_retentativa": 5.0,
+    },
+}
+
+PREFIXO_ENV = "EXTRATOR_"
+
+# Variáveis históricas do .env.example: valem como padrão, abaixo do preset
+# (EXTRATOR_<CAMPO> e o preset têm precedência sobre elas)
+ALIASES_ENV = {
+    "HEADLESS": "headless",
+    "PLAYWRIGHT_TIMEOUT": "timeout_navegacao",
+    "HTTP_TIMEOUT": "timeout_http",
+    "USER_AGENT": "user_agent",
+}
+
+
+class Configuracao(BaseModel):
+    """
+    Parâmetros de desempenho usados pelos extractors.
+
+    Tempos em milissegundos (como no Playwright), exceto `timeout_http` e
+    `espera_retentativa`, em segundos.
+    """
+
+    preset: str = PRESET_PADRAO
+
+    # Navegador
+    headless: bool = True
+    user_agent: Optional[str] = None
+    largura_janela: int = 1920
+    altura_janela: int = 1080
+    bloquear_recursos: List[str] = []  # tipos de recurso do Playwright (image, media, font, ...)
+
+    # Timeouts
+    timeout_navegacao: int = 30000
+    timeout_http: float = 30.0
+    timeout_feed: int = 10000
+    timeout_nome: int = 10000
+
+    # Esperas
+    espera_carregamento: int = 3000
+    espera_rolagem: int = 1500
+    rolagens_sem_novos: int = 3
+    espera_clique: int = 300  # antes de clicar num resultado do feed
+    espera_painel: int = 3000
+    espera_botoes: int = 1000
+    espera_website: int = 500
+
+    # Concorrência e retentativas
+    workers: int = 2
+    max_retentativas: int = 2
+    espera_retentativa: float = 2.0
+
+    model_config = {"extra": "forbid"}
+
+    @field_validator("bloquear_recursos", mode="before")
+    @classmethod
+    def separar_recursos(cls, v):
+        """Aceita os tipos de recurso separados por vírgula (ex: vindos do .env)."""
+        if isinstance(v, str):
+            return [item.strip() for item in v.split(",") if item.strip()]
+        return v
+
+    @field_validator("workers")
+    @classmethod
+    def validar_workers(cls, v: int) -> int:
+        """Garante pelo menos um worker."""
+        if v < 1:
+            raise ValueError("workers precisa ser pelo menos 1")
+        return v
+
+    @property
+    def viewport(self) -> dict:
+        """Tamanho da janela no formato do Playwright."""
+        return {"width": self.largura_janela, "height": self.altura_janela}
+
+
+def _valores_aliases(ambiente: Mapping[str, str]) -> dict:
+    """Extrai os campos da configuração das variáveis históricas (ALIASES_ENV)."""
+    return {campo: ambiente[nome] for nome, campo in ALIASES_ENV.items() if ambiente.get(nome)}
+
+
+def _valores_ambiente(ambiente: Mapping[str, str]) -> dict:
+    """Extrai os campos da configuração das variáveis EXTRATOR_<CAMPO>."""
+    valores = {}
+    for campo in Configuracao.model_fields:
+        nome = PREFIXO_ENV + campo.upper()
+        if ambiente.get(nome):
+            valores[campo] = ambiente[nome]
+    return valores
+
+
+def carregar_configuracao(
+    preset: Optional[str] = None,
+    env_file: Optional[str] = ".env",
+    sobrescritas: Optional[dict] = None,
+    ambiente: Optional[Mapping[str, str]] = None
+) -> Configuracao:
+    """
+    Monta a configuração efetiva.
+
+    A precedência é: variáveis históricas (PLAYWRIGHT_TIMEOUT, HEADLESS, ...)
+    < preset < EXTRATOR_<CAMPO> do arquivo .env < EXTRATOR_<CAMPO> do
+    ambiente < sobrescritas (ex: opções da CLI). O preset pode vir do
+    argumento ou de EXTRATOR_PRESET.
+
+    Args:
+        preset: 'fast', 'balanced' ou 'thorough' (padrão: EXTRATOR_PRESET ou balanced)
+        env_file: Arquivo .env a ler, se existir (None = não lê)
+        sobrescritas: Valores por campo, aplicados por último
+        ambiente: Variáveis de ambiente (padrão: os.environ)
+
+    Returns:
+        Configuração validada
+
+    Raises:
+        ValueError: Se o preset for desconhecido ou algum valor for inválido
+    """
+    arquivo = dotenv_values(env_file) if env_file and Path(env_file).is_file() else {}
+    processo = os.environ if ambiente is None else ambiente
+
+    preset = preset or processo.get(PREFIXO_ENV + "PRESET") or arquivo.get(PREFIXO_ENV + "PRESET") or PRESET_PADRAO
+    if preset not in PRESETS:
+        raise ValueError(f"Preset inválido: {preset} (use {', '.join(PRESETS)})")
+
+    dados = {
+        **_valores_aliases(arquivo),
+        **_valores_aliases(processo),
+        **PRESETS[preset],
+        **_valores_ambiente(arquivo),
+        **_valores_ambiente(processo),
+    }
+    dados.update(sobrescritas or {})
+    dados["preset"] = preset
+    return Configuracao.model_validate(dados)
@@ -1,24 +1,36 @@
 """Exportador de leads para CSV."""
 
+import csv
+import logging
 import os
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import pandas as pd
 from extrator_leads.core.models import Lead
+from extrator_leads.core.indice import IndiceLeads
+from extrator_leads.core.manifesto import ManifestoExportacoes
+
+logger = logging.getLogger(__name__)
+
+# Colunas dos CSVs exportados, na ordem desejada
+COLUNAS = ['nome', 'telefone', 'email', 'website', 'fonte', 'url_origem', 'place_id', 'email_status']
 
 
 class CSVExporter:
     """Classe para exportar leads para arquivos CSV."""
 
-    def __init__(self, output_dir: str = "data"):
+    def __init__(self, output_dir: str = "data", indexar: bool = True):
         """
         Inicializa o exportador.
 
         Args:
             output_dir: Diretório onde os CSVs serão salvos
+            indexar: Atualiza o índice de consulta (comando query) a cada exportação
         """
         self.output_dir = Path(output_dir)
+        self.indexar = indexar
         self._garantir_diretorio()
 
     def _garantir_diretorio(self) -> None:
@@ -61,7 +73,7 @@ class CSVExporter:
             Caminho completo do arquivo gerado
 
         Raises:
-            ValueError: Se a lista de leads estiver vazia
+            ValueError: Se a lista de leads estiver vazia ou o arquivo de append não for um CSV de leads
         """
         if not leads:
             raise ValueError("Lista de leads está vazia")
@@ -73,16 +85,18 @@ class CSVExporter:
         df = pd.DataFrame(dados)
 
         # Define colunas na ordem desejada
-        colunas = ['nome', 'telefone', 'email', 'website', 'fonte', 'url_origem']
-        df = df[colunas]
+        df = df[COLUNAS]
 
         # Gera nome do arquivo
         nome_arquivo = self._gerar_nome_arquivo(filename)
         caminho_completo = self.output_dir / nome_arquivo
 
         # Exporta para CSV
-        if append and caminho_completo.exists():
-            # Append ao arquivo existente
+        stat_anterior = caminho_completo.stat() if append and caminho_completo.exists() else None
+        if stat_anterior is not None:
+            # Append ao arquivo existente, nas colunas do cabeçalho dele (arquivos
+            # de versões anteriores não têm as colunas mais novas)
+            df = df.reindex(columns=self._cabecalho_existente(caminho_completo))
             df.to_csv(
                 caminho_completo,
                 mode='a',
@@ -98,8 +112,48 @@ class CSVExporter:
                 encoding='utf-8'
             )
 
+        # O CSV já foi gravado: uma falha no manifesto não desfaz a exportação
+        try:
+            self.manifesto.registrar(str(caminho_completo), dados, append=append)
+        except (OSError, ValueError) as e:
+            logger.warning("Não foi possível atualizar o manifesto de %s: %s", caminho_completo, e)
+        if self.indexar:
+            self._atualizar_indice(caminho_completo, dados, append, stat_anterior)
+
         return str(caminho_completo)
 
+    @staticmethod
+    def _cabecalho_existente(caminho: Path) -> List[str]:
+        """
+        Lê o cabeçalho de um CSV ao qual os leads serão adicionados.
+
+        Raises:
+            ValueError: Se o arquivo não tiver um cabeçalho de leads
+        """
+        with open(caminho, newline='', encoding='utf-8') as arquivo:
+            cabecalho = next(csv.reader(arquivo), [])
+        if 'nome' not in cabecalho:
+            raise ValueError(f"O arquivo {caminho} não tem um cabeçalho de leads; use outro arquivo para --append")
+        return cabecalho
+
+    def _atualizar_indice(
+        self,
+        caminho: Path,
+        dados: List[dict],
+        append: bool,
+        stat_anterior: Optional[os.stat_result] = None
+    ) -> None:
+        """Indexa os leads exportados (falhas só deixam o índice para a próxima sincronização)."""
+        try:
+            IndiceLeads(str(self.output_dir)).adicionar(str(caminho), dados, append=append, stat_anterior=stat_anterior)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Não foi possível atualizar o índice de %s (fica para o próximo query): %s", caminho, e)
+
+    @property
+    def manifesto(self) -> ManifestoExportacoes:
+        """Manifesto das exportações do diretório de saída."""
+        return ManifestoExportacoes(str(self.output_dir))
+
     def exportar_lead(
         self,
         lead: Lead,
@@ -0,0 +1,162 @@
+"""Detecção de mudanças entre execuções recorrentes (exportação delta)."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+from pydantic import BaseModel
+
+from extrator_leads.core.csv_exporter import COLUNAS
+from extrator_leads.core.merger import normalizar_dominio, normalizar_nome, normalizar_telefone
+from extrator_leads.core.models import Lead
+
+NOVO = "novo"
+ALTERADO = "alterado"
+REMOVIDO = "removido"
+
+COLUNA_MUDANCA = "mudanca"
+
+
+def chave_lead(lead: Lead) -> str:
+    """Chave estável do lead: ID do lugar ou, na falta dele, fonte + nome normalizado."""
+    if lead.place_id:
+        return f"id:{lead.place_id}"
+    return f"nome:{lead.fonte}:{normalizar_nome(lead.nome)}"
+
+
+def impressao_digital(lead: Lead) -> str:
+    """
+    Calcula o hash dos campos normalizados do lead.
+
+    Mudanças só de formatação (ex: telefone com ou sem máscara) não alteram o hash.
+    """
+    dados = lead.to_dict()
+    campos = [
+        normalizar_nome(dados["nome"]) or "",
+        normalizar_telefone(dados["telefone"]) or "",
+        (dados["email"] or "").lower(),
+        normalizar_dominio(dados["website"]) or (dados["website"] or "").lower(),
+    ]
+    return hashlib.sha256("\x1f".join(campos).encode("utf-8")).hexdigest()
+
+
+class Delta(BaseModel):
+    """Leads novos, alterados e removidos desde a execução anterior."""
+
+    novos: List[dict] = []
+    alterados: List[dict] = []
+    removidos: List[dict] = []
+
+    @property
+    def total(self) -> int:
+        """Quantidade total de mudanças."""
+        return len(self.novos) + len(self.alterados) + len(self.removidos)
+
+    def linhas(self) -> List[dict]:
+        """Linhas do arquivo delta, com a coluna de tipo de mudança."""
+        return [
+            {**dados, COLUNA_MUDANCA: mudanca}
+            for mudanca, grupo in ((NOVO, self.novos), (ALTERADO, self.alterados), (REMOVIDO, self.removidos))
+            for dados in grupo
+        ]
+
+
+class EstadoLeads:
+    """
+    Impressões digitais dos leads já vistos, em um arquivo SQLite local.
+
+    O estado é separado por escopo (a URL da busca), para que os leads que
+    sumiram de uma busca não sejam confundidos com os de outra.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS leads (
+            escopo TEXT NOT NULL,
+            chave TEXT NOT NULL,
+            impressao TEXT NOT NULL,
+            dados TEXT NOT NULL,
+            visto_em REAL NOT NULL,
+            PRIMARY KEY (escopo, chave)
+        );
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Inicializa o estado, criando o arquivo se necessário.
+
+        Args:
+            caminho: Caminho do arquivo SQLite
+        """
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.caminho)) as conn:
+            conn.executescript(self.SCHEMA)
+
+    def registrar(self, escopo: str, leads: List[Lead], completo: bool = True) -> Delta:
+        """
+        Compara os leads com o estado anterior do escopo e atualiza o estado.
+
+        Args:
+            escopo: Identificador da busca recorrente (ex: URL)
+            leads: Leads extraídos nesta execução
+            completo: Se a execução cobriu a busca inteira. Execuções parciais
+                (limite, falhas) não marcam como removidos os leads não vistos.
+
+        Returns:
+            Mudanças em relação à execução anterior
+        """
+        delta = Delta()
+        agora = time.time()
+
+        # Chaves repetidas na mesma execução contam uma vez só
+        atuais: Dict[str, Lead] = {}
+        for lead in leads:
+            atuais.setdefault(chave_lead(lead), lead)
+
+        with closing(sqlite3.connect(self.caminho)) as conn, conn:
+            anteriores = {
+                chave: (impressao, dados)
+                for chave, impressao, dados in conn.execute(
+                    "SELECT chave, impressao, dados FROM leads WHERE escopo = ?", (escopo,)
+                )
+            }
+
+            for chave, lead in atuais.items():
+                impressao = impressao_digital(lead)
+                dados = lead.to_dict()
+                if chave not in anteriores:
+                    delta.novos.append(dados)
+                elif anteriores[chave][0] != impressao:
+                    delta.alterados.append(dados)
+                conn.execute(
+                    "INSERT OR REPLACE INTO leads (escopo, chave, impressao, dados, visto_em) VALUES (?, ?, ?, ?, ?)",
+                    (escopo, chave, impressao, json.dumps(dados, ensure_ascii=False), agora)
+                )
+
+            if completo:
+                for chave in anteriores.keys() - atuais.keys():
+                    delta.removidos.append(json.loads(anteriores[chave][1]))
+                    conn.execute("DELETE FROM leads WHERE escopo = ? AND chave = ?", (escopo, chave))
+
+        return delta
+
+
+def exportar_delta(delta: Delta, caminho: str) -> str:
+    """
+    Grava o arquivo delta (colunas do CSV de leads + tipo de mudança).
+
+    Args:
+        delta: Mudanças a exportar
+        caminho: Caminho do CSV
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    colunas = COLUNAS + [COLUNA_MUDANCA]
+    pd.DataFrame(delta.linhas(), columns=colunas).to_csv(caminho, index=False, encoding="utf-8")
+    return caminho
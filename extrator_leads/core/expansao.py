@@ -0,0 +1,290 @@
+"""Expansão de buscas: combina termos e localidades e extrai os lugares sem repetição."""
+
+import csv
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote_plus, urlsplit, urlunsplit
+
+from pydantic import BaseModel
+
+from extrator_leads.core.models import Lead
+from extrator_leads.core.retry import FalhaExtracao
+
+URL_BUSCA = "https://www.google.com/maps/search/{consulta}"
+
+# Lugares por tarefa na fase de detalhes (tarefas menores equilibram melhor os workers)
+LUGARES_POR_TAREFA = 25
+
+
+def gerar_urls_busca(termos: List[str], locais: List[str]) -> List[str]:
+    """
+    Gera as URLs de busca do Google Maps para cada termo em cada localidade.
+
+    Args:
+        termos: Termos de busca (ex: 'advogados')
+        locais: Localidades (ex: 'Sobral CE')
+
+    Returns:
+        URLs no formato /maps/search/<termo>+em+<local>, sem repetições
+    """
+    pares = [(termo, local) for termo in termos for local in locais]
+    return list(dict.fromkeys(_url_par(termo, local) for termo, local in pares))
+
+
+def _url_par(termo: str, local: str) -> str:
+    return URL_BUSCA.format(consulta=quote_plus(f"{termo.strip()} em {local.strip()}"))
+
+
+def ler_pares_csv(caminho: str) -> List[str]:
+    """
+    Lê pares de termo e localidade de um CSV com as colunas 'termo' e 'local'.
+
+    Args:
+        caminho: Caminho do CSV
+
+    Returns:
+        URLs de busca, na ordem do arquivo e sem repetições
+
+    Raises:
+        ValueError: Se o CSV não tiver as colunas esperadas
+    """
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        leitor = csv.DictReader(arquivo)
+        if not {"termo", "local"} <= set(leitor.fieldnames or []):
+            raise ValueError("O CSV precisa das colunas 'termo' e 'local'")
+        urls = [_url_par(linha["termo"], linha["local"]) for linha in leitor if linha["termo"] and linha["local"]]
+    return list(dict.fromkeys(urls))
+
+
+def chave_lugar(href: str, place_id: Optional[str]) -> str:
+    """Identifica um lugar encontrado por buscas diferentes (ID do lugar ou link sem query)."""
+    if place_id:
+        return place_id
+    partes = urlsplit(href)
+    return urlunsplit((partes.scheme, partes.netloc, partes.path, "", ""))
+
+
+class ResultadoExpansao(BaseModel):
+    """Resultado de uma expansão de buscas."""
+
+    leads: List[Lead] = []
+    buscas: int = 0
+    encontrados: int = 0
+    unicos: int = 0
+    falhas: List[FalhaExtracao] = []
+
+
+class ExpansorBuscas:
+    """
+    Executa várias buscas do Google Maps em navegadores compartilhados.
+
+    Cada worker mantém um Chromium durante toda a execução (a API síncrona
+    do Playwright exige uso na thread que o criou). Na primeira fase os
+    workers coletam os links de todas as buscas; os lugares encontrados por
+    mais de uma busca são deduplicados e só então, na segunda fase, os
+    detalhes de cada lugar único são extraídos uma única vez.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        workers: int = 2,
+        limit: Optional[int] = None,
+        headless: bool = True,
+        callback: Optional[Callable[[str], None]] = None,
+        opcoes_extractor: Optional[dict] = None
+    ):
+        """
+        Inicializa o expansor.
+
+        Args:
+            urls: URLs de busca (ex: de gerar_urls_busca)
+            workers: Quantidade de navegadores simultâneos
+            limit: Máximo de lugares coletados por busca
+            headless: Executa os navegadores sem interface gráfica
+            callback: Função para reportar progresso (opcional)
+            opcoes_extractor: Opções repassadas ao GoogleMapsExtractor
+        """
+        if workers < 1:
+            raise ValueError("A expansão precisa de pelo menos um worker")
+
+        self.urls = urls
+        self.workers = workers
+        self.limit = limit
+        self.headless = headless
+        self.callback = callback
+        self.opcoes_extractor = opcoes_extractor or {}
+        self._lock = threading.Lock()
+        self._lugares: Dict[str, Tuple[str, str]] = {}
+        self._encontrados = 0
+        self._leads: List[Lead] = []
+        self._falhas: List[FalhaExtracao] = []
+        self._iniciados = 0
+        self._erro: Optional[Exception] = None
+        self._erro_fases: Optional[Exception] = None
+
+    def _log(self, mensagem: str) -> None:
+        if self.callback:
+            self.callback(mensagem)
+
+    def _criar_extractor(self, url: str, browser):
+        from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+
+        return GoogleMapsExtractor(url, limit=self.limit, browser=browser, **self.opcoes_extractor)
+
+    @contextmanager
+    def _abrir_navegador(self) -> Iterator[object]:
+        """Inicia o Chromium de um worker."""
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=self.headless)
+            try:
+                yield browser
+            finally:
+                browser.close()
+
+    def _coletar(self, browser, url: str) -> List[str]:
+        """Fase 1: links dos lugares de uma busca."""
+        return self._criar_extractor(url, browser).coletar_links()
+
+    def _detalhar(self, browser, url: str, hrefs: List[str]) -> Tuple[List[Lead], List[FalhaExtracao]]:
+        """Fase 2: detalhes dos lugares encontrados por uma busca."""
+        extractor = self._criar_extractor(url, browser)
+        leads = extractor.extrair_links(hrefs)
+        return leads, extractor.falhas
+
+    def _registrar_links(self, url: str, hrefs: List[str]) -> None:
+        """Guarda os lugares ainda não vistos (a primeira busca que encontrou vence)."""
+        from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+
+        with self._lock:
+            self._encontrados += len(hrefs)
+            for href in hrefs:
+                chave = chave_lugar(href, GoogleMapsExtractor.extrair_place_id(href))
+                self._lugares.setdefault(chave, (href, url))
+
+    def _montar_tarefas_detalhes(self, fila: "queue.Queue") -> None:
+        """Agrupa os lugares únicos por busca de origem em tarefas da fase 2."""
+        try:
+            self._agrupar_por_busca(fila)
+        except Exception as e:
+            # A barreira quebra e os workers param; executar() relata o erro
+            self._erro_fases = e
+            raise
+
+    def _agrupar_por_busca(self, fila: "queue.Queue") -> None:
+        por_busca: Dict[str, List[str]] = {}
+        for href, url in self._lugares.values():
+            por_busca.setdefault(url, []).append(href)
+
+        for url, hrefs in por_busca.items():
+            for inicio in range(0, len(hrefs), LUGARES_POR_TAREFA):
+                fila.put((url, hrefs[inicio:inicio + LUGARES_POR_TAREFA]))
+
+        self._log(
+            f"Coleta concluída: {self._encontrados} resultado(s), {len(self._lugares)} lugar(es) único(s)"
+        )
+
+    def _executar_worker(self, buscas: "queue.Queue", detalhes: "queue.Queue", fases: threading.Barrier) -> None:
+        chegou_na_barreira = False
+        try:
+            with self._abrir_navegador() as browser:
+                with self._lock:
+                    self._iniciados += 1
+                self._processar_buscas(browser, buscas)
+                chegou_na_barreira = True
+                fases.wait()
+                self._processar_detalhes(browser, detalhes)
+        except threading.BrokenBarrierError:
+            return
+        except Exception as e:
+            self._log(f"  ✗ Worker encerrado: {e}")
+            with self._lock:
+                self._erro = e
+            # Sem navegador, o worker ainda participa da barreira para não travar os demais
+            if not chegou_na_barreira:
+                fases.wait()
+
+    def _processar_buscas(self, browser, buscas: "queue.Queue") -> None:
+        while True:
+            try:
+                url = buscas.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self._log(f"Buscando: {url}")
+                self._registrar_links(url, self._coletar(browser, url))
+            except Exception as e:
+                with self._lock:
+                    self._falhas.append(FalhaExtracao(url=url, motivo=str(e)))
+
+    def _processar_detalhes(self, browser, detalhes: "queue.Queue") -> None:
+        while True:
+            try:
+                url, hrefs = detalhes.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                leads, falhas = self._detalhar(browser, url, hrefs)
+            except Exception as e:
+                leads, falhas = [], [FalhaExtracao(url=href, motivo=str(e)) for href in hrefs]
+            with self._lock:
+                self._leads.extend(leads)
+                self._falhas.extend(falhas)
+            self._log(f"  ✓ {len(leads)}/{len(hrefs)} lugar(es) extraído(s) de {url}")
+
+    def executar(self) -> ResultadoExpansao:
+        """
+        Executa as buscas e extrai os lugares únicos.
+
+        Returns:
+            Leads extraídos e estatísticas da expansão
+
+        Raises:
+            RuntimeError: Se nenhum navegador puder ser iniciado ou a passagem
+                da coleta para os detalhes falhar
+        """
+        buscas: "queue.Queue[str]" = queue.Queue()
+        for url in self.urls:
+            buscas.put(url)
+        detalhes: "queue.Queue[Tuple[str, List[str]]]" = queue.Queue()
+
+        quantidade = min(self.workers, len(self.urls)) or 1
+        fases = threading.Barrier(quantidade, action=lambda: self._montar_tarefas_detalhes(detalhes))
+        threads = [
+            threading.Thread(
+                target=self._executar_worker,
+                args=(buscas, detalhes, fases),
+                name=f"extrator-expansao-{indice}",
+                daemon=True
+            )
+            for indice in range(quantidade)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if not self._iniciados:
+            raise RuntimeError(f"Erro ao iniciar navegador: {self._erro}")
+        if self._erro_fases is not None:
+            raise RuntimeError(f"Erro ao preparar a extração dos detalhes: {self._erro_fases}") from self._erro_fases
+
+        # Tarefas que sobraram porque todos os workers morreram viram falhas
+        motivo = f"Worker encerrado: {self._erro}"
+        while not buscas.empty():
+            self._falhas.append(FalhaExtracao(url=buscas.get_nowait(), motivo=motivo))
+        while not detalhes.empty():
+            _, hrefs = detalhes.get_nowait()
+            self._falhas.extend(FalhaExtracao(url=href, motivo=motivo) for href in hrefs)
+
+        return ResultadoExpansao(
+            leads=self._leads,
+            buscas=len(self.urls),
+            encontrados=self._encontrados,
+            unicos=len(self._lugares),
+            falhas=self._falhas
+        )
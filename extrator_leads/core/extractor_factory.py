@@ -18,7 +18,7 @@ class ExtractorFactory:
     ]
 
     @classmethod
-    def criar_extractor(cls, url: str, limit: int = None, callback=None) -> BaseExtractor:
+    def criar_extractor(cls, url: str, limit: int = None, callback=None, **opcoes) -> BaseExtractor:
         """
         Cria o extractor apropriado baseado na URL.
 
@@ -26,6 +26,7 @@ class ExtractorFactory:
             url: URL para extrair dados
             limit: Número máximo de leads a extrair (None = todos)
             callback: Função para reportar progresso (opcional)
+            **opcoes: Opções adicionais repassadas ao extractor (ex: trace_path)
 
         Returns:
             Instância do extractor apropriado
@@ -35,12 +36,12 @@ class ExtractorFactory:
         """
         for extractor_class in cls._extractors:
             if extractor_class.pode_extrair(url):
-                return extractor_class(url, limit=limit, callback=callback)
+                return extractor_class(url, limit=limit, callback=callback, **opcoes)
 
         # Nenhum extractor encontrado
         plataformas_suportadas = [
             "Google Maps (maps.google.com)",
-            "Facebook (facebook.com) - em desenvolvimento",
+            "Facebook (facebook.com)",
             "LinkedIn (linkedin.com) - em desenvolvimento"
         ]
         mensagem = (
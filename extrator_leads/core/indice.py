@@ -0,0 +1,293 @@
+"""Índice SQLite dos leads exportados, para consultas sem carregar os CSVs."""
+
+import os
+import re
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from extrator_leads.core.manifesto import PADROES_EXPORTACAO
+
+NOME_INDICE = "indice_leads.db"
+
+# Campos cuja presença pode ser filtrada na consulta
+CAMPOS_PRESENCA = ("telefone", "email", "website", "place_id")
+
+# CSVs com estas colunas não são listas de leads (ex: arquivos delta)
+_COLUNAS_IGNORAR = ("mudanca",)
+
+_COLUNAS_LEAD = ("nome", "telefone", "email", "website", "fonte", "url_origem", "place_id")
+
+_TIMESTAMP_NOME = re.compile(r"(\d{8}_\d{6})")
+
+
+def _data_exportacao(arquivo: Path) -> float:
+    """Data da exportação: timestamp do nome do arquivo ou, na falta dele, o mtime."""
+    match = _TIMESTAMP_NOME.search(arquivo.name)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").timestamp()
+        except ValueError:
+            pass
+    return arquivo.stat().st_mtime
+
+
+class IndiceLeads:
+    """
+    Índice incremental dos CSVs de um diretório de saída.
+
+    O CSVExporter atualiza o índice a cada exportação; arquivos criados ou
+    alterados por fora (merge, edição manual) são reindexados na próxima
+    sincronização, comparando tamanho e data de modificação.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS arquivos (
+            nome TEXT PRIMARY KEY,
+            tamanho INTEGER NOT NULL,
+            modificado_em REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS leads (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            arquivo TEXT NOT NULL,
+            exportado_em REAL NOT NULL,
+            nome TEXT NOT NULL,
+            telefone TEXT,
+            email TEXT,
+            website TEXT,
+            dominio TEXT,
+            fonte TEXT,
+            url_origem TEXT,
+            place_id TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_leads_arquivo ON leads (arquivo);
+        CREATE INDEX IF NOT EXISTS idx_leads_fonte ON leads (fonte, exportado_em);
+        CREATE INDEX IF NOT EXISTS idx_leads_dominio ON leads (dominio);
+        CREATE INDEX IF NOT EXISTS idx_leads_exportado ON leads (exportado_em);
+    """
+
+    def __init__(self, output_dir: str = "data", tamanho_bloco: int = 50000):
+        """
+        Inicializa o índice do diretório.
+
+        Args:
+            output_dir: Diretório dos CSVs (o índice fica dentro dele)
+            tamanho_bloco: Linhas lidas por vez ao indexar um CSV
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.caminho = self.output_dir / NOME_INDICE
+        self.tamanho_bloco = tamanho_bloco
+        with closing(self._conectar()) as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _conectar(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.caminho, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _inserir(self, conn: sqlite3.Connection, arquivo: str, exportado_em: float, linhas: Iterable[dict]) -> None:
+        # Import local: merger depende do csv_exporter, que usa este módulo
+        from extrator_leads.core.merger import normalizar_dominio
+
+        conn.executemany(
+            "INSERT INTO leads (arquivo, exportado_em, nome, telefone, email, website, dominio, fonte, url_origem, place_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    arquivo,
+                    exportado_em,
+                    linha.get("nome"),
+                    linha.get("telefone") or None,
+                    linha.get("email") or None,
+                    linha.get("website") or None,
+                    normalizar_dominio(linha.get("website")),
+                    linha.get("fonte") or None,
+                    linha.get("url_origem") or None,
+                    linha.get("place_id") or None,
+                )
+                for linha in linhas
+                if linha.get("nome")
+            ]
+        )
+
+    def _registrar_arquivo(self, conn: sqlite3.Connection, arquivo: Path) -> None:
+        stat = arquivo.stat()
+        conn.execute(
+            "INSERT OR REPLACE INTO arquivos (nome, tamanho, modificado_em) VALUES (?, ?, ?)",
+            (arquivo.name, stat.st_size, stat.st_mtime)
+        )
+
+    def adicionar(
+        self,
+        caminho: str,
+        linhas: List[dict],
+        append: bool = False,
+        stat_anterior: Optional[os.stat_result] = None
+    ) -> None:
+        """
+        Indexa as linhas recém-exportadas para um arquivo.
+
+        No append, se o arquivo não estava indexado ou mudou desde a indexação
+        (o índice não corresponde a `stat_anterior`), ele é reindexado inteiro,
+        senão as linhas antigas ficariam fora do índice.
+
+        Args:
+            caminho: CSV gravado
+            linhas: Leads gravados (dicionários de Lead.to_dict)
+            append: Se as linhas foram acrescentadas (senão substituem as do arquivo)
+            stat_anterior: os.stat do arquivo antes do append (None se ele não existia)
+        """
+        arquivo = Path(caminho)
+        with closing(self._conectar()) as conn, conn:
+            em_dia = not append or self._indexado_como(conn, arquivo.name, stat_anterior)
+            if em_dia:
+                if not append:
+                    conn.execute("DELETE FROM leads WHERE arquivo = ?", (arquivo.name,))
+                self._inserir(conn, arquivo.name, _data_exportacao(arquivo), linhas)
+                self._registrar_arquivo(conn, arquivo)
+
+        if not em_dia:
+            self._indexar_arquivo(arquivo)
+
+    @staticmethod
+    def _indexado_como(conn: sqlite3.Connection, nome: str, stat: Optional[os.stat_result]) -> bool:
+        """Se o índice do arquivo corresponde a este os.stat (False se não indexado ou sem stat)."""
+        registrado = conn.execute("SELECT tamanho, modificado_em FROM arquivos WHERE nome = ?", (nome,)).fetchone()
+        return registrado is not None and stat is not None and tuple(registrado) == (stat.st_size, stat.st_mtime)
+
+    def _indexar_arquivo(self, arquivo: Path) -> None:
+        """(Re)indexa um CSV inteiro, lendo em blocos."""
+        with closing(self._conectar()) as conn, conn:
+            conn.execute("DELETE FROM leads WHERE arquivo = ?", (arquivo.name,))
+            exportado_em = _data_exportacao(arquivo)
+            try:
+                blocos = pd.read_csv(
+                    arquivo, chunksize=self.tamanho_bloco, dtype=str, keep_default_na=False, encoding="utf-8"
+                )
+                for bloco in blocos:
+                    if any(c in bloco.columns for c in _COLUNAS_IGNORAR) or "nome" not in bloco.columns:
+                        break
+                    colunas = [c for c in _COLUNAS_LEAD if c in bloco.columns]
+                    self._inserir(conn, arquivo.name, exportado_em, bloco[colunas].to_dict("records"))
+            except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError, OSError, ImportError):
+                pass  # Vazio, não é CSV de leads ou compressão indisponível: fica registrado sem linhas
+            self._registrar_arquivo(conn, arquivo)
+
+    def sincronizar(self) -> int:
+        """
+        Atualiza o índice com os CSVs novos, alterados ou removidos do diretório.
+
+        Returns:
+            Quantidade de arquivos reindexados
+        """
+        with closing(self._conectar()) as conn:
+            registrados = {
+                linha["nome"]: (linha["tamanho"], linha["modificado_em"])
+                for linha in conn.execute("SELECT nome, tamanho, modificado_em FROM arquivos")
+            }
+
+        presentes = {
+            arquivo.name: arquivo
+            for padrao in PADROES_EXPORTACAO
+            for arquivo in self.output_dir.glob(padrao)
+        }
+        reindexados = 0
+        for nome, arquivo in sorted(presentes.items()):
+            stat = arquivo.stat()
+            if registrados.get(nome) != (stat.st_size, stat.st_mtime):
+                self._indexar_arquivo(arquivo)
+                reindexados += 1
+
+        removidos = registrados.keys() - presentes.keys()
+        if removidos:
+            with closing(self._conectar()) as conn, conn:
+                for nome in removidos:
+                    conn.execute("DELETE FROM leads WHERE arquivo = ?", (nome,))
+                    conn.execute("DELETE FROM arquivos WHERE nome = ?", (nome,))
+
+        return reindexados
+
+    def reconstruir(self) -> int:
+        """
+        Descarta o índice e reindexa todos os CSVs do diretório.
+
+        Returns:
+            Quantidade de arquivos indexados
+        """
+        with closing(self._conectar()) as conn, conn:
+            conn.execute("DELETE FROM leads")
+            conn.execute("DELETE FROM arquivos")
+        return self.sincronizar()
+
+    def consultar(
+        self,
+        fonte: Optional[str] = None,
+        com: Iterable[str] = (),
+        sem: Iterable[str] = (),
+        nome: Optional[str] = None,
+        dominio: Optional[str] = None,
+        desde: Optional[datetime] = None,
+        ate: Optional[datetime] = None,
+        limite: Optional[int] = None
+    ) -> Iterator[dict]:
+        """
+        Consulta os leads indexados.
+
+        Args:
+            fonte: Fonte exata (ex: 'google_maps')
+            com: Campos que devem estar preenchidos
+            sem: Campos que devem estar vazios
+            nome: Trecho do nome (sem diferenciar maiúsculas)
+            dominio: Trecho do domínio do website
+            desde: Exportados a partir desta data
+            ate: Exportados até esta data
+            limite: Quantidade máxima de resultados
+
+        Yields:
+            Dicionários com os campos do lead, o arquivo e a data de exportação
+
+        Raises:
+            ValueError: Se um campo de presença for desconhecido
+        """
+        condicoes, parametros = [], []
+        for campo in [*com, *sem]:
+            if campo not in CAMPOS_PRESENCA:
+                raise ValueError(f"Campo desconhecido: {campo} (use {', '.join(CAMPOS_PRESENCA)})")
+        condicoes += [f"{campo} IS NOT NULL" for campo in com]
+        condicoes += [f"{campo} IS NULL" for campo in sem]
+
+        if fonte:
+            condicoes.append("fonte = ?")
+            parametros.append(fonte)
+        if nome:
+            condicoes.append("nome LIKE ?")
+            parametros.append(f"%{nome}%")
+        if dominio:
+            condicoes.append("dominio LIKE ?")
+            parametros.append(f"%{dominio.lower()}%")
+        if desde:
+            condicoes.append("exportado_em >= ?")
+            parametros.append(desde.timestamp())
+        if ate:
+            condicoes.append("exportado_em <= ?")
+            parametros.append(ate.timestamp())
+
+        sql = (
+            "SELECT nome, telefone, email, website, fonte, url_origem, place_id, arquivo, exportado_em FROM leads"
+            + (f" WHERE {' AND '.join(condicoes)}" if condicoes else "")
+            + " ORDER BY exportado_em DESC, id"
+        )
+        if limite:
+            sql += " LIMIT ?"
+            parametros.append(limite)
+
+        with closing(self._conectar()) as conn:
+            for linha in conn.execute(sql, parametros):
+                dados = dict(linha)
+                dados["exportado_em"] = datetime.fromtimestamp(dados["exportado_em"]).isoformat(timespec="seconds")
+                yield dados
@@ -0,0 +1,191 @@
+"""Manifesto das exportações de um diretório de saída."""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock entre processos
+    fcntl = None
+
+NOME_MANIFESTO = "manifest.json"
+
+# Arquivos de leads do diretório (CSV e segmentos comprimidos)
+PADROES_EXPORTACAO = ("*.csv", "*.csv.gz", "*.csv.zst")
+
+# Máximo de URLs de origem guardadas por arquivo
+MAX_URLS_ORIGEM = 20
+
+
+class ManifestoExportacoes:
+    """
+    Catálogo dos CSVs exportados (inclusive segmentos comprimidos), mantido em `manifest.json` no diretório.
+
+    Guarda por arquivo a quantidade de linhas, o tamanho, as fontes, as URLs
+    de origem e o período (primeira e última gravação), para que a listagem
+    não precise abrir nem inspecionar cada CSV. O arquivo é reescrito de
+    forma atômica e as atualizações são serializadas por um lock.
+    """
+
+    def __init__(self, output_dir: str = "data"):
+        """
+        Inicializa o manifesto do diretório.
+
+        Args:
+            output_dir: Diretório dos CSVs (o manifesto fica dentro dele)
+        """
+        self.output_dir = Path(output_dir)
+        self.caminho = self.output_dir / NOME_MANIFESTO
+
+    def ler(self) -> Dict[str, dict]:
+        """
+        Lê as entradas do manifesto.
+
+        Returns:
+            Metadados por nome de arquivo (vazio se o manifesto não existir)
+        """
+        try:
+            return json.loads(self.caminho.read_text(encoding="utf-8")).get("arquivos", {})
+        except (OSError, ValueError):
+            return {}
+
+    @contextmanager
+    def _atualizando(self) -> Iterator[Dict[str, dict]]:
+        """Lê, permite alterar e grava o manifesto sob lock exclusivo."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / f".{NOME_MANIFESTO}.lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            arquivos = self.ler()
+            yield arquivos
+            self._gravar(arquivos)
+
+    def _gravar(self, arquivos: Dict[str, dict]) -> None:
+        fd, temporario = tempfile.mkstemp(dir=self.output_dir, prefix=f".{NOME_MANIFESTO}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+                json.dump({"versao": 1, "arquivos": arquivos}, arquivo, ensure_ascii=False, indent=2)
+            os.replace(temporario, self.caminho)
+        except Exception:
+            Path(temporario).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _acumular(entrada: dict, linhas: List[dict]) -> None:
+        """Soma as linhas gravadas às contagens da entrada."""
+        entrada["linhas"] = entrada.get("linhas", 0) + len(linhas)
+        fontes = entrada.setdefault("fontes", {})
+        urls = entrada.setdefault("urls_origem", [])
+        for linha in linhas:
+            fonte = linha.get("fonte") or "desconhecida"
+            fontes[fonte] = fontes.get(fonte, 0) + 1
+            url = linha.get("url_origem")
+            if url and url not in urls and len(urls) < MAX_URLS_ORIGEM:
+                urls.append(url)
+
+    def registrar(self, caminho: str, linhas: List[dict], append: bool = False) -> None:
+        """
+        Registra uma exportação recém-gravada.
+
+        Args:
+            caminho: CSV gravado
+            linhas: Leads gravados (dicionários de Lead.to_dict)
+            append: Se as linhas foram acrescentadas a um arquivo existente
+        """
+        arquivo = Path(caminho)
+        agora = datetime.now().isoformat(timespec="seconds")
+        with self._atualizando() as arquivos:
+            entrada = arquivos.get(arquivo.name) if append else None
+            if entrada is None and append:
+                # Append a um arquivo fora do manifesto: as linhas novas já estão
+                # nele, então a contagem vem da leitura do arquivo inteiro
+                entrada = self._ler_arquivo(arquivo)
+            elif entrada is None:
+                entrada = {"criado_em": agora}
+                self._acumular(entrada, linhas)
+            else:
+                self._acumular(entrada, linhas)
+            stat = arquivo.stat()
+            entrada["atualizado_em"] = agora
+            entrada["bytes"] = stat.st_size
+            entrada["mtime"] = stat.st_mtime
+            arquivos[arquivo.name] = entrada
+
+    def registrar_arquivo(self, caminho: str, tamanho_bloco: int = 50000) -> None:
+        """
+        Registra um CSV gravado por fora do exportador, lendo-o em blocos.
+
+        Args:
+            caminho: CSV a registrar
+            tamanho_bloco: Linhas lidas por vez
+        """
+        arquivo = Path(caminho)
+        entrada = self._ler_arquivo(arquivo, tamanho_bloco)
+        with self._atualizando() as arquivos:
+            anterior = arquivos.get(arquivo.name)
+            if anterior and "criado_em" in anterior:
+                entrada["criado_em"] = anterior["criado_em"]
+            arquivos[arquivo.name] = entrada
+
+    def _ler_arquivo(self, arquivo: Path, tamanho_bloco: int = 50000) -> dict:
+        """Monta a entrada de um CSV lendo-o inteiro, em blocos."""
+        stat = arquivo.stat()
+        entrada = {"criado_em": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds")}
+        entrada["atualizado_em"] = entrada["criado_em"]
+        self._acumular(entrada, [])
+        try:
+            for bloco in pd.read_csv(arquivo, chunksize=tamanho_bloco, dtype=str, keep_default_na=False):
+                colunas = [c for c in ("fonte", "url_origem") if c in bloco.columns]
+                self._acumular(entrada, bloco[colunas].to_dict("records"))
+        except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError, OSError, ImportError):
+            pass
+        entrada["bytes"] = stat.st_size
+        entrada["mtime"] = stat.st_mtime
+        return entrada
+
+    @staticmethod
+    def _alterado(entrada: dict, stat: os.stat_result) -> bool:
+        """Se o arquivo mudou desde o registro (tamanho ou data de modificação)."""
+        # Entradas antigas não guardavam a data de modificação
+        return entrada.get("bytes") != stat.st_size or entrada.get("mtime", stat.st_mtime) != stat.st_mtime
+
+    def catalogo(self, atualizar: bool = False) -> List[dict]:
+        """
+        Lista os CSVs do diretório com seus metadados, do mais recente ao mais antigo.
+
+        Arquivos fora do manifesto aparecem sem metadados (ou são registrados,
+        com `atualizar`); entradas de arquivos apagados são ignoradas.
+
+        Args:
+            atualizar: Registra os arquivos ausentes ou alterados e remove os apagados
+
+        Returns:
+            Lista de dicionários com 'arquivo' e os metadados conhecidos
+        """
+        nomes = sorted(
+            (p.name for padrao in PADROES_EXPORTACAO for p in self.output_dir.glob(padrao)),
+            reverse=True
+        )
+        entradas = self.ler()
+
+        if atualizar:
+            for nome in nomes:
+                entrada = entradas.get(nome)
+                caminho = self.output_dir / nome
+                if entrada is None or self._alterado(entrada, caminho.stat()):
+                    self.registrar_arquivo(str(caminho))
+            apagados = entradas.keys() - set(nomes)
+            if apagados:
+                with self._atualizando() as arquivos:
+                    for nome in apagados:
+                        arquivos.pop(nome, None)
+            entradas = self.ler()
+
+        return [{"arquivo": nome, **entradas.get(nome, {})} for nome in nomes]
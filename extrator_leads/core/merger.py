@@ -0,0 +1,254 @@
+"""Consolidação de exportações CSV com deduplicação entre execuções."""
+
+import os
+import re
+import sqlite3
+import tempfile
+import unicodedata
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import pandas as pd
+from pydantic import BaseModel
+
+from extrator_leads.core.csv_exporter import COLUNAS
+
+COLUNA_ORIGEM = "arquivo_origem"
+
+# CSVs com estas colunas não são listas de leads (ex: arquivos delta, com os removidos)
+COLUNAS_IGNORAR = ("mudanca",)
+
+# Domínios compartilhados por muitos estabelecimentos (não identificam um lead)
+DOMINIOS_GENERICOS = (
+    "facebook.com",
+    "instagram.com",
+    "wa.me",
+    "whatsapp.com",
+    "linktr.ee",
+    "google.com",
+    "linkedin.com",
+)
+
+
+class ResumoMerge(BaseModel):
+    """Resultado da consolidação."""
+
+    caminho: str
+    arquivos: int = 0
+    lidos: int = 0
+    gravados: int = 0
+    duplicados: int = 0
+    invalidos: int = 0
+    ignorados: List[str] = []
+
+
+def normalizar_telefone(telefone: Optional[str]) -> Optional[str]:
+    """Reduz o telefone aos dígitos, sem DDI 55 e zeros à esquerda."""
+    digitos = re.sub(r"\D", "", telefone or "")
+    if digitos.startswith("55") and len(digitos) >= 12:
+        digitos = digitos[2:]
+    digitos = digitos.lstrip("0")
+    return digitos if len(digitos) >= 8 else None
+
+
+def normalizar_dominio(website: Optional[str]) -> Optional[str]:
+    """Extrai o domínio do website (sem 'www.'), ignorando domínios genéricos."""
+    if not website:
+        return None
+    if "://" not in website:
+        website = f"http://{website}"
+    try:
+        host = (urlparse(website).hostname or "").lower()
+    except ValueError:
+        return None
+    if host.startswith("www."):
+        host = host[4:]
+    if not host or any(host == d or host.endswith(f".{d}") for d in DOMINIOS_GENERICOS):
+        return None
+    return host
+
+
+def normalizar_nome(nome: Optional[str]) -> Optional[str]:
+    """Normaliza o nome: sem acentos, minúsculo e só com letras e dígitos."""
+    if not nome:
+        return None
+    sem_acento = unicodedata.normalize("NFKD", nome).encode("ascii", "ignore").decode()
+    normalizado = " ".join(re.sub(r"[^0-9a-z]+", " ", sem_acento.casefold()).split())
+    return normalizado or None
+
+
+def chaves_lead(linha: dict) -> List[str]:
+    """
+    Calcula as chaves de deduplicação de um lead.
+
+    Dois leads são o mesmo se compartilharem qualquer uma das chaves:
+    telefone, domínio do website ou nome + fonte.
+
+    Args:
+        linha: Linha do CSV como dicionário
+
+    Returns:
+        Lista de chaves (vazia se o lead não tiver nome)
+    """
+    nome = normalizar_nome(linha.get("nome"))
+    if not nome:
+        return []
+
+    chaves = [f"nome:{linha.get('fonte') or ''}:{nome}"]
+    telefone = normalizar_telefone(linha.get("telefone"))
+    if telefone:
+        chaves.append(f"tel:{telefone}")
+    dominio = normalizar_dominio(linha.get("website"))
+    if dominio:
+        chaves.append(f"dom:{dominio}")
+    return chaves
+
+
+class ConjuntoChaves:
+    """Conjunto de chaves em disco (SQLite), com memória limitada."""
+
+    def __init__(self, caminho: str):
+        """
+        Inicializa o conjunto.
+
+        Args:
+            caminho: Arquivo SQLite do conjunto
+        """
+        self._conexao = sqlite3.connect(caminho)
+        self._conexao.execute("PRAGMA journal_mode=OFF")
+        self._conexao.execute("PRAGMA synchronous=OFF")
+        self._conexao.execute("CREATE TABLE IF NOT EXISTS chaves (chave TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def contem_alguma(self, chaves: List[str]) -> bool:
+        """Verifica se alguma das chaves já foi vista."""
+        marcadores = ",".join("?" * len(chaves))
+        cursor = self._conexao.execute(f"SELECT 1 FROM chaves WHERE chave IN ({marcadores}) LIMIT 1", chaves)
+        return cursor.fetchone() is not None
+
+    def adicionar(self, chaves: List[str]) -> None:
+        """Adiciona as chaves ao conjunto."""
+        self._conexao.executemany("INSERT OR IGNORE INTO chaves (chave) VALUES (?)", [(c,) for c in chaves])
+
+    def confirmar(self) -> None:
+        """Confirma as inserções pendentes."""
+        self._conexao.commit()
+
+    def fechar(self) -> None:
+        """Fecha a conexão."""
+        self._conexao.close()
+
+
+class MescladorLeads:
+    """
+    Consolida vários CSVs de leads em um único arquivo sem duplicatas.
+
+    Os arquivos são lidos em blocos e as chaves já vistas ficam em um
+    conjunto em disco, então a memória não cresce com o histórico. Quando
+    há duplicatas, vence a primeira ocorrência na ordem dos arquivos.
+    """
+
+    def __init__(self, tamanho_bloco: int = 50000, diretorio_temporario: Optional[str] = None):
+        """
+        Inicializa o mesclador.
+
+        Args:
+            tamanho_bloco: Linhas lidas por vez de cada CSV
+            diretorio_temporario: Onde criar o conjunto de chaves (padrão: temporário do sistema)
+        """
+        self.tamanho_bloco = tamanho_bloco
+        self.diretorio_temporario = diretorio_temporario
+
+    def mesclar(
+        self,
+        arquivos: Iterable[str],
+        destino: str,
+        callback: Optional[Callable[[str], None]] = None
+    ) -> ResumoMerge:
+        """
+        Mescla os arquivos em `destino`, com a coluna de procedência.
+
+        Args:
+            arquivos: CSVs a consolidar, em ordem de prioridade
+            destino: Caminho do CSV consolidado
+            callback: Função para reportar progresso (opcional)
+
+        Returns:
+            Resumo da consolidação
+        """
+        destino_path = Path(destino)
+        destino_path.parent.mkdir(parents=True, exist_ok=True)
+        resumo = ResumoMerge(caminho=str(destino_path))
+        colunas = COLUNAS + [COLUNA_ORIGEM]
+
+        with tempfile.TemporaryDirectory(dir=self.diretorio_temporario) as temporario:
+            conjunto = ConjuntoChaves(str(Path(temporario) / "chaves.db"))
+            # Grava em arquivo parcial e só substitui o destino ao final
+            parcial = destino_path.with_name(f".{destino_path.name}.part")
+            try:
+                pd.DataFrame(columns=colunas).to_csv(parcial, index=False, encoding="utf-8")
+                for arquivo in arquivos:
+                    if Path(arquivo).resolve() == destino_path.resolve():
+                        continue
+                    if not self._eh_lista_de_leads(Path(arquivo)):
+                        resumo.ignorados.append(Path(arquivo).name)
+                        continue
+                    resumo.arquivos += 1
+                    if callback:
+                        callback(f"Lendo {Path(arquivo).name}...")
+                    self._mesclar_arquivo(Path(arquivo), conjunto, parcial, colunas, resumo)
+                os.replace(parcial, destino_path)
+            finally:
+                conjunto.fechar()
+                parcial.unlink(missing_ok=True)
+
+        return resumo
+
+    @staticmethod
+    def _eh_lista_de_leads(arquivo: Path) -> bool:
+        """Se o CSV é uma lista de leads (tem 'nome' e não é um delta)."""
+        colunas = pd.read_csv(arquivo, nrows=0, encoding="utf-8").columns
+        return "nome" in colunas and not any(c in colunas for c in COLUNAS_IGNORAR)
+
+    def _mesclar_arquivo(
+        self,
+        arquivo: Path,
+        conjunto: ConjuntoChaves,
+        parcial: Path,
+        colunas: List[str],
+        resumo: ResumoMerge
+    ) -> None:
+        blocos = pd.read_csv(
+            arquivo,
+            chunksize=self.tamanho_bloco,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8"
+        )
+        for bloco in blocos:
+            resumo.lidos += len(bloco)
+            for coluna in colunas:
+                if coluna not in bloco.columns:
+                    bloco[coluna] = ""
+            # Arquivos já consolidados mantêm a procedência original
+            bloco[COLUNA_ORIGEM] = bloco[COLUNA_ORIGEM].where(bloco[COLUNA_ORIGEM] != "", arquivo.name)
+
+            manter = []
+            for linha in bloco[colunas].to_dict("records"):
+                chaves = chaves_lead(linha)
+                if not chaves:
+                    resumo.invalidos += 1
+                    continue
+                if conjunto.contem_alguma(chaves):
+                    resumo.duplicados += 1
+                else:
+                    manter.append(linha)
+                # Registra todas as chaves para que variações do mesmo lead também sejam descartadas
+                conjunto.adicionar(chaves)
+            conjunto.confirmar()
+
+            if manter:
+                pd.DataFrame(manter, columns=colunas).to_csv(
+                    parcial, mode="a", header=False, index=False, encoding="utf-8"
+                )
+                resumo.gravados += len(manter)
@@ -14,6 +14,8 @@ class Lead(BaseModel):
     telefone: Optional[str] = None
     fonte: str  # google_maps, facebook, linkedin
     url_origem: str
+    place_id: Optional[str] = None  # identificador estável na plataforma (ex: ID do lugar no Maps)
+    email_status: Optional[str] = None  # valido, sem_mx, dominio_inexistente ou erro (se verificado)
 
     @field_validator('telefone')
     @classmethod
@@ -48,7 +50,9 @@ class Lead(BaseModel):
             'website': str(self.website) if self.website else None,
             'telefone': self.telefone,
             'fonte': self.fonte,
-            'url_origem': self.url_origem
+            'url_origem': self.url_origem,
+            'place_id': self.place_id,
+            'email_status': self.email_status
         }
         return data
 
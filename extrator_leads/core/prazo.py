@@ -0,0 +1,87 @@
+"""Orçamento de tempo de uma extração."""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class Prazo:
+    """
+    Prazo de uma extração com orçamento de tempo fixo.
+
+    Parte do orçamento (`reserva`) fica guardada para exportar os leads e
+    fechar o navegador; o restante é o tempo disponível para o trabalho.
+    Os extractors consultam o prazo para planejar as etapas e registram em
+    `pulos` o que deixaram de fazer por falta de tempo.
+    """
+
+    # Fração final do orçamento em que os fallbacks lentos são evitados
+    FRACAO_APERTADO = 0.2
+
+    def __init__(
+        self,
+        segundos: float,
+        reserva: Optional[float] = None,
+        relogio: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicia a contagem do prazo.
+
+        Args:
+            segundos: Orçamento total de tempo
+            reserva: Segundos guardados para exportar e encerrar (padrão: 5% do orçamento, entre 2 e 15s)
+            relogio: Fonte de tempo (injetável para testes)
+
+        Raises:
+            ValueError: Se o orçamento não for positivo
+        """
+        if segundos <= 0:
+            raise ValueError("O orçamento de tempo precisa ser positivo")
+
+        self.segundos = segundos
+        self.reserva = reserva if reserva is not None else min(max(segundos * 0.05, 2.0), 15.0)
+        self.relogio = relogio
+        self.inicio = relogio()
+        self.pulos: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def decorrido(self) -> float:
+        """Segundos desde o início do prazo."""
+        return self.relogio() - self.inicio
+
+    def restante(self) -> float:
+        """Segundos até o fim do orçamento (sem descontar a reserva)."""
+        return max(self.segundos - self.decorrido(), 0.0)
+
+    def disponivel(self) -> float:
+        """Segundos ainda disponíveis para o trabalho (descontada a reserva)."""
+        return max(self.restante() - self.reserva, 0.0)
+
+    @property
+    def esgotado(self) -> bool:
+        """Indica se o tempo de trabalho acabou."""
+        return self.disponivel() <= 0
+
+    @property
+    def apertado(self) -> bool:
+        """Indica se o prazo está no trecho final, em que etapas lentas devem ser puladas."""
+        return self.disponivel() < self.segundos * self.FRACAO_APERTADO
+
+    def limitar_ms(self, timeout_ms: int) -> int:
+        """Limita um timeout do Playwright (em ms) ao tempo disponível."""
+        return max(min(timeout_ms, int(self.disponivel() * 1000)), 1)
+
+    def registrar_pulo(self, etapa: str, quantidade: int = 1) -> None:
+        """
+        Registra uma etapa deixada de lado por falta de tempo.
+
+        Args:
+            etapa: Descrição da etapa (ex: 'estabelecimentos não extraídos')
+            quantidade: Quantas vezes a etapa foi pulada
+        """
+        with self._lock:
+            self.pulos[etapa] = self.pulos.get(etapa, 0) + quantidade
+
+    def resumo(self) -> List[str]:
+        """Linhas descrevendo o que foi pulado (vazia se nada foi)."""
+        return [f"{etapa}: {quantidade}" for etapa, quantidade in self.pulos.items()]
@@ -0,0 +1,97 @@
+"""Perfilamento de execuções de extração (cProfile e trace do Playwright)."""
+
+import cProfile
+import io
+import pstats
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Arquivo onde ficam os métodos síncronos da API do Playwright (page.goto, page.click, ...)
+_ARQUIVO_API_PLAYWRIGHT = "sync_api/_generated.py"
+
+
+class ProfilerExtracao:
+    """Captura o perfil Python de uma extração e gera um resumo dos pontos quentes."""
+
+    def __init__(self, output_dir: str = "data", trace: bool = False, prefixo: str = None):
+        """
+        Inicializa o profiler.
+
+        Args:
+            output_dir: Diretório onde os arquivos de perfil serão salvos
+            trace: Se True, também define o caminho para o trace do Playwright
+            prefixo: Prefixo dos arquivos (padrão: profile_<timestamp>)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        prefixo = prefixo or f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.caminho_stats = self.output_dir / f"{prefixo}.prof"
+        self.caminho_resumo = self.output_dir / f"{prefixo}.txt"
+        self.caminho_trace = self.output_dir / f"{prefixo}_trace.zip" if trace else None
+
+        self._profile = cProfile.Profile()
+        self._stats: Optional[pstats.Stats] = None
+
+    def __enter__(self) -> "ProfilerExtracao":
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._profile.disable()
+        self._salvar()
+
+    def _salvar(self) -> None:
+        """Grava as estatísticas (formato pstats) e o relatório em texto."""
+        self._profile.dump_stats(str(self.caminho_stats))
+        self._stats = pstats.Stats(self._profile)
+
+        saida = io.StringIO()
+        pstats.Stats(self._profile, stream=saida).sort_stats("cumulative").print_stats(40)
+        self.caminho_resumo.write_text(saida.getvalue(), encoding="utf-8")
+
+    def _entradas(self) -> List[Tuple[str, str, str, int, float, float]]:
+        """Retorna (nome, função, arquivo, chamadas, tempo próprio, tempo acumulado) de cada entrada."""
+        if self._stats is None:
+            return []
+
+        entradas = []
+        for (arquivo, linha, funcao), (_, chamadas, tt, ct, _) in self._stats.stats.items():
+            if arquivo == "~":
+                nome = funcao  # built-ins, ex: <method 'recv' of '_socket.socket' objects>
+            else:
+                nome = f"{Path(arquivo).name}:{linha}({funcao})"
+            entradas.append((nome, funcao, arquivo, chamadas, tt, ct))
+        return entradas
+
+    def funcoes_quentes(self, top: int = 10) -> List[Tuple[str, int, float]]:
+        """
+        Retorna as funções com maior tempo próprio.
+
+        Args:
+            top: Quantidade de funções
+
+        Returns:
+            Lista de (função, chamadas, tempo próprio em segundos)
+        """
+        entradas = sorted(self._entradas(), key=lambda e: e[4], reverse=True)
+        return [(nome, chamadas, tt) for nome, _, _, chamadas, tt, _ in entradas[:top]]
+
+    def operacoes_pagina(self, top: int = 10) -> List[Tuple[str, int, float]]:
+        """
+        Retorna as operações da API do Playwright com maior tempo acumulado.
+
+        Args:
+            top: Quantidade de operações
+
+        Returns:
+            Lista de (operação, chamadas, tempo acumulado em segundos)
+        """
+        entradas = [
+            (funcao, chamadas, ct)
+            for _, funcao, arquivo, chamadas, _, ct in self._entradas()
+            if arquivo.replace("\\", "/").endswith(_ARQUIVO_API_PLAYWRIGHT)
+        ]
+        entradas.sort(key=lambda e: e[2], reverse=True)
+        return entradas[:top]
@@ -0,0 +1,123 @@
+"""Fila de retentativas para estabelecimentos cuja extração falhou."""
+
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class FalhaExtracao(BaseModel):
+    """Estabelecimento cuja extração falhou."""
+
+    url: str
+    motivo: str
+    tentativas: int = 1
+
+
+class FilaRetentativas:
+    """
+    Acumula as URLs que falharam e as reprocessa ao final, com backoff exponencial.
+
+    Cada rodada espera `espera_inicial * fator ** (rodada - 1)` segundos
+    (limitado a `espera_maxima`) e tenta novamente todas as URLs pendentes.
+    As que continuarem falhando após `max_tentativas` rodadas ficam em `falhas`.
+    """
+
+    def __init__(
+        self,
+        max_tentativas: int = 2,
+        espera_inicial: float = 2.0,
+        fator: float = 2.0,
+        espera_maxima: float = 30.0,
+        dormir: Callable[[float], None] = time.sleep
+    ):
+        """
+        Inicializa a fila.
+
+        Args:
+            max_tentativas: Quantidade de rodadas de retentativa
+            espera_inicial: Espera antes da primeira rodada (segundos)
+            fator: Multiplicador da espera a cada rodada
+            espera_maxima: Espera máxima entre rodadas (segundos)
+            dormir: Função de espera (substituível em testes)
+        """
+        self.max_tentativas = max_tentativas
+        self.espera_inicial = espera_inicial
+        self.fator = fator
+        self.espera_maxima = espera_maxima
+        self._dormir = dormir
+        self._pendentes: Dict[str, FalhaExtracao] = {}
+        self.falhas: List[FalhaExtracao] = []
+        # Se o processamento parou porque a espera não cabia no tempo disponível
+        self.sem_tempo = False
+
+    def __len__(self) -> int:
+        return len(self._pendentes)
+
+    def registrar(self, url: str, motivo: str) -> None:
+        """
+        Registra a falha de uma URL (ou atualiza o motivo, se já registrada).
+
+        Args:
+            url: URL do estabelecimento
+            motivo: Descrição do erro
+        """
+        falha = self._pendentes.get(url)
+        if falha:
+            falha.motivo = motivo
+            falha.tentativas += 1
+        else:
+            self._pendentes[url] = FalhaExtracao(url=url, motivo=motivo)
+
+    def espera(self, rodada: int) -> float:
+        """Retorna a espera antes da rodada informada (começando em 1)."""
+        return min(self.espera_inicial * self.fator ** (rodada - 1), self.espera_maxima)
+
+    def processar(
+        self,
+        funcao: Callable[[str], T],
+        deve_parar: Optional[Callable[[], bool]] = None,
+        callback=None,
+        tempo_disponivel: Optional[Callable[[], float]] = None
+    ) -> List[T]:
+        """
+        Reprocessa as URLs pendentes até esgotar as rodadas.
+
+        Args:
+            funcao: Função que extrai uma URL; deve lançar exceção em caso de falha
+            deve_parar: Função que indica se o processamento deve ser interrompido
+            callback: Função para reportar progresso (opcional)
+            tempo_disponivel: Segundos restantes (ex: de um prazo); a rodada cuja
+                espera não couber nele é pulada em vez de dormir até o fim
+
+        Returns:
+            Resultados das URLs recuperadas, na ordem em que foram obtidos
+        """
+        resultados = []
+
+        for rodada in range(1, self.max_tentativas + 1):
+            if not self._pendentes or (deve_parar and deve_parar()):
+                break
+
+            espera = self.espera(rodada)
+            if tempo_disponivel is not None and espera >= tempo_disponivel():
+                self.sem_tempo = True
+                if callback:
+                    callback(f"Retentativa {rodada}/{self.max_tentativas} pulada: a espera de {espera:.1f}s não cabe no tempo restante")
+                break
+            if callback:
+                callback(f"Retentativa {rodada}/{self.max_tentativas}: {len(self._pendentes)} pendente(s), aguardando {espera:.1f}s...")
+            self._dormir(espera)
+
+            for url in list(self._pendentes):
+                if deve_parar and deve_parar():
+                    break
+                try:
+                    resultados.append(funcao(url))
+                    del self._pendentes[url]
+                except Exception as e:
+                    self.registrar(url, str(e))
+
+        self.falhas = list(self._pendentes.values())
+        return resultados
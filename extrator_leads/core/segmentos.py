@@ -0,0 +1,155 @@
+"""Exportação em segmentos comprimidos e rotacionados para execuções longas."""
+
+import csv
+import gzip
+import io
+import os
+import re
+from pathlib import Path
+from typing import List, Optional
+
+from extrator_leads.core.csv_exporter import COLUNAS
+from extrator_leads.core.manifesto import ManifestoExportacoes
+from extrator_leads.core.models import Lead
+
+try:
+    import zstandard
+except ImportError:  # zstd é opcional
+    zstandard = None
+
+COMPRESSOES = {None: ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+SUFIXO_PARCIAL = ".part"
+
+
+class EscritorSegmentos:
+    """
+    Grava leads em arquivos CSV sequenciais, opcionalmente comprimidos.
+
+    O segmento em andamento é gravado com o sufixo `.part` e só recebe o
+    nome final (`leads_0001.csv.gz`, ...) quando é fechado, por rotação
+    (linhas ou bytes) ou no fim da execução. Assim outros processos podem
+    consumir os segmentos prontos enquanto a coleta continua.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "data",
+        prefixo: str = "leads",
+        compressao: Optional[str] = "gzip",
+        max_linhas: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        callback=None
+    ):
+        """
+        Inicializa o escritor (o primeiro segmento só é criado no primeiro lead).
+
+        Args:
+            output_dir: Diretório dos segmentos
+            prefixo: Prefixo dos nomes dos segmentos
+            compressao: 'gzip', 'zstd' ou None (CSV sem compressão)
+            max_linhas: Rotaciona o segmento ao atingir esta quantidade de leads
+            max_bytes: Rotaciona o segmento ao atingir este tamanho em disco
+            callback: Função chamada com o caminho de cada segmento finalizado (opcional)
+
+        Raises:
+            ValueError: Se a compressão for desconhecida ou o zstandard não estiver instalado
+        """
+        if compressao not in COMPRESSOES:
+            raise ValueError(f"Compressão inválida: {compressao} (use gzip ou zstd)")
+        if compressao == "zstd" and zstandard is None:
+            raise ValueError("Compressão zstd requer o pacote 'zstandard' (pip install zstandard)")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.prefixo = prefixo
+        self.compressao = compressao
+        self.extensao = COMPRESSOES[compressao]
+        self.max_linhas = max_linhas
+        self.max_bytes = max_bytes
+        self.callback = callback
+        self.segmentos: List[str] = []
+        self.total = 0
+        self._numero = self._ultimo_numero()
+        self._bruto = None
+        self._saida = None
+        self._escritor = None
+        self._linhas: List[dict] = []
+
+    def _ultimo_numero(self) -> int:
+        """Maior número de segmento já existente com o mesmo prefixo (para não sobrescrever)."""
+        padrao = re.compile(rf"^{re.escape(self.prefixo)}_(\d+){re.escape(self.extensao)}$")
+        numeros = [int(m.group(1)) for p in self.output_dir.iterdir() if (m := padrao.match(p.name))]
+        return max(numeros, default=0)
+
+    def _caminho_final(self) -> Path:
+        return self.output_dir / f"{self.prefixo}_{self._numero:04d}{self.extensao}"
+
+    def _abrir(self) -> None:
+        self._numero += 1
+        parcial = self._caminho_final().with_name(self._caminho_final().name + SUFIXO_PARCIAL)
+        self._bruto = open(parcial, "wb")
+        if self.compressao == "gzip":
+            binario = gzip.GzipFile(fileobj=self._bruto, mode="wb")
+        elif self.compressao == "zstd":
+            binario = zstandard.ZstdCompressor().stream_writer(self._bruto, closefd=False)
+        else:
+            binario = self._bruto
+        # write_through: cada linha vai direto ao compressor, para medir o tamanho em disco
+        self._saida = io.TextIOWrapper(binario, encoding="utf-8", newline="", write_through=True)
+        self._escritor = csv.DictWriter(self._saida, fieldnames=COLUNAS)
+        self._escritor.writeheader()
+        self._linhas = []
+
+    def _precisa_rotacionar(self) -> bool:
+        if self.max_linhas and len(self._linhas) >= self.max_linhas:
+            return True
+        # Tamanho já comprimido (o que ainda está no buffer do compressor fica de fora)
+        return bool(self.max_bytes and self._bruto.tell() >= self.max_bytes)
+
+    def _finalizar(self) -> None:
+        """Fecha o segmento atual e o publica com o nome final."""
+        if self._saida is None:
+            return
+
+        parcial = Path(self._bruto.name)
+        self._saida.close()
+        if not self._bruto.closed:
+            self._bruto.close()
+        final = self._caminho_final()
+        os.replace(parcial, final)
+
+        ManifestoExportacoes(str(self.output_dir)).registrar(str(final), self._linhas)
+        self.segmentos.append(str(final))
+        self._saida = self._bruto = self._escritor = None
+        if self.callback:
+            self.callback(str(final))
+
+    def escrever(self, lead: Lead) -> None:
+        """
+        Acrescenta um lead ao segmento atual, rotacionando se necessário.
+
+        Args:
+            lead: Lead a gravar
+        """
+        if self._saida is None:
+            self._abrir()
+
+        dados = lead.to_dict()
+        self._escritor.writerow(dados)
+        self._linhas.append({"fonte": dados["fonte"], "url_origem": dados["url_origem"]})
+        self.total += 1
+
+        if self._precisa_rotacionar():
+            self._finalizar()
+
+    def fechar(self) -> None:
+        """Finaliza o último segmento (se houver leads nele)."""
+        self._finalizar()
+
+    def __enter__(self) -> "EscritorSegmentos":
+        return self
+
+    def __exit__(self, *args) -> None:
+        # Mesmo com erro na extração, os leads já gravados são publicados
+        self.fechar()
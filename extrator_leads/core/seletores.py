@@ -0,0 +1,254 @@
+"""Resolvedor adaptativo de seletores CSS com estatísticas de acerto."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock entre processos
+    fcntl = None
+
+T = TypeVar("T")
+
+CAMINHO_PADRAO = Path.home() / ".cache" / "extrator-leads" / "seletores.json"
+
+
+class ResolvedorSeletores:
+    """
+    Tenta os seletores candidatos de cada campo, registrando qual deles funcionou.
+
+    Os candidatos são reordenados pela taxa de acerto (com suavização que
+    favorece a ordem declarada enquanto há poucos dados), o que reduz as
+    consultas desperdiçadas no navegador. Campos opcionais ficam na ordem
+    declarada (`ordem_fixa`): sem valor na página, um fallback genérico
+    acertaria mais que o primário e passaria à frente dele. As estatísticas
+    são persistidas em JSON, somando as de execuções concorrentes, e permitem
+    detectar quando o seletor primário de um campo para de funcionar (ex:
+    mudança no markup do Google).
+    """
+
+    def __init__(
+        self,
+        seletores: Dict[str, List[str]],
+        caminho: Optional[str] = None,
+        janela: int = 50,
+        min_amostras: int = 10,
+        ordem_fixa: Iterable[str] = ()
+    ):
+        """
+        Inicializa o resolvedor.
+
+        Args:
+            seletores: Candidatos por campo, na ordem declarada (o primeiro é o primário)
+            caminho: Arquivo JSON das estatísticas (None = apenas em memória)
+            janela: Quantidade de resultados recentes considerados nos alertas
+            min_amostras: Amostras recentes mínimas antes de emitir alertas
+            ordem_fixa: Campos cujos seletores são sempre tentados na ordem declarada
+        """
+        self.seletores = seletores
+        self.caminho = Path(caminho) if caminho else None
+        self.janela = janela
+        self.min_amostras = min_amostras
+        self.ordem_fixa = set(ordem_fixa)
+        self._estatisticas: Optional[Dict[str, dict]] = None
+        # Resultados ainda não gravados, somados ao arquivo no salvar()
+        self._pendentes: Dict[str, dict] = {}
+
+    @property
+    def estatisticas(self) -> Dict[str, dict]:
+        """Estatísticas por campo (carregadas do disco na primeira consulta)."""
+        if self._estatisticas is None:
+            self._estatisticas = self._carregar()
+        return self._estatisticas
+
+    def _carregar(self) -> Dict[str, dict]:
+        if self.caminho and self.caminho.exists():
+            try:
+                return json.loads(self.caminho.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _campo(self, campo: str, estatisticas: Optional[Dict[str, dict]] = None) -> dict:
+        estatisticas = self.estatisticas if estatisticas is None else estatisticas
+        dados = estatisticas.setdefault(campo, {"consultas": 0, "recentes": [], "seletores": {}})
+        for seletor in self.seletores.get(campo, []):
+            dados["seletores"].setdefault(seletor, {"acertos": 0, "tentativas": 0, "recentes": []})
+        return dados
+
+    def _adicionar_recente(self, lista: list, valor: int) -> None:
+        lista.append(valor)
+        del lista[:-self.janela]
+
+    def candidatos(self, campo: str) -> List[str]:
+        """
+        Retorna os seletores do campo ordenados pela taxa de acerto.
+
+        Args:
+            campo: Nome do campo (ex: 'name')
+
+        Returns:
+            Seletores do mais ao menos provável
+        """
+        declarados = self.seletores.get(campo, [])
+        if campo in self.ordem_fixa:
+            return list(declarados)
+        stats = self._campo(campo)["seletores"]
+
+        def taxa(seletor: str) -> float:
+            s = stats[seletor]
+            return (s["acertos"] + 1) / (s["tentativas"] + 2)
+
+        # sorted é estável: empates mantêm a ordem declarada
+        return sorted(declarados, key=taxa, reverse=True)
+
+    def resolver(self, campo: str, consulta: Callable[[str], Optional[T]]) -> Optional[T]:
+        """
+        Tenta os seletores do campo até a consulta retornar um valor.
+
+        Args:
+            campo: Nome do campo
+            consulta: Função que recebe um seletor e retorna o valor (ou None se não achou)
+
+        Returns:
+            Primeiro valor encontrado ou None
+        """
+        for seletor in self.candidatos(campo):
+            try:
+                valor = consulta(seletor)
+            except Exception:
+                valor = None
+
+            if valor is not None:
+                self._registrar(campo, seletor, 1)
+                return valor
+            self._registrar(campo, seletor, 0)
+
+        self._registrar(campo, None, 0)
+        return None
+
+    def _registrar(self, campo: str, seletor: Optional[str], acerto: int) -> None:
+        """Registra a tentativa de um seletor (ou, sem seletor, a consulta vazia) em memória e nos pendentes."""
+        for estatisticas in (self.estatisticas, self._pendentes):
+            dados = self._campo(campo, estatisticas)
+            if seletor is not None:
+                stats = dados["seletores"][seletor]
+                stats["tentativas"] += 1
+                stats["acertos"] += acerto
+                self._adicionar_recente(stats["recentes"], acerto)
+            if seletor is None or acerto:
+                dados["consultas"] += 1
+                self._adicionar_recente(dados["recentes"], acerto)
+
+    def alertas(self) -> List[str]:
+        """
+        Lista os campos cujo seletor primário parou de funcionar ou que ficaram vazios.
+
+        Returns:
+            Mensagens de alerta (vazia se tudo estiver normal)
+        """
+        mensagens = []
+        for campo, declarados in self.seletores.items():
+            if not declarados or campo not in self.estatisticas:
+                continue
+
+            dados = self._campo(campo)
+            recentes_campo = dados["recentes"]
+            # Depois de reordenado o primário deixa de ser tentado, então o
+            # alerta considera as consultas do campo, não só as dele
+            recentes_primario = dados["seletores"][declarados[0]]["recentes"]
+            if (
+                len(recentes_campo) >= self.min_amostras
+                and recentes_primario
+                and not any(recentes_primario)
+            ):
+                mensagens.append(
+                    f"{campo}: seletor primário '{declarados[0]}' não encontrou nada "
+                    f"nas últimas {len(recentes_primario)} tentativa(s)"
+                )
+
+            if len(recentes_campo) >= self.min_amostras:
+                vazios = recentes_campo.count(0) / len(recentes_campo)
+                if vazios >= 0.9:
+                    mensagens.append(
+                        f"{campo}: nenhum seletor encontrou valor em {vazios:.0%} "
+                        f"das últimas {len(recentes_campo)} consultas"
+                    )
+        return mensagens
+
+    def resumo(self) -> List[dict]:
+        """
+        Resume as estatísticas por campo e seletor, na ordem atual de tentativa.
+
+        Returns:
+            Lista de dicionários com campo, seletor, acertos, tentativas e taxa
+        """
+        linhas = []
+        for campo in self.seletores:
+            stats = self._campo(campo)["seletores"]
+            for seletor in self.candidatos(campo):
+                s = stats[seletor]
+                linhas.append({
+                    "campo": campo,
+                    "seletor": seletor,
+                    "primario": seletor == self.seletores[campo][0],
+                    "acertos": s["acertos"],
+                    "tentativas": s["tentativas"],
+                    "taxa": s["acertos"] / s["tentativas"] if s["tentativas"] else None,
+                })
+        return linhas
+
+    def _mesclar(self, destino: Dict[str, dict], pendentes: Dict[str, dict]) -> None:
+        """Soma os resultados pendentes às estatísticas de `destino`."""
+        for campo, novos in pendentes.items():
+            dados = self._campo(campo, destino)
+            dados["consultas"] += novos["consultas"]
+            dados["recentes"].extend(novos["recentes"])
+            del dados["recentes"][:-self.janela]
+            for seletor, stats_novos in novos["seletores"].items():
+                stats = dados["seletores"].setdefault(seletor, {"acertos": 0, "tentativas": 0, "recentes": []})
+                stats["acertos"] += stats_novos["acertos"]
+                stats["tentativas"] += stats_novos["tentativas"]
+                stats["recentes"].extend(stats_novos["recentes"])
+                del stats["recentes"][:-self.janela]
+
+    def salvar(self) -> None:
+        """
+        Grava as estatísticas de forma atômica (sem efeito se não houver caminho).
+
+        Sob um lock de arquivo, relê o que outras execuções gravaram e soma a
+        ele só os resultados desta, então execuções concorrentes não perdem
+        as contagens umas das outras.
+        """
+        if not self.caminho or not self._pendentes:
+            return
+
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.caminho.with_name(f".{self.caminho.name}.lock"), "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+            estatisticas = self._carregar()
+            self._mesclar(estatisticas, self._pendentes)
+
+            fd, temporario = tempfile.mkstemp(dir=self.caminho.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+                    json.dump(estatisticas, arquivo, ensure_ascii=False, indent=2)
+                os.replace(temporario, self.caminho)
+            except Exception:
+                Path(temporario).unlink(missing_ok=True)
+                raise
+
+        self._estatisticas = estatisticas
+        self._pendentes = {}
+
+    def limpar(self) -> None:
+        """Descarta todas as estatísticas (em memória e em disco)."""
+        self._estatisticas = {}
+        self._pendentes = {}
+        if self.caminho:
+            self.caminho.unlink(missing_ok=True)
@@ -0,0 +1,200 @@
+"""Verificação de entregabilidade dos emails (registros MX/A do domínio)."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from extrator_leads.core.models import Lead
+from extrator_leads.utils import dns
+
+VALIDO = "valido"
+SEM_MX = "sem_mx"
+DOMINIO_INEXISTENTE = "dominio_inexistente"
+ERRO = "erro"
+
+
+class VerificadorEmails:
+    """
+    Verifica se o domínio de cada email aceita mensagens (MX, ou A na falta de MX).
+
+    Os domínios são consultados uma única vez por lote, em um pool limitado
+    de threads, e o resultado fica em um cache compartilhado: respostas
+    positivas pelo TTL do registro (limitado a `ttl_maximo`) e negativas
+    (domínio inexistente ou sem MX/A) por `ttl_negativo`. Erros de rede
+    não são guardados, para que a próxima verificação tente de novo.
+    """
+
+    def __init__(
+        self,
+        servidor: Optional[Tuple[str, int]] = None,
+        workers: int = 16,
+        timeout: float = 2.0,
+        ttl_maximo: float = 3600.0,
+        ttl_negativo: float = 300.0,
+        relogio: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o verificador.
+
+        Args:
+            servidor: (host, porta) do nameserver (padrão: o do sistema)
+            workers: Consultas DNS simultâneas
+            timeout: Tempo máximo de espera por resposta, em segundos
+            ttl_maximo: Tempo máximo em cache de uma resposta positiva
+            ttl_negativo: Tempo em cache de uma resposta negativa
+            relogio: Fonte de tempo (injetável para testes)
+        """
+        self.servidor = servidor or dns.servidor_do_sistema()
+        self.workers = workers
+        self.timeout = timeout
+        self.ttl_maximo = ttl_maximo
+        self.ttl_negativo = ttl_negativo
+        self.relogio = relogio
+        self._cache: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _do_cache(self, dominio: str) -> Optional[str]:
+        with self._lock:
+            entrada = self._cache.get(dominio)
+            if entrada and entrada[1] > self.relogio():
+                return entrada[0]
+            return None
+
+    def _guardar(self, dominio: str, status: str, ttl: float) -> None:
+        with self._lock:
+            self._cache[dominio] = (status, self.relogio() + ttl)
+
+    def _consultar(self, dominio: str) -> Tuple[str, float]:
+        """Resolve o status do domínio e o tempo que ele pode ficar em cache."""
+        mx = dns.consultar(dominio, dns.TIPO_MX, self.servidor, self.timeout)
+        if mx.rcode == dns.RCODE_NXDOMAIN:
+            return DOMINIO_INEXISTENTE, self.ttl_negativo
+        if mx.rcode != dns.RCODE_OK:
+            raise OSError(f"Erro DNS (rcode {mx.rcode})")
+
+        if mx.registros:
+            # MX nulo (RFC 7505): o domínio declara que não recebe emails
+            if all(r.dados in ("", ".") for r in mx.registros):
+                return SEM_MX, self.ttl_negativo
+            return VALIDO, min(min(r.ttl for r in mx.registros), self.ttl_maximo)
+
+        # Sem MX, o servidor de email implícito é o próprio domínio (RFC 5321)
+        a = dns.consultar(dominio, dns.TIPO_A, self.servidor, self.timeout)
+        if a.rcode == dns.RCODE_OK and a.registros:
+            return VALIDO, min(min(r.ttl for r in a.registros), self.ttl_maximo)
+        return SEM_MX, self.ttl_negativo
+
+    def status_dominio(self, dominio: str) -> str:
+        """
+        Retorna o status de entregabilidade de um domínio.
+
+        Args:
+            dominio: Domínio do email (ex: 'exemplo.com.br')
+
+        Returns:
+            'valido', 'sem_mx', 'dominio_inexistente' ou 'erro'
+        """
+        dominio = dominio.lower().rstrip(".")
+        status = self._do_cache(dominio)
+        if status:
+            return status
+
+        try:
+            status, ttl = self._consultar(dominio)
+        except (OSError, ValueError):
+            return ERRO
+
+        self._guardar(dominio, status, ttl)
+        return status
+
+    def verificar(self, leads: List[Lead]) -> List[Lead]:
+        """
+        Preenche `email_status` dos leads com email, consultando cada domínio uma vez.
+
+        Args:
+            leads: Leads a verificar (alterados no lugar)
+
+        Returns:
+            Os mesmos leads
+        """
+        dominios = sorted({lead.email.rsplit("@", 1)[-1].lower() for lead in leads if lead.email})
+        if dominios:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(dominios))) as pool:
+                status = dict(zip(dominios, pool.map(self.status_dominio, dominios)))
+            for lead in leads:
+                if lead.email:
+                    lead.email_status = status[lead.email.rsplit("@", 1)[-1].lower()]
+        return leads
+
+
+class VerificacaoEmSegundoPlano:
+    """
+    Verifica os emails dos leads fora da thread da extração e os entrega a um destino.
+
+    Usada quando cada lead é gravado assim que extraído (ex: segmentos): as
+    consultas DNS rodam no pool do verificador, e uma única thread entrega
+    os leads ao destino na ordem em que chegaram, já com `email_status`.
+    """
+
+    def __init__(self, verificador: VerificadorEmails, destino: Callable[[Lead], None]):
+        """
+        Inicializa a verificação e a thread de entrega.
+
+        Args:
+            verificador: Verificador (e cache) usado nas consultas
+            destino: Função que recebe cada lead verificado (ex: EscritorSegmentos.escrever)
+        """
+        self.verificador = verificador
+        self.destino = destino
+        self._pool = ThreadPoolExecutor(max_workers=verificador.workers)
+        self._fila: "queue.Queue[Optional[Tuple[Lead, Optional[Future]]]]" = queue.Queue()
+        self._erro: Optional[Exception] = None
+        self._entregador = threading.Thread(target=self._entregar, name="verificacao-emails", daemon=True)
+        self._entregador.start()
+
+    def enviar(self, lead: Lead) -> None:
+        """Agenda a verificação do lead (retorna sem esperar pelo DNS)."""
+        futuro = None
+        if lead.email:
+            futuro = self._pool.submit(self.verificador.status_dominio, lead.email.rsplit("@", 1)[-1])
+        self._fila.put((lead, futuro))
+
+    def _entregar(self) -> None:
+        while True:
+            item = self._fila.get()
+            if item is None:
+                return
+            lead, futuro = item
+            if futuro is not None:
+                try:
+                    lead.email_status = futuro.result()
+                except Exception:
+                    # Uma falha inesperada na consulta não pode parar a entrega dos demais leads
+                    lead.email_status = ERRO
+            if self._erro is None:
+                try:
+                    self.destino(lead)
+                except Exception as e:
+                    # Os próximos leads são descartados; o erro sobe em fechar()
+                    self._erro = e
+
+    def fechar(self) -> None:
+        """
+        Aguarda as verificações pendentes e a entrega de todos os leads.
+
+        Raises:
+            Exception: O primeiro erro do destino, se houver
+        """
+        self._fila.put(None)
+        self._entregador.join()
+        self._pool.shutdown()
+        if self._erro is not None:
+            raise self._erro
+
+    def __enter__(self) -> "VerificacaoEmSegundoPlano":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
@@ -1,15 +1,30 @@
 """Classe base abstrata para extractors de leads."""
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from urllib.parse import urlparse
+from extrator_leads.core.config import Configuracao
 from extrator_leads.core.models import Lead
+from extrator_leads.core.prazo import Prazo
+from extrator_leads.core.retry import FalhaExtracao
 
 
 class BaseExtractor(ABC):
     """Classe base para todos os extractors de leads."""
 
-    def __init__(self, url: str, limit: Optional[int] = None, callback=None):
+    def __init__(
+        self,
+        url: str,
+        limit: Optional[int] = None,
+        callback=None,
+        trace_path: Optional[str] = None,
+        browser=None,
+        on_lead=None,
+        config: Optional[Configuracao] = None,
+        prazo: Optional[Prazo] = None,
+        on_falha=None
+    ):
         """
         Inicializa o extractor.
 
@@ -17,10 +32,24 @@ class BaseExtractor(ABC):
             url: URL da página para extrair dados
             limit: Número máximo de leads a extrair (None = todos)
             callback: Função para reportar progresso (opcional)
+            trace_path: Caminho do trace do Playwright (apenas extractors com navegador)
+            browser: Navegador Playwright já iniciado a reutilizar (opcional)
+            on_lead: Função chamada a cada lead extraído (opcional)
+            config: Configuração de desempenho (padrão: preset balanced; .env e ambiente são lidos pela CLI)
+            prazo: Orçamento de tempo da extração (opcional)
+            on_falha: Função chamada com a FalhaExtracao de cada item que falhou em definitivo, após as retentativas (opcional)
         """
         self.url = url
         self.limit = limit
         self.callback = callback
+        self.trace_path = trace_path
+        self.browser = browser
+        self.on_lead = on_lead
+        self.on_falha = on_falha
+        self.config = config or Configuracao()
+        self.prazo = prazo
+        self.falhas: List[FalhaExtracao] = []
+        self._cancelamento = threading.Event()
         self._validar_url()
 
     def _validar_url(self) -> None:
@@ -96,3 +125,49 @@ class BaseExtractor(ABC):
         if self.callback:
             self.callback(mensagem)
 
+    def _notificar_lead(self, lead: Lead) -> None:
+        """
+        Repassa um lead recém-extraído ao on_lead, se disponível.
+
+        Args:
+            lead: Lead extraído
+        """
+        if self.on_lead:
+            self.on_lead(lead)
+
+    def _notificar_falha(self, url: str, motivo: str) -> None:
+        """
+        Repassa a falha de um item ao on_falha, se disponível.
+
+        Args:
+            url: URL do item que falhou
+            motivo: Descrição do erro
+        """
+        if self.on_falha:
+            self.on_falha(FalhaExtracao(url=url, motivo=motivo))
+
+    def cancelar(self) -> None:
+        """Solicita o cancelamento da extração (pode ser chamado de outra thread)."""
+        self._cancelamento.set()
+
+    def _sem_tempo(self, folga: float = 0.0) -> bool:
+        """
+        Indica se o prazo (se houver) não comporta mais trabalho.
+
+        Args:
+            folga: Segundos que a próxima etapa deve levar
+        """
+        return self.prazo is not None and self.prazo.disponivel() <= folga
+
+    def _tempo_apertado(self) -> bool:
+        """Indica se o prazo (se houver) está no fim e as etapas lentas devem ser puladas."""
+        return self.prazo is not None and self.prazo.apertado
+
+    def _timeout(self, timeout_ms: int) -> int:
+        """Timeout do Playwright limitado ao tempo disponível do prazo (se houver)."""
+        return self.prazo.limitar_ms(timeout_ms) if self.prazo else timeout_ms
+
+    @property
+    def cancelado(self) -> bool:
+        """Indica se o cancelamento da extração foi solicitado."""
+        return self._cancelamento.is_set()
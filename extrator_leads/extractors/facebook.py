@@ -1,13 +1,211 @@
-"""Extractor para Facebook (em desenvolvimento)."""
+"""Extractor para páginas públicas do Facebook."""
 
+import json
 import re
-from typing import List
-from extrator_leads.extractors.base import BaseExtractor
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+
 from extrator_leads.core.models import Lead
+from extrator_leads.core.retry import FalhaExtracao
+from extrator_leads.extractors.navegador import PlaywrightExtractor
+
+try:
+    import lxml  # noqa: F401
+    PARSER_HTML = "lxml"
+except ImportError:  # lxml é opcional (mais rápido que o html.parser)
+    PARSER_HTML = "html.parser"
+
+# Só as tags com dados da página são construídas pelo BeautifulSoup
+TAGS_RELEVANTES = SoupStrainer(["title", "meta", "script", "a"])
+
+# Domínios da Meta (links de rodapé, apps e atalhos), nunca o website da página
+DOMINIOS_FACEBOOK = (
+    "facebook.com", "fb.com", "fb.me", "fbcdn.net", "instagram.com", "whatsapp.com", "wa.me",
+    "meta.com", "messenger.com", "m.me", "threads.net", "oculus.com", "meta.ai",
+)
+
+PADRAO_TELEFONE = re.compile(r'(?:\+55\s?)?\(?\d{2}\)?\s?\d{4,5}[-\s]?\d{4}')
+PADRAO_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PADRAO_ID_PAGINA = re.compile(r'fb://(?:page|profile)/(?:\?id=)?(\d+)')
+
+# Títulos das páginas de login/bloqueio (sem os dados públicos da página)
+TITULOS_BLOQUEIO = {"facebook", "log in or sign up to view", "entrar no facebook", "log into facebook"}
+
+_sessoes = threading.local()
+
+
+def sessao_http(tamanho_pool: int = 16) -> requests.Session:
+    """
+    Sessão HTTP da thread atual, reaproveitada entre extractors.
+
+    Mantém as conexões abertas (keep-alive) entre páginas, evitando um
+    novo handshake TLS por URL.
+    """
+    sessao = getattr(_sessoes, "sessao", None)
+    if sessao is None:
+        sessao = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=tamanho_pool, pool_maxsize=tamanho_pool)
+        sessao.mount("https://", adaptador)
+        sessao.mount("http://", adaptador)
+        _sessoes.sessao = sessao
+    return sessao
+
+
+def _limpar_nome(titulo: Optional[str]) -> Optional[str]:
+    if not titulo:
+        return None
+    nome = re.sub(r'\s*[|\-–]\s*Facebook\s*$', '', titulo.strip())
+    nome = re.sub(r'^\(\d+\)\s*', '', nome)  # contador de notificações no título
+    return nome or None
+
+
+def _eh_dominio_meta(host: str) -> bool:
+    host = host.lower().split(":")[0]
+    return any(host == dominio or host.endswith("." + dominio) for dominio in DOMINIOS_FACEBOOK)
+
+
+def _website_externo(href: str) -> Optional[str]:
+    """Retorna a URL se ela for externa à Meta (http/https), senão None."""
+    partes = urlparse(href)
+    if partes.scheme not in ("http", "https") or not partes.netloc or _eh_dominio_meta(partes.netloc):
+        return None
+    return href
+
+
+def _website_embrulhado(href: str) -> Optional[str]:
+    """
+    Retorna o destino de um link externo embrulhado (l.facebook.com/l.php?u=...).
+
+    O Facebook embrulha os links que a própria página publica (website no
+    bloco de apresentação); links diretos são de navegação, rodapé da Meta etc.
+    """
+    partes = urlparse(href)
+    if not (partes.netloc.lower().endswith("l.facebook.com") and partes.path.startswith("/l.php")):
+        return None
+    return _website_externo(parse_qs(partes.query).get("u", [""])[0])
+
+
+def _dados_json_ld(soup: BeautifulSoup) -> dict:
+    """Campos de contato dos blocos JSON-LD (schema.org) da página."""
+    dados = {}
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            blocos = json.loads(script.string or "")
+        except ValueError:
+            continue
+        for bloco in blocos if isinstance(blocos, list) else [blocos]:
+            if not isinstance(bloco, dict):
+                continue
+            dados.setdefault("nome", bloco.get("name"))
+            dados.setdefault("telefone", bloco.get("telephone"))
+            dados.setdefault("email", (bloco.get("email") or "").removeprefix("mailto:") or None)
+            website = bloco.get("url")
+            if website and _website_externo(website):
+                dados.setdefault("website", website)
+    return {campo: valor for campo, valor in dados.items() if valor}
+
+
+def extrair_dados_pagina(html: Union[str, bytes]) -> Dict[str, Optional[str]]:
+    """
+    Extrai nome, telefone, email, website e ID de uma página pública do Facebook.
+
+    Usa, nesta ordem, os metadados Open Graph, os blocos JSON-LD, os links
+    tel:/mailto:/externos embrulhados pelo Facebook e, por fim, a descrição
+    da página.
+
+    Args:
+        html: HTML da página (em bytes, a codificação é detectada pelo <meta charset>)
+
+    Returns:
+        Dicionário com nome, telefone, email, website e place_id (None quando ausentes)
+    """
+    soup = BeautifulSoup(html, PARSER_HTML, parse_only=TAGS_RELEVANTES)
+
+    meta = {}
+    for tag in soup.find_all("meta"):
+        chave = tag.get("property") or tag.get("name")
+        if chave and tag.get("content"):
+            meta.setdefault(chave.lower(), tag["content"])
+
+    json_ld = _dados_json_ld(soup)
+    titulo = soup.title.string if soup.title else None
 
+    dados = {
+        "nome": _limpar_nome(meta.get("og:title") or json_ld.get("nome") or titulo),
+        "telefone": json_ld.get("telefone"),
+        "email": json_ld.get("email"),
+        "website": json_ld.get("website"),
+        "place_id": None,
+    }
 
-class FacebookExtractor(BaseExtractor):
-    """Extractor de leads do Facebook (em desenvolvimento)."""
+    for tag in soup.find_all("a", href=True):
+        href = tag["href"].strip()
+        if href.startswith("tel:") and not dados["telefone"]:
+            dados["telefone"] = href[4:]
+        elif href.startswith("mailto:") and not dados["email"]:
+            dados["email"] = href[7:].split("?")[0]
+        elif not dados["website"]:
+            dados["website"] = _website_embrulhado(href)
+
+    descricao = meta.get("og:description") or meta.get("description") or ""
+    if not dados["telefone"]:
+        match = PADRAO_TELEFONE.search(descricao)
+        dados["telefone"] = match.group() if match else None
+    if not dados["email"]:
+        match = PADRAO_EMAIL.search(descricao)
+        dados["email"] = match.group() if match else None
+
+    for chave in ("al:android:url", "al:ios:url"):
+        match = PADRAO_ID_PAGINA.search(meta.get(chave, ""))
+        if match:
+            dados["place_id"] = match.group(1)
+            break
+
+    return dados
+
+
+class FacebookExtractor(PlaywrightExtractor):
+    """
+    Extractor de leads de páginas públicas do Facebook.
+
+    As páginas são baixadas por HTTP (sessão com keep-alive compartilhada
+    na thread) e interpretadas a partir do HTML. O navegador só é aberto,
+    uma única vez para todo o lote, para as páginas cujo HTML não trouxe o
+    nome (ex: muro de login ou conteúdo montado por JavaScript).
+    """
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    )
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        fallback_navegador: bool = True,
+        paginas: Optional[List[str]] = None,
+        **kwargs
+    ):
+        """
+        Inicializa o extractor.
+
+        Args:
+            url: URL da página do Facebook
+            fallback_navegador: Usa o navegador quando o HTML não trouxer os dados
+            paginas: Outras páginas do Facebook extraídas no mesmo lote que `url`
+            **kwargs: Demais argumentos de PlaywrightExtractor
+        """
+        super().__init__(url, *args, **kwargs)
+        self.fallback_navegador = fallback_navegador
+        self.paginas = [url] + [pagina for pagina in dict.fromkeys(paginas or []) if pagina != url]
 
     @property
     def fonte(self) -> str:
@@ -22,15 +220,128 @@ class FacebookExtractor(BaseExtractor):
 
     def extract(self) -> List[Lead]:
         """
-        Extrai dados de lead(s) do Facebook.
+        Extrai os dados da página do Facebook (e das demais `paginas` do lote).
 
         Returns:
-            Lista de leads extraídos
+            Lista com um lead por página extraída
 
         Raises:
-            NotImplementedError: Esta funcionalidade ainda não foi implementada
+            Exception: Se nenhuma página puder ser extraída
+        """
+        leads = self.extrair_paginas(self.paginas)
+        if not leads and self.falhas:
+            raise Exception(f"Erro ao extrair dados do Facebook: {self.falhas[0].motivo}")
+        return leads
+
+    def extrair_paginas(self, urls: List[str]) -> List[Lead]:
+        """
+        Extrai várias páginas: downloads HTTP em paralelo e navegador só para as que precisarem.
+
+        Args:
+            urls: URLs das páginas
+
+        Returns:
+            Leads extraídos, na ordem das URLs (falhas ficam em `self.falhas`)
+        """
+        urls = urls[:self.limit] if self.limit is not None else urls
+        workers = max(1, min(self.config.workers * 4, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            resultados = list(pool.map(self._extrair_http, urls))
+
+        pendentes = [url for url, (dados, _) in zip(urls, resultados) if not (dados and dados["nome"])]
+        if pendentes and self.fallback_navegador and self._tempo_apertado():
+            self.prazo.registrar_pulo("páginas sem fallback no navegador", len(pendentes))
+        elif pendentes and self.fallback_navegador and not self.cancelado:
+            self._log(f"Abrindo o navegador para {len(pendentes)} página(s) sem dados no HTML...")
+            renderizados = self._renderizar_com_navegador(pendentes)
+            resultados = [
+                (self._interpretar(renderizados[url]), None) if url in renderizados else resultado
+                for url, resultado in zip(urls, resultados)
+            ]
+
+        leads = []
+        self.falhas = []
+        for url, (dados, erro) in zip(urls, resultados):
+            lead = self._montar_lead(url, dados) if dados and dados["nome"] else None
+            if not lead:
+                self.falhas.append(FalhaExtracao(url=url, motivo=erro or "Nome não encontrado"))
+                self._notificar_falha(url, erro or "Nome não encontrado")
+                self._log(f"  ✗ {url[:60]} - {(erro or 'Nome não encontrado')[:50]}")
+                continue
+            leads.append(lead)
+            self._notificar_lead(lead)
+            self._log(f"  ✓ {lead.nome[:40]} - {lead.telefone or 'Sem telefone'}")
+        return leads
+
+    def _extrair_http(self, url: str) -> Tuple[Optional[dict], Optional[str]]:
+        """Baixa e interpreta a página por HTTP; retorna (dados, erro)."""
+        if self.cancelado:
+            return None, "Extração cancelada"
+        if self._sem_tempo():
+            self.prazo.registrar_pulo("páginas não baixadas")
+            return None, "Prazo esgotado"
+        try:
+            resposta = sessao_http().get(
+                url,
+                timeout=max(min(self.config.timeout_http, self.prazo.disponivel()), 0.1) if self.prazo else self.config.timeout_http,
+                headers={
+                    "User-Agent": self.config.user_agent or self.USER_AGENT,
+                    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+                },
+            )
+        except requests.RequestException as e:
+            return None, str(e)
+
+        # Redirecionamento para o login: o HTML não tem os dados públicos
+        if resposta.status_code != 200 or "/login" in urlparse(resposta.url).path:
+            return None, f"HTTP {resposta.status_code}"
+        # Bytes: sem charset no cabeçalho, o requests assumiria ISO-8859-1
+        return self._interpretar(resposta.content), None
+
+    def _interpretar(self, html: Union[str, bytes]) -> dict:
+        dados = extrair_dados_pagina(html)
+        if dados["nome"] and dados["nome"].lower() in TITULOS_BLOQUEIO:
+            dados["nome"] = None
+        return dados
+
+    def _renderizar_com_navegador(self, urls: List[str]) -> Dict[str, str]:
         """
-        raise NotImplementedError(
-            "Extração de leads do Facebook ainda não foi implementada. "
-            "Esta funcionalidade será adicionada em versões futuras."
-        )
+        Renderiza as páginas no navegador (uma sessão para todas).
+
+        Returns:
+            HTML renderizado de cada URL que carregou
+        """
+        renderizados = {}
+        with self._abrir_sessao() as sessao:
+            for indice, url in enumerate(urls):
+                if self.cancelado:
+                    break
+                if self._sem_tempo():
+                    self.prazo.registrar_pulo("páginas sem fallback no navegador", len(urls) - indice)
+                    break
+                try:
+                    sessao.page.goto(url, wait_until="domcontentloaded", timeout=self._timeout(self.config.timeout_navegacao))
+                    sessao.page.wait_for_timeout(self._timeout(self.config.espera_carregamento))
+                    renderizados[url] = sessao.page.content()
+                except Exception as e:
+                    self._log(f"  ✗ Navegador: {url[:60]} - {str(e)[:50]}")
+        return renderizados
+
+    def _montar_lead(self, url: str, dados: dict) -> Optional[Lead]:
+        """Cria o lead, descartando email/website/telefone que não passarem na validação."""
+        campos = {campo: self._limpar_texto(dados.get(campo)) for campo in ("nome", "telefone", "email", "website")}
+        for _ in range(2):
+            try:
+                return Lead(
+                    **campos,
+                    fonte=self.fonte,
+                    url_origem=url,
+                    place_id=dados.get("place_id")
+                )
+            except ValidationError as e:
+                invalidos = {erro["loc"][0] for erro in e.errors()} & {"telefone", "email", "website"}
+                if not invalidos:
+                    return None
+                for campo in invalidos:
+                    campos[campo] = None
+        return None
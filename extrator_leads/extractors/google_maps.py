@@ -1,24 +1,37 @@
 """Extractor para Google Maps."""
 
+import json
 import re
+from collections import deque
 from typing import List, Optional
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-from extrator_leads.extractors.base import BaseExtractor
+from urllib.parse import parse_qs, urljoin, urlparse
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from extrator_leads.extractors.navegador import PlaywrightExtractor, SessaoNavegador
 from extrator_leads.core.models import Lead
+from extrator_leads.core.retry import FilaRetentativas
 
 
-class GoogleMapsExtractor(BaseExtractor):
+class GoogleMapsExtractor(PlaywrightExtractor):
     """Extractor de leads do Google Maps."""
 
     # Seletores
     SELECTORS = {
         'feed': 'div[role="feed"]',
         'result_link': 'a[href*="/maps/place/"]',
-        'name': ['h1.DUwDvf', 'h1[class*="title"]', 'h1', '[data-attrid="title"]', '[class*="fontHeadline"]'],
+        'name': ['h1.DUwDvf', 'h1[class*="title"]', '[data-attrid="title"]', 'div[role="main"] h1', '[class*="fontHeadline"]'],
         'phone_btn': 'button[data-item-id*="phone"]',
         'website_btn': ['a[data-item-id*="authority"]', 'a[aria-label*="Website"]', 'a[aria-label*="Site"]', 'a[data-tooltip*="Website"]', 'a[data-tooltip*="Site"]', 'button[data-item-id*="authority"]', 'a[href*="/url?"]'],
     }
 
+    # Sem website na página, o 'a[href*="/url?"]' acharia outro link e passaria à frente do primário
+    SELETORES_ORDEM_FIXA = ('website_btn',)
+
+    # ID do lugar no link do Maps: '!19sChIJ...' (place ID) ou '!1s0x...:0x...' (feature ID)
+    PLACE_ID_PATTERNS = [r'!19s(ChIJ[^!?&/]+)', r'!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)']
+
+    # Com prazo, fração máxima do tempo disponível gasta rolando o feed (o resto fica para os detalhes)
+    FRACAO_ROLAGEM = 0.3
+
     @property
     def fonte(self) -> str:
         """Retorna o nome da fonte."""
@@ -41,25 +54,21 @@ class GoogleMapsExtractor(BaseExtractor):
         Returns:
             Lista de leads extraídos
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
-            page = context.new_page()
-
+        with self._abrir_sessao() as sessao:
+            page = sessao.page
             try:
                 # Navega para a página
-                page.goto(self.url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)  # Aguarda carregamento adicional
+                page.goto(self.url, wait_until="domcontentloaded", timeout=self._timeout(self.config.timeout_navegacao))
+                page.wait_for_timeout(self._timeout(self.config.espera_carregamento))  # Aguarda carregamento adicional
 
                 # Verifica se é página de busca ou individual
                 if self._eh_pagina_busca(self.url):
-                    leads = self._extrair_resultados_busca(page)
+                    leads = self._extrair_resultados_busca(sessao)
                 else:
                     lead = self._extrair_estabelecimento_individual(page)
                     leads = [lead] if lead else []
+                    if lead:
+                        self._notificar_lead(lead)
 
                 return leads
 
@@ -68,35 +77,51 @@ class GoogleMapsExtractor(BaseExtractor):
             except Exception as e:
                 raise Exception(f"Erro ao extrair dados do Google Maps: {str(e)}")
             finally:
-                browser.close()
+                self._finalizar_seletores()
 
-    def _extrair_resultados_busca(self, page) -> List[Lead]:
-        """Extrai dados de múltiplos estabelecimentos de uma página de busca."""
-        leads = []
+    def _coletar_links(self, page) -> List[str]:
+        """
+        Rola o feed de resultados e coleta os links dos estabelecimentos.
+
+        Trabalha só com strings (contagem e hrefs são lidos via JavaScript),
+        sem manter ElementHandles vivos no navegador.
 
+        Returns:
+            Lista de hrefs únicos, na ordem do feed
+        """
         # Aguarda a lista de resultados carregar
         try:
-            page.wait_for_selector('div[role="feed"]', timeout=10000)
+            page.wait_for_selector(self.SELECTORS['feed'], timeout=self._timeout(self.config.timeout_feed))
         except:
-            return leads
+            return []
 
         self._log("Rolando a página para carregar todos os resultados...")
 
         # Rola a página até carregar todos os resultados
         tentativas_sem_novos = 0
         contagem_anterior = 0
+        limite_rolagem = self.prazo.disponivel() * self.FRACAO_ROLAGEM if self.prazo else None
+        inicio_rolagem = self.prazo.decorrido() if self.prazo else 0.0
+
+        while tentativas_sem_novos < self.config.rolagens_sem_novos and not self.cancelado:
+            if limite_rolagem is not None and self.prazo.decorrido() - inicio_rolagem >= limite_rolagem:
+                self.prazo.registrar_pulo("rolagem do feed interrompida")
+                self._log("  ⏱ Rolagem interrompida para preservar tempo para os detalhes")
+                break
 
-        while tentativas_sem_novos < 3:
             # Rola até o final do feed
-            page.evaluate(f'document.querySelector(\'{self.SELECTORS["feed"]}\').scrollTo(0, document.querySelector(\'{self.SELECTORS["feed"]}\').scrollHeight)')
-            page.wait_for_timeout(1500)
+            page.eval_on_selector(self.SELECTORS['feed'], 'feed => feed.scrollTo(0, feed.scrollHeight)')
+            page.wait_for_timeout(self._timeout(self.config.espera_rolagem))
 
             # Conta quantos links existem agora
-            links_atuais = page.query_selector_all('a[href*="/maps/place/"]')
-            contagem_atual = len(links_atuais)
+            contagem_atual = page.eval_on_selector_all(self.SELECTORS['result_link'], 'links => links.length')
 
             self._log(f"  Encontrados {contagem_atual} resultados...")
 
+            # Com prazo, não rola além do necessário para o limite
+            if self.prazo and self.limit and contagem_atual >= self.limit:
+                break
+
             # Se não aumentou, incrementa contador
             if contagem_atual == contagem_anterior:
                 tentativas_sem_novos += 1
@@ -104,131 +129,285 @@ class GoogleMapsExtractor(BaseExtractor):
                 tentativas_sem_novos = 0
                 contagem_anterior = contagem_atual
 
-        # Encontra todos os links de estabelecimentos
-        links = page.query_selector_all('a[href*="/maps/place/"]')
+        hrefs = page.eval_on_selector_all(
+            self.SELECTORS['result_link'],
+            'links => links.map(l => l.getAttribute("href"))'
+        )
 
         # Remove duplicatas mantendo ordem
-        urls_vistas = set()
-        links_unicos = []
-        for link in links:
-            href = link.get_attribute('href')
-            if href and href not in urls_vistas:
-                urls_vistas.add(href)
-                links_unicos.append(link)
+        return list(dict.fromkeys(href for href in hrefs if href))
+
+    def coletar_links(self) -> List[str]:
+        """
+        Abre a busca e coleta os links dos estabelecimentos, sem extrair os detalhes.
+
+        Returns:
+            Links absolutos dos estabelecimentos (respeitando o limite)
+        """
+        with self._abrir_sessao() as sessao:
+            try:
+                sessao.page.goto(self.url, wait_until="domcontentloaded", timeout=self._timeout(self.config.timeout_navegacao))
+                sessao.page.wait_for_timeout(self._timeout(self.config.espera_carregamento))
+                hrefs = self._coletar_links(sessao.page)
+            finally:
+                self._finalizar_seletores()
+
+        if self.limit is not None:
+            hrefs = hrefs[:self.limit]
+        return [urljoin(self.url, href) for href in hrefs]
+
+    def extrair_links(self, hrefs: List[str]) -> List[Lead]:
+        """
+        Extrai os estabelecimentos informados navegando diretamente até cada um.
+
+        Args:
+            hrefs: Links dos estabelecimentos (ex: de coletar_links)
+
+        Returns:
+            Leads extraídos (url_origem é a URL deste extractor)
+        """
+        with self._abrir_sessao() as sessao:
+            try:
+                return self._extrair_lugares(sessao, hrefs, na_busca=False)
+            finally:
+                self._finalizar_seletores()
+
+    def _extrair_resultados_busca(self, sessao: SessaoNavegador) -> List[Lead]:
+        """Extrai dados de múltiplos estabelecimentos de uma página de busca."""
+        hrefs = self._coletar_links(sessao.page)
+        if not hrefs:
+            return []
 
-        self._log(f"\nRolagem completa! Total: {len(links_unicos)} estabelecimentos únicos\n")
+        self._log(f"\nRolagem completa! Total: {len(hrefs)} estabelecimentos únicos\n")
 
         # Aplica limite se especificado
-        total_a_extrair = len(links_unicos) if self.limit is None else min(self.limit, len(links_unicos))
+        total_a_extrair = len(hrefs) if self.limit is None else min(self.limit, len(hrefs))
 
         self._log(f"Extraindo dados de {total_a_extrair} estabelecimento(s)...\n")
 
-        # Extrai dados de cada estabelecimento
-        for i, link in enumerate(links_unicos[:total_a_extrair], 1):
+        return self._extrair_lugares(sessao, hrefs[:total_a_extrair], na_busca=True)
+
+    def _extrair_lugares(self, sessao: SessaoNavegador, hrefs: List[str], na_busca: bool) -> List[Lead]:
+        """
+        Extrai os dados de uma lista de estabelecimentos, com retentativas.
+
+        Args:
+            sessao: Sessão de navegador
+            hrefs: Links dos estabelecimentos
+            na_busca: Se a página atual é a busca (abre pelo painel em vez de navegar)
+
+        Returns:
+            Leads extraídos
+        """
+        leads = []
+        page = sessao.page
+        total_a_extrair = len(hrefs)
+        retentativas = FilaRetentativas(
+            max_tentativas=self.config.max_retentativas,
+            espera_inicial=self.config.espera_retentativa
+        )
+
+        # Enquanto a página de busca está aberta, os estabelecimentos são abertos
+        # clicando no feed; depois de reciclar o contexto, por navegação direta.
+        pendentes = deque(hrefs)
+        processados_no_contexto = 0
+        i = 0
+        duracao_media = 0.0
+
+        while pendentes:
+            if self.cancelado:
+                self._log("Extração cancelada.")
+                break
+
+            # Só começa um estabelecimento se o prazo comportar a duração média de um
+            if self._sem_tempo(folga=duracao_media):
+                self.prazo.registrar_pulo("estabelecimentos não extraídos", len(pendentes))
+                self._log(f"⏱ Prazo esgotado: {len(pendentes)} estabelecimento(s) não extraído(s)")
+                break
+
+            if self._precisa_reciclar(processados_no_contexto, sessao):
+                page = sessao.reciclar()
+                na_busca = False
+                processados_no_contexto = 0
+                self._log(f"  ↻ Contexto do navegador reciclado ({len(pendentes)} restante(s))")
+
+            href = pendentes.popleft()
+            i += 1
+            processados_no_contexto += 1
+            inicio = self.prazo.decorrido() if self.prazo else 0.0
+
             try:
                 self._log(f"[{i}/{total_a_extrair}] Extraindo...")
 
-                # Extrai o nome esperado do link antes de clicar
-                nome_esperado = None
-                try:
-                    nome_link_elem = link.query_selector('[class*="fontHeadline"], div[aria-label]')
-                    if nome_link_elem:
-                        nome_esperado = self._limpar_texto(nome_link_elem.inner_text())
-                except:
-                    pass
-
-                # Salva o nome atual do h1 antes de clicar (para detectar mudança)
-                nome_anterior = None
-                try:
-                    h1_elem = page.query_selector('h1.DUwDvf, h1')
-                    if h1_elem:
-                        nome_anterior = self._limpar_texto(h1_elem.inner_text())
-                except:
-                    pass
-
-                # Clica no resultado para abrir os detalhes
-                link.scroll_into_view_if_needed()
-                page.wait_for_timeout(300)
-                link.click()
-
-                # Aguarda que o painel mude (h1 diferente ou timeout)
-                tentativas = 0
-                max_tentativas = 15  # 15 x 200ms = 3 segundos
-                painel_atualizado = False
-
-                while tentativas < max_tentativas and not painel_atualizado:
-                    page.wait_for_timeout(200)
-                    tentativas += 1
-
-                    try:
-                        h1_elem = page.query_selector('h1.DUwDvf, h1')
-                        if h1_elem:
-                            nome_atual = self._limpar_texto(h1_elem.inner_text())
-                            # Painel mudou se o nome é diferente do anterior
-                            if nome_atual and nome_atual != nome_anterior:
-                                painel_atualizado = True
-                                break
-                    except:
-                        pass
-
-                # Aguarda os botões de ação (telefone, website) carregarem
-                try:
-                    page.wait_for_selector('button[data-item-id], a[data-item-id]', timeout=1000)
-                except:
-                    pass  # Continua mesmo se não encontrar
-
-                # Extrai nome
-                nome = None
-                for seletor in self.SELECTORS['name']:
-                    elem = page.query_selector(seletor)
-                    if elem:
-                        nome = self._limpar_texto(elem.inner_text())
-                        if nome and len(nome) > 3:
-                            break
-
-                if not nome:
+                if na_busca:
+                    lead = self._extrair_do_painel(page, href)
+                else:
+                    lead = self._extrair_por_navegacao(page, href)
+
+                if not lead:
                     self._log(f"  ✗ Nome não encontrado")
+                    retentativas.registrar(href, "Nome não encontrado")
                     continue
 
-                # Extrai telefone
-                telefone = None
-                telefone_btn = page.query_selector('button[data-item-id*="phone"]')
-                if telefone_btn:
-                    tel_attr = telefone_btn.get_attribute('data-item-id')
-                    if tel_attr and 'phone:tel:' in tel_attr:
-                        telefone = tel_attr.replace('phone:tel:', '').replace('tel:', '')
-
-                # Se não achou pelo botão, procura no conteúdo
-                if not telefone:
-                    content = page.content()
-                    telefone_pattern = r'\(\d{2}\)\s*\d{4,5}[-\s]?\d{4}'
-                    match = re.search(telefone_pattern, content)
-                    if match:
-                        telefone = match.group()
-
-                # Extrai website (com adicional de tempo para garantir carregamento)
-                page.wait_for_timeout(500)  # Pequena espera adicional
-                website = self._extrair_website(page)
-
-                # Cria o lead
-                lead = Lead(
-                    nome=nome,
-                    email=None,
-                    website=website,
-                    telefone=telefone,
-                    fonte=self.fonte,
-                    url_origem=self.url
-                )
-
                 leads.append(lead)
-                self._log(f"  ✓ {nome[:40]} - {telefone or 'Sem telefone'}")
+                self._notificar_lead(lead)
+                self._log(f"  ✓ {lead.nome[:40]} - {lead.telefone or 'Sem telefone'}")
 
             except Exception as e:
                 self._log(f"  ✗ Erro: {str(e)[:50]}")
+                retentativas.registrar(href, str(e))
                 continue
+            finally:
+                if self.prazo:
+                    duracao_media += (self.prazo.decorrido() - inicio - duracao_media) / i
+
+        if retentativas and self._tempo_apertado():
+            self.prazo.registrar_pulo("retentativas", len(retentativas))
+            self._log(f"⏱ Retentativas puladas pelo prazo ({len(retentativas)} estabelecimento(s))")
+        elif retentativas and not self.cancelado:
+            self._log(f"\nRetentando {len(retentativas)} estabelecimento(s) com falha...\n")
+
+        # Sem rodadas (cancelado ou prazo apertado), processar apenas consolida as falhas
+        recuperados = retentativas.processar(
+            lambda url: self._extrair_em_nova_pagina(sessao, url),
+            deve_parar=lambda: self.cancelado or self._tempo_apertado(),
+            callback=self._log,
+            tempo_disponivel=self.prazo.disponivel if self.prazo else None
+        )
+        leads.extend(recuperados)
+        if retentativas.sem_tempo:
+            self.prazo.registrar_pulo("retentativas", len(retentativas.falhas))
+
+        # Só as falhas que as retentativas não recuperaram são repassadas ao on_falha
+        self.falhas = retentativas.falhas
+        for falha in self.falhas:
+            self._log(f"  ✗ Falha definitiva ({falha.tentativas}x): {falha.url[:60]} - {falha.motivo[:50]}")
+            if self.on_falha:
+                self.on_falha(falha)
 
         return leads
 
+    def _texto_titulo(self, page) -> Optional[str]:
+        """Lê o título (h1) do painel atual sem criar ElementHandles."""
+        texto = page.evaluate(
+            "() => { const h1 = document.querySelector('h1.DUwDvf, h1'); return h1 ? h1.innerText : null; }"
+        )
+        return self._limpar_texto(texto)
+
+    def _extrair_do_painel(self, page, href: str) -> Optional[Lead]:
+        """
+        Clica no resultado do feed e extrai os dados do painel de detalhes.
+
+        Args:
+            page: Página de busca
+            href: Link do estabelecimento no feed
+
+        Returns:
+            Lead extraído ou None se o nome não for encontrado
+        """
+        # Salva o nome atual do h1 antes de clicar (para detectar mudança)
+        nome_anterior = self._texto_titulo(page)
+
+        # Clica no resultado para abrir os detalhes
+        link = page.locator(f'a[href={json.dumps(href, ensure_ascii=False)}]').first
+        link.scroll_into_view_if_needed(timeout=self._timeout(self.config.timeout_navegacao))
+        page.wait_for_timeout(self._timeout(self.config.espera_clique))
+        link.click(timeout=self._timeout(self.config.timeout_navegacao))
+
+        # Aguarda que o painel mude (h1 diferente ou timeout), verificando a cada 200ms
+        tentativas = 0
+        max_tentativas = max(self.config.espera_painel // 200, 1)
+
+        while tentativas < max_tentativas and not self._sem_tempo():
+            page.wait_for_timeout(self._timeout(200))
+            tentativas += 1
+
+            # Painel mudou se o nome é diferente do anterior
+            nome_atual = self._texto_titulo(page)
+            if nome_atual and nome_atual != nome_anterior:
+                break
+
+        # Aguarda os botões de ação (telefone, website) carregarem
+        try:
+            page.wait_for_selector('button[data-item-id], a[data-item-id]', timeout=self._timeout(self.config.espera_botoes))
+        except:
+            pass  # Continua mesmo se não encontrar
+
+        # Extrai nome
+        nome = self.seletores.resolver('name', lambda sel: self._nome_do_seletor(page, sel, tamanho_minimo=4))
+
+        if not nome:
+            return None
+
+        # Extrai telefone
+        telefone = None
+        tel_attr = page.evaluate(
+            "sel => { const b = document.querySelector(sel); return b ? b.getAttribute('data-item-id') : null; }",
+            self.SELECTORS['phone_btn']
+        )
+        if tel_attr and 'phone:tel:' in tel_attr:
+            telefone = tel_attr.replace('phone:tel:', '').replace('tel:', '')
+
+        # Se não achou pelo botão, procura no conteúdo
+        if not telefone and not self._pular_se_apertado("busca de telefone no HTML"):
+            content = page.content()
+            telefone_pattern = r'\(\d{2}\)\s*\d{4,5}[-\s]?\d{4}'
+            match = re.search(telefone_pattern, content)
+            if match:
+                telefone = match.group()
+
+        # Extrai website (com adicional de tempo para garantir carregamento)
+        if self.config.espera_website:
+            page.wait_for_timeout(self._timeout(self.config.espera_website))  # Pequena espera adicional
+        website = self._extrair_website(page)
+
+        # Cria o lead
+        return Lead(
+            nome=nome,
+            email=None,
+            website=website,
+            telefone=telefone,
+            fonte=self.fonte,
+            url_origem=self.url,
+            place_id=self.extrair_place_id(href)
+        )
+
+    def _extrair_por_navegacao(self, page, url: str) -> Optional[Lead]:
+        """
+        Navega diretamente até a página do estabelecimento e extrai seus dados.
+
+        Args:
+            page: Página a usar para a navegação
+            url: URL do estabelecimento
+
+        Returns:
+            Lead extraído ou None se o nome não for encontrado
+        """
+        page.goto(urljoin(self.url, url), wait_until="domcontentloaded", timeout=self._timeout(self.config.timeout_navegacao))
+        page.wait_for_selector(self.seletores.candidatos('name')[0], timeout=self._timeout(self.config.timeout_nome))
+        return self._extrair_estabelecimento_individual(page)
+
+    def _extrair_em_nova_pagina(self, sessao: SessaoNavegador, url: str) -> Lead:
+        """
+        Extrai um estabelecimento abrindo sua URL em uma página nova.
+
+        Usado nas retentativas, para não depender do estado do painel da busca.
+
+        Raises:
+            ValueError: Se o nome do estabelecimento não for encontrado
+        """
+        page = sessao.nova_pagina()
+        try:
+            lead = self._extrair_por_navegacao(page, url)
+            if not lead:
+                raise ValueError("Nome não encontrado")
+
+            self._notificar_lead(lead)
+            self._log(f"  ✓ {lead.nome[:40]} - {lead.telefone or 'Sem telefone'} (retentativa)")
+            return lead
+        finally:
+            page.close()
+
     def _extrair_estabelecimento_individual(self, page) -> Lead | None:
         """Extrai dados de um estabelecimento individual."""
         # Extrai o nome do estabelecimento
@@ -248,24 +427,43 @@ class GoogleMapsExtractor(BaseExtractor):
             website=website,
             telefone=telefone,
             fonte=self.fonte,
-            url_origem=self.url
+            url_origem=self.url,
+            place_id=self.extrair_place_id(page.url)
         )
 
         return lead
 
-    def _extrair_nome(self, page) -> Optional[str]:
-        """Extrai o nome do estabelecimento."""
-        for seletor in self.SELECTORS['name']:
-            try:
-                elemento = page.query_selector(seletor)
-                if elemento:
-                    nome = elemento.inner_text()
-                    return self._limpar_texto(nome)
-            except:
-                continue
+    def _nome_do_seletor(self, page, seletor: str, tamanho_minimo: int = 1) -> Optional[str]:
+        """Lê o nome a partir de um seletor (None se não existir ou for curto demais)."""
+        elemento = page.query_selector(seletor)
+        if not elemento:
+            return None
+        try:
+            nome = self._limpar_texto(elemento.inner_text())
+        finally:
+            elemento.dispose()
+        return nome if nome and len(nome) >= tamanho_minimo else None
+
+    def _pular_se_apertado(self, etapa: str) -> bool:
+        """Registra e indica que uma etapa lenta (ex: varrer page.content()) deve ser pulada pelo prazo."""
+        if not self._tempo_apertado():
+            return False
+        self.prazo.registrar_pulo(etapa)
+        return True
 
+    @classmethod
+    def extrair_place_id(cls, url: Optional[str]) -> Optional[str]:
+        """Extrai o ID do lugar de um link do Maps (None se não houver)."""
+        for pattern in cls.PLACE_ID_PATTERNS:
+            match = re.search(pattern, url or '')
+            if match:
+                return match.group(1)
         return None
 
+    def _extrair_nome(self, page) -> Optional[str]:
+        """Extrai o nome do estabelecimento."""
+        return self.seletores.resolver('name', lambda sel: self._nome_do_seletor(page, sel))
+
     def _extrair_telefone(self, page) -> Optional[str]:
         """Extrai o telefone do estabelecimento."""
         seletores = [
@@ -292,6 +490,8 @@ class GoogleMapsExtractor(BaseExtractor):
                 continue
 
         # Busca por padrão de telefone no conteúdo da página
+        if self._pular_se_apertado("busca de telefone no HTML"):
+            return None
         try:
             conteudo = page.content()
             padrao_tel = r'\+?[\d\s\(\)\-]{8,}'
@@ -303,49 +503,53 @@ class GoogleMapsExtractor(BaseExtractor):
 
         return None
 
-    def _extrair_website(self, page) -> Optional[str]:
-        """Extrai o website do estabelecimento."""
-        from urllib.parse import urlparse, parse_qs
+    def _website_do_seletor(self, page, seletor: str) -> Optional[str]:
+        """Lê o website a partir de um seletor (None se não existir ou não for uma URL)."""
+        elemento = page.query_selector(seletor)
+        if not elemento:
+            return None
 
-        for seletor in self.SELECTORS['website_btn']:
+        try:
+            # Verifica se o elemento está visível (não de um painel anterior)
             try:
-                elemento = page.query_selector(seletor)
-                if elemento:
-                    # Verifica se o elemento está visível (não de um painel anterior)
-                    try:
-                        is_visible = elemento.is_visible()
-                        if not is_visible:
-                            continue
-                    except:
-                        pass
-
-                    website = elemento.get_attribute('href')
-                    if not website:
-                        website = elemento.get_attribute('data-item-id')
-                        if website and 'authority' in website:
-                            website = website.split('authority:')[-1]
-
-                    if website:
-                        # Trata URLs redirecionadas pelo Google (/url?q=...)
-                        if '/url?' in website and 'q=' in website:
-                            try:
-                                parsed = urlparse(website)
-                                params = parse_qs(parsed.query)
-                                if 'q' in params:
-                                    website = params['q'][0]
-                            except:
-                                pass
-
-                        # Valida se é uma URL válida
-                        if website.startswith('http'):
-                            return self._limpar_texto(website)
+                if not elemento.is_visible():
+                    return None
             except:
-                continue
+                pass
+
+            website = elemento.get_attribute('href')
+            if not website:
+                website = elemento.get_attribute('data-item-id')
+                if website and 'authority' in website:
+                    website = website.split('authority:')[-1]
+        finally:
+            elemento.dispose()
+
+        if not website:
+            return None
 
+        # Trata URLs redirecionadas pelo Google (/url?q=...)
+        if '/url?' in website and 'q=' in website:
+            try:
+                params = parse_qs(urlparse(website).query)
+                if 'q' in params:
+                    website = params['q'][0]
+            except:
+                pass
+
+        # Valida se é uma URL válida
+        if website.startswith('http'):
+            return self._limpar_texto(website)
         return None
 
+    def _extrair_website(self, page) -> Optional[str]:
+        """Extrai o website do estabelecimento."""
+        return self.seletores.resolver('website_btn', lambda sel: self._website_do_seletor(page, sel))
+
     def _extrair_email(self, page) -> Optional[str]:
         """Extrai o email do estabelecimento (se disponível no site)."""
+        if self._pular_se_apertado("busca de email no HTML"):
+            return None
         try:
             # Google Maps raramente mostra email diretamente
             # Procura por padrão de email no conteúdo
@@ -0,0 +1,320 @@
+"""Sessão de navegador compartilhada pelos extractors baseados em Playwright."""
+
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Iterator, List, Optional
+from playwright.sync_api import sync_playwright
+from extrator_leads.extractors.base import BaseExtractor
+from extrator_leads.extractors.perfil import PerfilNavegador
+from extrator_leads.core.seletores import CAMINHO_PADRAO, ResolvedorSeletores
+from extrator_leads.utils.memoria import pid_driver_playwright, rss_descendentes_mb
+
+HAR_GRAVAR = "gravar"
+HAR_REPRODUZIR = "reproduzir"
+
+
+class SessaoNavegador:
+    """
+    Gerencia o navegador, o contexto e a página de uma extração.
+
+    Reutiliza o navegador recebido (ex: pool do serviço) ou inicia um
+    Chromium próprio e o encerra ao final. Com `user_data_dir`, usa um
+    contexto persistente (cache e cookies mantidos em disco). O contexto
+    pode ser reciclado no meio da extração para devolver a memória
+    acumulada pelo Chromium.
+    """
+
+    def __init__(
+        self,
+        browser=None,
+        headless: bool = True,
+        viewport: Optional[dict] = None,
+        user_agent: Optional[str] = None,
+        trace_path: Optional[str] = None,
+        user_data_dir: Optional[str] = None,
+        har_path: Optional[str] = None,
+        har_modo: Optional[str] = None,
+        timeout: Optional[int] = None,
+        bloquear_recursos: Optional[List[str]] = None
+    ):
+        """
+        Inicializa a sessão (sem abrir o navegador).
+
+        Args:
+            browser: Navegador Playwright já iniciado a reutilizar (opcional)
+            headless: Executa o navegador sem interface gráfica
+            viewport: Tamanho da janela do contexto
+            user_agent: User-Agent do contexto
+            trace_path: Caminho do trace do Playwright (opcional)
+            user_data_dir: Diretório de perfil persistente (opcional)
+            har_path: Arquivo HAR para gravar ou reproduzir o tráfego (opcional)
+            har_modo: 'gravar' (salva as respostas) ou 'reproduzir' (sem rede)
+            timeout: Timeout padrão das operações de página, em ms (padrão do Playwright se None)
+            bloquear_recursos: Tipos de recurso abortados pelo contexto (ex: ['image', 'font'])
+
+        Raises:
+            ValueError: Se browser e user_data_dir forem informados juntos ou o modo HAR for inválido
+        """
+        if browser is not None and user_data_dir:
+            raise ValueError("Perfil persistente não pode ser usado com um navegador compartilhado")
+        if har_path and har_modo not in (HAR_GRAVAR, HAR_REPRODUZIR):
+            raise ValueError(f"Modo HAR inválido: {har_modo}")
+
+        self.browser = browser
+        self.headless = headless
+        self.viewport = viewport or {"width": 1920, "height": 1080}
+        self.user_agent = user_agent
+        self.trace_path = trace_path
+        self.user_data_dir = user_data_dir
+        self.har_path = har_path
+        self.har_modo = har_modo
+        self.timeout = timeout
+        self.bloquear_recursos = set(bloquear_recursos or [])
+        self.context = None
+        self.page = None
+        self.reciclagens = 0
+        self._playwright_cm = None
+        self._playwright = None
+        self._browser_proprio = False
+
+    def __enter__(self) -> "SessaoNavegador":
+        if self.browser is None:
+            self._playwright_cm = sync_playwright()
+            self._playwright = self._playwright_cm.__enter__()
+
+        try:
+            if self.browser is None and not self.user_data_dir:
+                self.browser = self._playwright.chromium.launch(headless=self.headless)
+                self._browser_proprio = True
+            self._abrir_contexto()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, *args) -> None:
+        try:
+            self._fechar_contexto()
+        finally:
+            if self._browser_proprio:
+                self.browser.close()
+            if self._playwright_cm:
+                self._playwright_cm.__exit__(None, None, None)
+                self._playwright_cm = None
+
+    @staticmethod
+    def _caminho_parte(caminho: str, parte: int) -> str:
+        """Caminho do arquivo de um contexto (parte 0 = caminho original, parte 1 = '<nome>_2', ...)."""
+        if parte == 0:
+            return caminho
+        original = Path(caminho)
+        return str(original.with_name(f"{original.stem}_{parte + 1}{original.suffix}"))
+
+    def _caminho_trace_atual(self) -> Optional[str]:
+        """Caminho do trace do contexto atual (um arquivo por contexto reciclado)."""
+        if not self.trace_path:
+            return None
+        return self._caminho_parte(self.trace_path, self.reciclagens)
+
+    def partes_har(self) -> list[str]:
+        """Arquivos HAR existentes (um por contexto gravado)."""
+        partes = []
+        while Path(self._caminho_parte(self.har_path, len(partes))).exists():
+            partes.append(self._caminho_parte(self.har_path, len(partes)))
+        return partes
+
+    def _configurar_har(self) -> None:
+        """Grava ou reproduz o tráfego do contexto a partir de arquivos HAR."""
+        if self.har_modo == HAR_GRAVAR:
+            # Cada contexto (inclusive os reciclados) grava seu próprio arquivo ao ser fechado
+            Path(self.har_path).parent.mkdir(parents=True, exist_ok=True)
+            if self.reciclagens == 0:
+                # Partes de uma gravação anterior seriam reproduzidas junto com esta
+                for parte in self.partes_har():
+                    Path(parte).unlink(missing_ok=True)
+            self.context.route_from_har(
+                self._caminho_parte(self.har_path, self.reciclagens),
+                update=True,
+                update_content="embed",
+                update_mode="full"
+            )
+            return
+
+        partes = self.partes_har()
+        if not partes:
+            raise FileNotFoundError(f"Arquivo HAR não encontrado: {self.har_path}")
+
+        # Rotas são avaliadas na ordem inversa do registro: primeiro os HARs,
+        # e o que não estiver gravado cai no bloqueio geral (sem acesso à rede)
+        self.context.route("**/*", lambda route: route.abort())
+        for parte in partes:
+            self.context.route_from_har(parte, not_found="fallback")
+
+    def _abrir_contexto(self) -> None:
+        opcoes = {"viewport": self.viewport, "user_agent": self.user_agent}
+        if self.user_data_dir:
+            self.context = self._playwright.chromium.launch_persistent_context(
+                self.user_data_dir,
+                headless=self.headless,
+                **opcoes
+            )
+        else:
+            self.context = self.browser.new_context(**opcoes)
+
+        if self.har_path:
+            self._configurar_har()
+        if self.bloquear_recursos:
+            # Registrada por último, é avaliada antes das rotas de HAR
+            self.context.route("**/*", self._filtrar_recurso)
+        if self.timeout:
+            self.context.set_default_timeout(self.timeout)
+        if self.trace_path:
+            self.context.tracing.start(screenshots=True, snapshots=True)
+        # O contexto persistente já abre com uma página
+        self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+
+    def _filtrar_recurso(self, route) -> None:
+        """Aborta os recursos bloqueados e deixa os demais seguirem para as próximas rotas."""
+        if route.request.resource_type in self.bloquear_recursos:
+            route.abort()
+        else:
+            route.fallback()
+
+    def _fechar_contexto(self) -> None:
+        if self.context is None:
+            return
+        try:
+            if self.trace_path:
+                self.context.tracing.stop(path=self._caminho_trace_atual())
+        finally:
+            self.context.close()
+            self.context = None
+            self.page = None
+
+    def reciclar(self):
+        """
+        Fecha o contexto atual e abre um novo, liberando a memória do anterior.
+
+        Returns:
+            Nova página
+        """
+        self._fechar_contexto()
+        self.reciclagens += 1
+        self._abrir_contexto()
+        return self.page
+
+    def rss_navegador_mb(self) -> Optional[float]:
+        """
+        Retorna a memória do navegador desta sessão (processos do Chromium).
+
+        Mede só a árvore do driver do Playwright que abriu o navegador, para
+        não somar os navegadores de outros workers (ex: pool do `serve`). Se o
+        driver não puder ser identificado, mede todos os descendentes do processo.
+        """
+        pid = pid_driver_playwright(self.browser or self.context)
+        return rss_descendentes_mb(pid) if pid else rss_descendentes_mb()
+
+    def nova_pagina(self):
+        """Abre uma página adicional no contexto atual."""
+        return self.context.new_page()
+
+
+class PlaywrightExtractor(BaseExtractor):
+    """
+    Base para extractors que usam o navegador via Playwright.
+
+    Centraliza as opções de navegador comuns a todos eles: reciclagem do
+    contexto, perfil persistente, gravação/reprodução de tráfego em HAR e
+    a configuração de desempenho (esperas, timeouts e bloqueio de recursos).
+    """
+
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+    # Seletores CSS por campo (listas de candidatos são resolvidas de forma adaptativa)
+    SELECTORS: dict = {}
+
+    # Campos opcionais: candidatos sempre na ordem declarada (ver ResolvedorSeletores)
+    SELETORES_ORDEM_FIXA: tuple = ()
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        reciclar_a_cada: Optional[int] = None,
+        limite_memoria_mb: Optional[float] = None,
+        user_data_dir: Optional[str] = None,
+        har_path: Optional[str] = None,
+        har_modo: Optional[str] = None,
+        seletores_path: Optional[str] = str(CAMINHO_PADRAO),
+        **kwargs
+    ):
+        """
+        Inicializa o extractor.
+
+        Args:
+            url: URL da página para extrair dados
+            *args: Argumentos posicionais de BaseExtractor (limit, callback, ...)
+            reciclar_a_cada: Recicla o contexto do navegador a cada N páginas extraídas
+            limite_memoria_mb: Recicla o contexto quando o RSS do navegador passar deste valor
+            user_data_dir: Diretório de perfil persistente do navegador (opcional)
+            har_path: Arquivo HAR para gravar ou reproduzir o tráfego (opcional)
+            har_modo: 'gravar' ou 'reproduzir'
+            seletores_path: Arquivo de estatísticas dos seletores (None = apenas em memória)
+            **kwargs: Demais argumentos de BaseExtractor
+        """
+        super().__init__(url, *args, **kwargs)
+        self.reciclar_a_cada = reciclar_a_cada
+        self.limite_memoria_mb = limite_memoria_mb
+        self.user_data_dir = user_data_dir
+        self.har_path = har_path
+        self.har_modo = har_modo
+        self.seletores = ResolvedorSeletores(
+            {campo: lista for campo, lista in self.SELECTORS.items() if isinstance(lista, list)},
+            caminho=seletores_path,
+            ordem_fixa=self.SELETORES_ORDEM_FIXA
+        )
+
+    def _finalizar_seletores(self) -> None:
+        """Persiste as estatísticas dos seletores e reporta os que pararam de funcionar."""
+        try:
+            self.seletores.salvar()
+        except OSError as e:
+            self._log(f"⚠ Não foi possível salvar as estatísticas de seletores: {e}")
+        for alerta in self.seletores.alertas():
+            self._log(f"⚠ Seletor: {alerta}")
+
+    def _reservar_perfil(self):
+        """Reserva o perfil persistente (ou uma cópia isolada, se estiver em uso)."""
+        if not self.user_data_dir:
+            return nullcontext()
+        return PerfilNavegador(self.user_data_dir).abrir()
+
+    def _criar_sessao(self, user_data_dir: Optional[str] = None) -> SessaoNavegador:
+        """Cria a sessão de navegador usada pela extração."""
+        return SessaoNavegador(
+            browser=self.browser,
+            headless=self.config.headless,
+            viewport=self.config.viewport,
+            user_agent=self.config.user_agent or self.USER_AGENT,
+            trace_path=self.trace_path,
+            user_data_dir=user_data_dir,
+            har_path=self.har_path,
+            har_modo=self.har_modo,
+            timeout=self.config.timeout_navegacao,
+            bloquear_recursos=self.config.bloquear_recursos
+        )
+
+    @contextmanager
+    def _abrir_sessao(self) -> Iterator[SessaoNavegador]:
+        """Abre a sessão de navegador, reservando o perfil persistente se configurado."""
+        with self._reservar_perfil() as user_data_dir, self._criar_sessao(user_data_dir) as sessao:
+            yield sessao
+
+    def _precisa_reciclar(self, processados_no_contexto: int, sessao: Optional[SessaoNavegador] = None) -> bool:
+        """Verifica se o contexto atingiu o limite de páginas ou de memória (do navegador da sessão)."""
+        if self.reciclar_a_cada and processados_no_contexto >= self.reciclar_a_cada:
+            return True
+        if self.limite_memoria_mb and processados_no_contexto > 0:
+            rss = sessao.rss_navegador_mb() if sessao else rss_descendentes_mb()
+            return rss is not None and rss > self.limite_memoria_mb
+        return False
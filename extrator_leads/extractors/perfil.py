@@ -0,0 +1,202 @@
+"""Perfil persistente do navegador (cache e cookies reaproveitados entre execuções)."""
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock, cada execução usa uma cópia isolada
+    fcntl = None
+
+# Arquivos de lock do Chromium que não podem ser copiados para outra instância
+_ARQUIVOS_LOCK = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+# Diretórios de cache descartáveis (cookies e consentimento ficam preservados)
+_DIRETORIOS_CACHE = (
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "Default/Service Worker/CacheStorage",
+    "Default/Service Worker/ScriptCache",
+    "GrShaderCache",
+    "ShaderCache",
+    "GraphiteDawnCache",
+)
+
+_NOME_LOCK = ".extrator.lock"
+
+
+class PerfilNavegador:
+    """
+    Diretório de dados do usuário do Chromium reaproveitado entre execuções.
+
+    Mantém os bundles JavaScript do Maps em cache e os cookies de
+    consentimento, reduzindo o tempo de carregamento das buscas repetidas.
+    Um único processo usa o perfil base por vez; execuções concorrentes
+    recebem uma cópia isolada, descartada ao final.
+    """
+
+    def __init__(self, diretorio: str):
+        """
+        Inicializa o perfil.
+
+        Args:
+            diretorio: Diretório do perfil base (criado se não existir)
+        """
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def abrir(self) -> Iterator[str]:
+        """
+        Reserva um diretório de perfil para uma execução.
+
+        Usa o perfil base se estiver livre; caso contrário, uma cópia isolada.
+
+        Yields:
+            Caminho do diretório a passar para launch_persistent_context
+        """
+        lock = self._tentar_lock()
+        if lock is not None:
+            try:
+                yield str(self.diretorio)
+            finally:
+                lock.close()
+            return
+
+        with self.copia_isolada() as copia:
+            yield copia
+
+    @contextmanager
+    def copia_isolada(self) -> Iterator[str]:
+        """
+        Cria uma cópia temporária do perfil base para um worker concorrente.
+
+        Yields:
+            Caminho da cópia (removida ao final)
+        """
+        destino = Path(tempfile.mkdtemp(prefix="extrator-perfil-"))
+        try:
+            shutil.copytree(
+                self.diretorio,
+                destino,
+                ignore=shutil.ignore_patterns(*_ARQUIVOS_LOCK, _NOME_LOCK),
+                ignore_dangling_symlinks=True,
+                dirs_exist_ok=True
+            )
+            yield str(destino)
+        finally:
+            shutil.rmtree(destino, ignore_errors=True)
+
+    def _tentar_lock(self):
+        """Tenta obter o lock exclusivo do perfil base (não bloqueante)."""
+        if fcntl is None:
+            return None
+
+        arquivo = open(self.diretorio / _NOME_LOCK, "w")
+        try:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            arquivo.close()
+            return None
+        return arquivo
+
+    def tamanho_mb(self) -> float:
+        """Retorna o tamanho total do perfil em MB."""
+        total = 0
+        for raiz, _, arquivos in os.walk(self.diretorio):
+            for nome in arquivos:
+                try:
+                    total += (Path(raiz) / nome).lstat().st_size
+                except OSError:
+                    continue
+        return total / (1024 * 1024)
+
+    def purgar(self, limite_mb: Optional[float] = None) -> bool:
+        """
+        Remove os caches do perfil se ele passar do limite.
+
+        Primeiro descarta só os caches (preservando cookies); se ainda assim
+        o perfil continuar acima do limite, apaga o perfil inteiro.
+
+        Args:
+            limite_mb: Tamanho máximo em MB (None = purga sempre)
+
+        Returns:
+            True se algo foi removido
+
+        Raises:
+            RuntimeError: Se o perfil base estiver em uso por outro processo
+        """
+        lock = self._tentar_lock()
+        if lock is None and fcntl is not None:
+            raise RuntimeError(f"Perfil em uso por outro processo: {self.diretorio}")
+
+        try:
+            if limite_mb is not None and self.tamanho_mb() <= limite_mb:
+                return False
+
+            for relativo in _DIRETORIOS_CACHE:
+                shutil.rmtree(self.diretorio / relativo, ignore_errors=True)
+
+            if limite_mb is not None and self.tamanho_mb() > limite_mb:
+                # Apaga tudo menos o arquivo de lock, que continua reservado até o fim
+                for item in self.diretorio.iterdir():
+                    if item.name == _NOME_LOCK:
+                        continue
+                    if item.is_dir() and not item.is_symlink():
+                        shutil.rmtree(item, ignore_errors=True)
+                    else:
+                        item.unlink(missing_ok=True)
+
+            return True
+        finally:
+            if lock is not None:
+                lock.close()
+
+    def aquecer(self, urls: List[str], headless: bool = True, callback=None) -> None:
+        """
+        Visita as URLs com o perfil base para popular o cache e os cookies.
+
+        Args:
+            urls: URLs a visitar (ex: uma busca típica do Google Maps)
+            headless: Executa o navegador sem interface gráfica
+            callback: Função para reportar progresso (opcional)
+
+        Raises:
+            RuntimeError: Se o perfil base estiver em uso por outro processo
+        """
+        from extrator_leads.extractors.navegador import SessaoNavegador
+
+        lock = self._tentar_lock()
+        if lock is None and fcntl is not None:
+            raise RuntimeError(f"Perfil em uso por outro processo: {self.diretorio}")
+
+        try:
+            with SessaoNavegador(headless=headless, user_data_dir=str(self.diretorio)) as sessao:
+                for url in urls:
+                    if callback:
+                        callback(f"Aquecendo perfil: {url}")
+                    sessao.page.goto(url, wait_until="load", timeout=60000)
+                    _aceitar_consentimento(sessao.page)
+                    sessao.page.wait_for_timeout(3000)
+        finally:
+            if lock is not None:
+                lock.close()
+
+
+def _aceitar_consentimento(page) -> None:
+    """Aceita a tela de consentimento de cookies do Google, se aparecer."""
+    for seletor in ('button[aria-label*="Aceitar"]', 'button[aria-label*="Accept"]', 'form[action*="consent"] button'):
+        try:
+            botao = page.locator(seletor).first
+            if botao.is_visible():
+                botao.click()
+                page.wait_for_load_state("load")
+                return
+        except Exception:
+            continue
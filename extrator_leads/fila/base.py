@@ -0,0 +1,103 @@
+"""Interfaces da fila de trabalho distribuída e do destino de leads."""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+from extrator_leads.core.models import Lead
+
+
+class ItemFila(BaseModel):
+    """Item da fila: uma URL (busca ou estabelecimento) a ser extraída."""
+
+    id: int
+    url: str
+    limit: Optional[int] = None
+    tentativas: int = 0
+    token: Optional[str] = None  # identifica o arrendamento atual
+
+
+class FilaTrabalho(ABC):
+    """
+    Fila de trabalho com arrendamento (lease) e timeout de visibilidade.
+
+    Um item arrendado fica invisível para os demais workers até o fim do
+    timeout de visibilidade. Se o worker morrer sem concluir o item, ele
+    volta a ficar visível e é arrendado novamente por outro worker.
+    """
+
+    @abstractmethod
+    def enfileirar(self, url: str, limit: Optional[int] = None) -> bool:
+        """
+        Adiciona uma URL à fila.
+
+        Args:
+            url: URL de busca ou de estabelecimento
+            limit: Número máximo de leads a extrair da URL
+
+        Returns:
+            True se foi adicionada, False se a URL já estava na fila
+        """
+        pass
+
+    @abstractmethod
+    def arrendar(self, worker: str, visibilidade: float) -> Optional[ItemFila]:
+        """
+        Arrenda o próximo item visível da fila.
+
+        Args:
+            worker: Identificador do worker
+            visibilidade: Segundos em que o item fica invisível para outros workers
+
+        Returns:
+            Item arrendado ou None se não houver itens disponíveis
+        """
+        pass
+
+    @abstractmethod
+    def renovar(self, item: ItemFila, visibilidade: float) -> bool:
+        """
+        Estende o arrendamento de um item ainda em processamento.
+
+        Returns:
+            False se o arrendamento expirou e o item foi arrendado por outro worker
+        """
+        pass
+
+    @abstractmethod
+    def concluir(self, item: ItemFila) -> bool:
+        """
+        Marca o item como concluído.
+
+        Returns:
+            False se o arrendamento não pertence mais a este worker
+        """
+        pass
+
+    @abstractmethod
+    def falhar(self, item: ItemFila, erro: str) -> None:
+        """
+        Registra a falha de um item.
+
+        O item volta para a fila até atingir o número máximo de tentativas.
+        """
+        pass
+
+    @abstractmethod
+    def estatisticas(self) -> Dict[str, int]:
+        """Retorna a quantidade de itens por status."""
+        pass
+
+
+class DestinoLeads(ABC):
+    """Destino compartilhado onde os workers gravam os leads extraídos."""
+
+    @abstractmethod
+    def gravar(self, leads: List[Lead], item: ItemFila) -> None:
+        """
+        Grava os leads extraídos de um item da fila.
+
+        Args:
+            leads: Leads extraídos
+            item: Item da fila de onde vieram
+        """
+        pass
@@ -0,0 +1,252 @@
+"""Implementação da fila de trabalho e do destino de leads em arquivo SQLite."""
+
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from extrator_leads.core.csv_exporter import COLUNAS
+from extrator_leads.core.models import Lead
+from extrator_leads.fila.base import DestinoLeads, FilaTrabalho, ItemFila
+
+PENDENTE = "pendente"
+CONCLUIDO = "concluido"
+FALHOU = "falhou"
+
+
+class _BancoSQLite:
+    """Base para classes que usam um arquivo SQLite compartilhado entre processos."""
+
+    SCHEMA = ""
+
+    def __init__(self, caminho: str, timeout: float = 30.0):
+        """
+        Inicializa o banco, criando o arquivo e as tabelas se necessário.
+
+        Args:
+            caminho: Caminho do arquivo SQLite
+            timeout: Tempo máximo de espera por um lock de escrita
+        """
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        with self._conectar() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._migrar(conn)
+
+    def _migrar(self, conn: sqlite3.Connection) -> None:
+        """Atualiza tabelas criadas por versões anteriores do schema."""
+
+    @contextmanager
+    def _conectar(self) -> Iterator[sqlite3.Connection]:
+        """Abre uma conexão curta; cada operação é uma transação."""
+        conn = sqlite3.connect(self.caminho, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+class FilaSQLite(_BancoSQLite, FilaTrabalho):
+    """
+    Fila de trabalho em um arquivo SQLite.
+
+    Funciona entre processos e entre máquinas que compartilham o arquivo
+    (os arrendamentos são feitos com transações `BEGIN IMMEDIATE`). Em
+    sistemas de arquivos de rede sem lock confiável, prefira uma
+    implementação de FilaTrabalho baseada em um servidor.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS itens (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT NOT NULL UNIQUE,
+            limite INTEGER,
+            status TEXT NOT NULL DEFAULT 'pendente',
+            tentativas INTEGER NOT NULL DEFAULT 0,
+            visivel_em REAL NOT NULL DEFAULT 0,
+            worker TEXT,
+            token TEXT,
+            erro TEXT,
+            criado_em REAL NOT NULL,
+            atualizado_em REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_itens_disponiveis ON itens (status, visivel_em);
+    """
+
+    def __init__(self, caminho: str, max_tentativas: int = 3, timeout: float = 30.0):
+        """
+        Inicializa a fila.
+
+        Args:
+            caminho: Caminho do arquivo SQLite
+            max_tentativas: Tentativas antes de marcar o item como falho
+            timeout: Tempo máximo de espera por um lock de escrita
+        """
+        self.max_tentativas = max_tentativas
+        super().__init__(caminho, timeout=timeout)
+
+    def enfileirar(self, url: str, limit: Optional[int] = None) -> bool:
+        agora = time.time()
+        with self._conectar() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO itens (url, limite, criado_em, atualizado_em) VALUES (?, ?, ?, ?)",
+                (url, limit, agora, agora)
+            )
+            return cursor.rowcount == 1
+
+    def arrendar(self, worker: str, visibilidade: float) -> Optional[ItemFila]:
+        agora = time.time()
+        token = uuid.uuid4().hex
+        with self._conectar() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Itens cujo arrendamento expirou sem falhar() (ex: o worker morreu
+                # no meio da extração) também esgotam as tentativas
+                conn.execute(
+                    "UPDATE itens SET status = ?, erro = COALESCE(erro, ?), atualizado_em = ? "
+                    "WHERE status = ? AND visivel_em <= ? AND tentativas >= ?",
+                    (FALHOU, "Arrendamento expirado sem conclusão", agora, PENDENTE, agora, self.max_tentativas)
+                )
+                linha = conn.execute(
+                    "SELECT id, url, limite, tentativas FROM itens "
+                    "WHERE status = ? AND visivel_em <= ? ORDER BY id LIMIT 1",
+                    (PENDENTE, agora)
+                ).fetchone()
+                if linha is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                conn.execute(
+                    "UPDATE itens SET visivel_em = ?, tentativas = tentativas + 1, "
+                    "worker = ?, token = ?, atualizado_em = ? WHERE id = ?",
+                    (agora + visibilidade, worker, token, agora, linha["id"])
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return ItemFila(
+            id=linha["id"],
+            url=linha["url"],
+            limit=linha["limite"],
+            tentativas=linha["tentativas"] + 1,
+            token=token
+        )
+
+    def renovar(self, item: ItemFila, visibilidade: float) -> bool:
+        agora = time.time()
+        with self._conectar() as conn:
+            cursor = conn.execute(
+                "UPDATE itens SET visivel_em = ?, atualizado_em = ? "
+                "WHERE id = ? AND token = ? AND status = ?",
+                (agora + visibilidade, agora, item.id, item.token, PENDENTE)
+            )
+            return cursor.rowcount == 1
+
+    def concluir(self, item: ItemFila) -> bool:
+        with self._conectar() as conn:
+            cursor = conn.execute(
+                "UPDATE itens SET status = ?, erro = NULL, atualizado_em = ? "
+                "WHERE id = ? AND token = ? AND status = ?",
+                (CONCLUIDO, time.time(), item.id, item.token, PENDENTE)
+            )
+            return cursor.rowcount == 1
+
+    def falhar(self, item: ItemFila, erro: str) -> None:
+        # Sem tentativas restantes, o item é marcado como falho; senão fica visível de novo
+        status = FALHOU if item.tentativas >= self.max_tentativas else PENDENTE
+        agora = time.time()
+        with self._conectar() as conn:
+            conn.execute(
+                "UPDATE itens SET status = ?, erro = ?, visivel_em = ?, atualizado_em = ? "
+                "WHERE id = ? AND token = ? AND status = ?",
+                (status, erro, agora, agora, item.id, item.token, PENDENTE)
+            )
+
+    def estatisticas(self) -> Dict[str, int]:
+        agora = time.time()
+        with self._conectar() as conn:
+            linhas = conn.execute(
+                "SELECT CASE WHEN status = ? AND visivel_em > ? THEN 'em_execucao' ELSE status END AS estado, "
+                "COUNT(*) AS total FROM itens GROUP BY estado",
+                (PENDENTE, agora)
+            ).fetchall()
+        estatisticas = {PENDENTE: 0, "em_execucao": 0, CONCLUIDO: 0, FALHOU: 0}
+        estatisticas.update({linha["estado"]: linha["total"] for linha in linhas})
+        return estatisticas
+
+    def falhas(self) -> List[Dict[str, str]]:
+        """Retorna as URLs que esgotaram as tentativas, com o último erro."""
+        with self._conectar() as conn:
+            linhas = conn.execute(
+                "SELECT url, erro, tentativas FROM itens WHERE status = ? ORDER BY id", (FALHOU,)
+            ).fetchall()
+        return [dict(linha) for linha in linhas]
+
+
+class DestinoSQLite(_BancoSQLite, DestinoLeads):
+    """Destino de leads em um arquivo SQLite compartilhado entre workers."""
+
+    # As mesmas colunas do CSV exportado, para o export do `serve` não perder dados
+    COLUNAS = COLUNAS
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS leads (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            telefone TEXT,
+            email TEXT,
+            website TEXT,
+            fonte TEXT NOT NULL,
+            url_origem TEXT NOT NULL,
+            place_id TEXT,
+            email_status TEXT,
+            item_id INTEGER,
+            criado_em REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_leads_item ON leads (item_id);
+    """
+
+    def _migrar(self, conn: sqlite3.Connection) -> None:
+        """Adiciona as colunas que faltam em bancos criados antes de place_id/email_status."""
+        existentes = {linha["name"] for linha in conn.execute("PRAGMA table_info(leads)")}
+        for coluna in self.COLUNAS:
+            if coluna not in existentes:
+                conn.execute(f"ALTER TABLE leads ADD COLUMN {coluna} TEXT")
+
+    def gravar(self, leads: List[Lead], item: ItemFila) -> None:
+        agora = time.time()
+        with self._conectar() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Um item reprocessado (arrendamento expirado) substitui os leads anteriores
+                conn.execute("DELETE FROM leads WHERE item_id = ?", (item.id,))
+                conn.executemany(
+                    f"INSERT INTO leads ({', '.join(self.COLUNAS)}, item_id, criado_em) "
+                    f"VALUES ({', '.join('?' * (len(self.COLUNAS) + 2))})",
+                    [
+                        (*(lead.to_dict()[c] for c in self.COLUNAS), item.id, agora)
+                        for lead in leads
+                    ]
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def ler_leads(self) -> Iterator[Lead]:
+        """Itera sobre todos os leads gravados."""
+        with self._conectar() as conn:
+            for linha in conn.execute(f"SELECT {', '.join(self.COLUNAS)} FROM leads ORDER BY id"):
+                yield Lead(**{c: linha[c] for c in self.COLUNAS})
+
+    def total(self) -> int:
+        """Retorna a quantidade de leads gravados."""
+        with self._conectar() as conn:
+            return conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
@@ -0,0 +1,115 @@
+"""Worker que consome a fila de trabalho e executa os extractors."""
+
+import os
+import socket
+import threading
+from typing import Optional
+
+from extrator_leads.core.extractor_factory import ExtractorFactory
+from extrator_leads.fila.base import DestinoLeads, FilaTrabalho, ItemFila
+
+
+class WorkerFila:
+    """Arrenda itens da fila, extrai os leads e os grava no destino compartilhado."""
+
+    def __init__(
+        self,
+        fila: FilaTrabalho,
+        destino: DestinoLeads,
+        visibilidade: float = 600.0,
+        intervalo_ociosidade: float = 5.0,
+        callback=None,
+        worker_id: Optional[str] = None,
+        opcoes_extractor: Optional[dict] = None
+    ):
+        """
+        Inicializa o worker.
+
+        Args:
+            fila: Fila de onde os itens são arrendados
+            destino: Destino onde os leads são gravados
+            visibilidade: Timeout de visibilidade do arrendamento (segundos)
+            intervalo_ociosidade: Espera entre consultas quando a fila está vazia
+            callback: Função para reportar progresso (opcional)
+            worker_id: Identificador do worker (padrão: host:pid)
+            opcoes_extractor: Opções adicionais repassadas aos extractors
+        """
+        self.fila = fila
+        self.destino = destino
+        self.visibilidade = visibilidade
+        self.intervalo_ociosidade = intervalo_ociosidade
+        self.callback = callback
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.opcoes_extractor = opcoes_extractor or {}
+        self.processados = 0
+        self._parar = threading.Event()
+
+    def _log(self, mensagem: str) -> None:
+        if self.callback:
+            self.callback(mensagem)
+
+    def parar(self) -> None:
+        """Solicita que o worker pare após o item atual."""
+        self._parar.set()
+
+    def executar(self, max_itens: Optional[int] = None, parar_quando_vazia: bool = False) -> int:
+        """
+        Processa itens da fila até ser parado.
+
+        Args:
+            max_itens: Número máximo de itens a processar (None = sem limite)
+            parar_quando_vazia: Se True, encerra quando não houver itens visíveis
+
+        Returns:
+            Quantidade de itens processados
+        """
+        while not self._parar.is_set():
+            if max_itens is not None and self.processados >= max_itens:
+                break
+
+            item = self.fila.arrendar(self.worker_id, self.visibilidade)
+            if item is None:
+                if parar_quando_vazia:
+                    break
+                self._parar.wait(self.intervalo_ociosidade)
+                continue
+
+            self.processar(item)
+            self.processados += 1
+
+        return self.processados
+
+    def processar(self, item: ItemFila) -> None:
+        """Extrai os leads de um item, mantendo o arrendamento renovado durante a execução."""
+        self._log(f"[{item.id}] {item.url} (tentativa {item.tentativas})")
+
+        parar_renovacao = threading.Event()
+        renovacao = threading.Thread(target=self._renovar_periodicamente, args=(item, parar_renovacao), daemon=True)
+        renovacao.start()
+
+        try:
+            extractor = ExtractorFactory.criar_extractor(
+                item.url,
+                limit=item.limit,
+                callback=self.callback,
+                **self.opcoes_extractor
+            )
+            leads = extractor.extract()
+            self.destino.gravar(leads, item)
+            if self.fila.concluir(item):
+                self._log(f"  ✓ {len(leads)} lead(s) gravado(s)")
+            else:
+                self._log("  ✗ Arrendamento expirou; item será processado por outro worker")
+        except Exception as e:
+            self.fila.falhar(item, str(e))
+            self._log(f"  ✗ Erro: {str(e)[:80]}")
+        finally:
+            parar_renovacao.set()
+            renovacao.join()
+
+    def _renovar_periodicamente(self, item: ItemFila, parar: threading.Event) -> None:
+        """Renova o arrendamento a cada terço do timeout de visibilidade."""
+        intervalo = max(self.visibilidade / 3, 0.01)
+        while not parar.wait(intervalo):
+            if not self.fila.renovar(item, self.visibilidade):
+                return
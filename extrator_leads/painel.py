@@ -0,0 +1,197 @@
+"""Painel ao vivo da extração na CLI (janela de leads recentes, taxa, erros e ETA)."""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.markup import escape
+from rich.table import Table
+from rich.text import Text
+
+from extrator_leads.core.models import Lead
+from extrator_leads.core.retry import FalhaExtracao
+
+# Acima desta quantidade de leads, a tabela final mostra só o resumo
+LIMITE_TABELA_COMPLETA = 50
+
+PADRAO_PROGRESSO = re.compile(r'\[(\d+)/(\d+)\]')
+
+
+def _cortar(texto: Optional[str], tamanho: int) -> str:
+    if not texto:
+        return "[dim]N/A[/dim]"
+    texto = str(texto)
+    return escape(texto[:tamanho] + "..." if len(texto) > tamanho else texto)
+
+
+class PainelExtracao:
+    """
+    Painel ao vivo alimentado pelos leads, falhas e mensagens da extração.
+
+    Guarda apenas uma janela fixa dos leads mais recentes e contadores, e
+    redesenha no máximo `max_fps` vezes por segundo, então o custo de
+    exibição não depende da quantidade de leads. Expõe `add_task` e
+    `console` como o `rich.progress.Progress`, para substituí-lo no extract.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        janela: int = 8,
+        max_fps: float = 4.0,
+        janela_taxa: float = 30.0,
+        relogio: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o painel (sem exibir nada até entrar no contexto).
+
+        Args:
+            console: Console Rich onde o painel é desenhado
+            janela: Quantidade de leads recentes exibidos
+            max_fps: Máximo de redesenhos por segundo
+            janela_taxa: Segundos considerados no cálculo da taxa (média móvel)
+            relogio: Fonte de tempo (injetável para testes)
+        """
+        self.console = console
+        self.max_fps = max_fps
+        self.janela_taxa = janela_taxa
+        self.relogio = relogio
+        self.recentes: "deque[Lead]" = deque(maxlen=janela)
+        self.total = 0
+        self.erros = 0
+        self.processados = 0
+        self.total_previsto: Optional[int] = None
+        self.etapa = ""
+        self.mensagem = ""
+        self.redesenhos = 0
+        self._instantes: "deque[float]" = deque()
+        self._inicio = relogio()
+        self._ultimo_redesenho: Optional[float] = None
+        self._lock = threading.Lock()
+        self._live = Live(console=console, auto_refresh=False, transient=True)
+
+    def __enter__(self) -> "PainelExtracao":
+        self._live.start()
+        self._redesenhar(forcar=True)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._live.stop()
+
+    def add_task(self, description: str, total=None) -> None:
+        """Define a etapa atual (mesma assinatura do Progress.add_task)."""
+        with self._lock:
+            self.etapa = description
+        self._redesenhar(forcar=True)
+
+    def registrar_lead(self, lead: Lead) -> None:
+        """Registra um lead recém-extraído."""
+        agora = self.relogio()
+        with self._lock:
+            self.total += 1
+            self.recentes.append(lead)
+            self._instantes.append(agora)
+        self._redesenhar()
+
+    def registrar_falha(self, falha: FalhaExtracao) -> None:
+        """Registra um item que falhou em definitivo (on_falha do extractor, após as retentativas)."""
+        with self._lock:
+            self.erros += 1
+        self._redesenhar()
+
+    def registrar_mensagem(self, mensagem: str) -> None:
+        """Registra uma mensagem de progresso do extractor (etapa e avanço)."""
+        with self._lock:
+            self.mensagem = mensagem.strip()
+            progresso = PADRAO_PROGRESSO.search(mensagem)
+            if progresso:
+                self.processados = int(progresso.group(1))
+                self.total_previsto = int(progresso.group(2))
+        self._redesenhar()
+
+    def taxa(self) -> float:
+        """Leads por segundo na janela recente."""
+        agora = self.relogio()
+        with self._lock:
+            while self._instantes and agora - self._instantes[0] > self.janela_taxa:
+                self._instantes.popleft()
+            janela = min(self.janela_taxa, agora - self._inicio)
+            return len(self._instantes) / janela if janela > 0 else 0.0
+
+    def eta(self) -> Optional[float]:
+        """Segundos estimados até o fim (None sem total previsto ou sem taxa)."""
+        taxa = self.taxa()
+        if not self.total_previsto or taxa <= 0:
+            return None
+        return max(self.total_previsto - self.processados, 0) / taxa
+
+    def _redesenhar(self, forcar: bool = False) -> None:
+        agora = self.relogio()
+        if not forcar and self._ultimo_redesenho is not None and agora - self._ultimo_redesenho < 1 / self.max_fps:
+            return
+        self._ultimo_redesenho = agora
+        self.redesenhos += 1
+        self._live.update(self.renderizar(), refresh=True)
+
+    def renderizar(self) -> Group:
+        """Monta o painel (contadores, leads recentes e a última mensagem)."""
+        eta = self.eta()
+        progresso = f"{self.processados}/{self.total_previsto}" if self.total_previsto else "-"
+        contadores = Text.assemble(
+            ("Leads ", "bold"), (str(self.total), "green"),
+            ("  Progresso ", "bold"), progresso,
+            ("  Taxa ", "bold"), f"{self.taxa():.2f}/s",
+            ("  Erros ", "bold"), (str(self.erros), "red" if self.erros else "dim"),
+            ("  ETA ", "bold"), f"{eta:.0f}s" if eta is not None else "-",
+        )
+
+        table = Table(show_header=True, header_style="bold magenta", expand=True)
+        table.add_column("Nome", style="cyan", ratio=3)
+        table.add_column("Telefone", style="green", ratio=2)
+        table.add_column("Website", style="blue", ratio=3)
+        with self._lock:
+            recentes = list(self.recentes)
+        for lead in recentes:
+            table.add_row(_cortar(lead.nome, 40), _cortar(lead.telefone, 20), _cortar(lead.website, 30))
+
+        return Group(
+            Text(self.etapa, style="bold cyan"),
+            contadores,
+            table,
+            Text(self.mensagem[:120], style="dim"),
+        )
+
+
+def tabela_leads(leads: List[Lead], limite: int = LIMITE_TABELA_COMPLETA) -> Table:
+    """
+    Tabela final dos leads: completa até `limite` leads, senão apenas o resumo.
+
+    Args:
+        leads: Leads extraídos
+        limite: Quantidade máxima de leads listados individualmente
+
+    Returns:
+        Tabela Rich
+    """
+    if len(leads) <= limite:
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("#", style="dim", width=4)
+        table.add_column("Nome", style="cyan")
+        table.add_column("Telefone", style="green")
+        table.add_column("Website", style="blue")
+        for idx, lead in enumerate(leads, 1):
+            table.add_row(str(idx), _cortar(lead.nome, 40), _cortar(lead.telefone, 20), _cortar(lead.website, 30))
+        return table
+
+    table = Table(show_header=True, header_style="bold magenta", title=f"Resumo de {len(leads)} leads")
+    table.add_column("Campo", style="cyan")
+    table.add_column("Preenchido", justify="right")
+    table.add_column("%", justify="right", style="dim")
+    for campo in ("telefone", "email", "website", "place_id"):
+        preenchidos = sum(1 for lead in leads if getattr(lead, campo))
+        table.add_row(campo, str(preenchidos), f"{100 * preenchidos / len(leads):.0f}%")
+    return table
@@ -0,0 +1,169 @@
+"""API HTTP local do serviço de extração."""
+
+import csv
+import io
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from extrator_leads.core.csv_exporter import COLUNAS
+from extrator_leads.service.jobs import FORMATOS_SUPORTADOS, Job, PoolNavegadores
+
+
+_ROTA_JOB = re.compile(r"^/jobs/(?P<id>[0-9a-f]+)(?P<resultados>/results)?/?$")
+
+
+class ServidorExtracao(ThreadingHTTPServer):
+    """
+    Servidor HTTP que recebe jobs de extração e os executa no pool de navegadores.
+
+    Rotas:
+        POST   /jobs               Cria um job ({"url", "limit", "format"})
+        GET    /jobs               Lista os jobs
+        GET    /jobs/<id>          Status do job
+        GET    /jobs/<id>/results  Resultados em streaming (?format=json|csv)
+        DELETE /jobs/<id>          Cancela o job
+    """
+
+    daemon_threads = True
+
+    def __init__(self, endereco: tuple, pool: PoolNavegadores):
+        """
+        Inicializa o servidor.
+
+        Args:
+            endereco: Tupla (host, porta)
+            pool: Pool de navegadores que executa os jobs
+        """
+        super().__init__(endereco, _HandlerExtracao)
+        self.pool = pool
+
+
+class _HandlerExtracao(BaseHTTPRequestHandler):
+    """Handler das rotas da API."""
+
+    protocol_version = "HTTP/1.1"
+    server: ServidorExtracao
+
+    def log_message(self, *args):
+        pass
+
+    def _responder_json(self, dados, status: int = 200) -> None:
+        corpo = json.dumps(dados, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _erro(self, mensagem: str, status: int) -> None:
+        self._responder_json({"erro": mensagem}, status=status)
+
+    def _obter_job(self, job_id: str) -> Job | None:
+        job = self.server.pool.obter(job_id)
+        if job is None:
+            self._erro("Job não encontrado", 404)
+        return job
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/jobs":
+            self._erro("Rota não encontrada", 404)
+            return
+
+        try:
+            tamanho = int(self.headers.get("Content-Length", 0))
+            dados = json.loads(self.rfile.read(tamanho) or b"{}")
+            url = dados["url"]
+            limit = dados.get("limit")
+            formato = dados.get("format", "json")
+            if limit is not None:
+                limit = int(limit)
+        except (ValueError, KeyError, TypeError):
+            self._erro("Corpo inválido: esperado JSON com 'url' e opcionalmente 'limit' e 'format'", 400)
+            return
+
+        try:
+            job = self.server.pool.enviar(url, limit=limit, formato=formato)
+        except ValueError as e:
+            self._erro(str(e), 400)
+            return
+
+        self._responder_json(job.to_dict(), status=202)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+
+        if url.path.rstrip("/") == "/jobs":
+            self._responder_json([job.to_dict() for job in self.server.pool.listar()])
+            return
+
+        rota = _ROTA_JOB.match(url.path)
+        if not rota:
+            self._erro("Rota não encontrada", 404)
+            return
+
+        job = self._obter_job(rota["id"])
+        if job is None:
+            return
+
+        if not rota["resultados"]:
+            self._responder_json(job.to_dict())
+            return
+
+        formato = parse_qs(url.query).get("format", [job.formato])[0]
+        if formato not in FORMATOS_SUPORTADOS:
+            self._erro(f"Formato não suportado: {formato}", 400)
+            return
+
+        self._transmitir_resultados(job, formato)
+
+    def do_DELETE(self):
+        rota = _ROTA_JOB.match(urlparse(self.path).path)
+        if not rota or rota["resultados"]:
+            self._erro("Rota não encontrada", 404)
+            return
+
+        job = self._obter_job(rota["id"])
+        if job is None:
+            return
+
+        job.cancelar()
+        self._responder_json(job.to_dict())
+
+    def _enviar_chunk(self, dados: bytes) -> None:
+        self.wfile.write(f"{len(dados):X}\r\n".encode("ascii") + dados + b"\r\n")
+        self.wfile.flush()
+
+    def _transmitir_resultados(self, job: Job, formato: str) -> None:
+        """Envia os leads do job conforme são extraídos (chunked transfer encoding)."""
+        self.send_response(200)
+        if formato == "csv":
+            self.send_header("Content-Type", "text/csv; charset=utf-8")
+        else:
+            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            if formato == "csv":
+                self._enviar_chunk(_linha_csv(COLUNAS))
+
+            for lead in job.acompanhar():
+                dados = lead.to_dict()
+                if formato == "csv":
+                    self._enviar_chunk(_linha_csv([dados[c] for c in COLUNAS]))
+                else:
+                    self._enviar_chunk((json.dumps(dados, ensure_ascii=False) + "\n").encode("utf-8"))
+
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Cliente desconectou; o job continua executando
+            pass
+
+
+def _linha_csv(valores: list) -> bytes:
+    """Formata uma linha CSV."""
+    saida = io.StringIO()
+    csv.writer(saida).writerow(["" if v is None else v for v in valores])
+    return saida.getvalue().encode("utf-8")
@@ -0,0 +1,314 @@
+"""Jobs de extração e pool de navegadores aquecidos do serviço."""
+
+import logging
+import queue
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+from extrator_leads.core.config import Configuracao
+from extrator_leads.core.extractor_factory import ExtractorFactory
+from extrator_leads.core.models import Lead
+
+logger = logging.getLogger(__name__)
+
+FORMATOS_SUPORTADOS = ("json", "csv")
+
+# Jobs finalizados ficam disponíveis para consulta por este tempo (segundos)
+RETENCAO_JOBS = 3600
+# Máximo de jobs finalizados guardados (os mais antigos saem primeiro)
+MAX_JOBS_FINALIZADOS = 500
+
+
+class Job:
+    """Job de extração enfileirado no serviço."""
+
+    NA_FILA = "na_fila"
+    EXECUTANDO = "executando"
+    CONCLUIDO = "concluido"
+    FALHOU = "falhou"
+    CANCELADO = "cancelado"
+
+    FINALIZADOS = (CONCLUIDO, FALHOU, CANCELADO)
+
+    def __init__(self, url: str, limit: Optional[int] = None, formato: str = "json"):
+        """
+        Inicializa o job.
+
+        Args:
+            url: URL para extrair leads
+            limit: Número máximo de leads a extrair (None = todos)
+            formato: Formato padrão dos resultados ('json' ou 'csv')
+        """
+        if formato not in FORMATOS_SUPORTADOS:
+            raise ValueError(f"Formato não suportado: {formato}")
+
+        self.id = uuid.uuid4().hex
+        self.url = url
+        self.limit = limit
+        self.formato = formato
+        self.status = self.NA_FILA
+        self.erro: Optional[str] = None
+        self.criado_em = datetime.now()
+        self.iniciado_em: Optional[datetime] = None
+        self.finalizado_em: Optional[datetime] = None
+        self.leads: List[Lead] = []
+        self.extractor = None
+        self._condicao = threading.Condition()
+
+    @property
+    def finalizado(self) -> bool:
+        """Indica se o job já terminou (com sucesso, erro ou cancelado)."""
+        return self.status in self.FINALIZADOS
+
+    def adicionar_lead(self, lead: Lead) -> None:
+        """Registra um lead extraído e acorda quem acompanha os resultados."""
+        with self._condicao:
+            self.leads.append(lead)
+            self._condicao.notify_all()
+
+    def alterar_status(self, status: str, erro: Optional[str] = None) -> None:
+        """Atualiza o status do job e acorda quem acompanha os resultados."""
+        with self._condicao:
+            if self.finalizado:
+                return
+            self.status = status
+            self.erro = erro
+            if status == self.EXECUTANDO:
+                self.iniciado_em = datetime.now()
+            elif status in self.FINALIZADOS:
+                self.finalizado_em = datetime.now()
+            self._condicao.notify_all()
+
+    def cancelar(self) -> None:
+        """Cancela o job; se estiver em execução, interrompe o extractor."""
+        with self._condicao:
+            extractor = self.extractor
+        if extractor:
+            extractor.cancelar()
+        self.alterar_status(self.CANCELADO)
+
+    def acompanhar(self, timeout: float = 1.0) -> Iterator[Lead]:
+        """
+        Itera sobre os leads do job conforme são extraídos.
+
+        Termina quando o job é finalizado e todos os leads foram entregues.
+
+        Args:
+            timeout: Intervalo máximo de espera entre verificações
+        """
+        entregues = 0
+        while True:
+            with self._condicao:
+                while entregues == len(self.leads) and not self.finalizado:
+                    self._condicao.wait(timeout)
+                novos = self.leads[entregues:]
+                finalizado = self.finalizado
+
+            yield from novos
+            entregues += len(novos)
+
+            if finalizado and entregues == len(self.leads):
+                return
+
+    def to_dict(self) -> dict:
+        """Converte o job para dicionário (para a API)."""
+        return {
+            "id": self.id,
+            "url": self.url,
+            "limit": self.limit,
+            "formato": self.formato,
+            "status": self.status,
+            "erro": self.erro,
+            "leads": len(self.leads),
+            "falhas": [falha.model_dump() for falha in self.extractor.falhas] if self.extractor else [],
+            "criado_em": self.criado_em.isoformat(),
+            "iniciado_em": self.iniciado_em.isoformat() if self.iniciado_em else None,
+            "finalizado_em": self.finalizado_em.isoformat() if self.finalizado_em else None,
+        }
+
+
+class PoolNavegadores:
+    """
+    Pool de workers, cada um com um Chromium aquecido, consumindo uma fila de jobs.
+
+    A API síncrona do Playwright exige que o navegador seja usado na thread
+    que o criou, então cada worker mantém seu próprio navegador durante toda
+    a vida do serviço. O número de workers limita a concorrência.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        headless: bool = True,
+        config: Optional[Configuracao] = None,
+        retencao: float = RETENCAO_JOBS,
+        max_finalizados: int = MAX_JOBS_FINALIZADOS
+    ):
+        """
+        Inicializa o pool (sem iniciar os workers).
+
+        Args:
+            workers: Quantidade de navegadores/extrações simultâneas
+            headless: Executa os navegadores sem interface gráfica
+            config: Configuração de desempenho repassada aos extractors (opcional)
+            retencao: Segundos que um job finalizado (e seus leads) continua consultável
+            max_finalizados: Máximo de jobs finalizados mantidos em memória
+        """
+        if workers < 1:
+            raise ValueError("O pool precisa de pelo menos um worker")
+
+        self.workers = workers
+        self.headless = headless
+        self.config = config
+        self.retencao = retencao
+        self.max_finalizados = max_finalizados
+        self.jobs: Dict[str, Job] = {}
+        self._lock_jobs = threading.Lock()
+        self._fila: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._prontos = threading.Barrier(workers + 1)
+        self._erro_inicio: Optional[Exception] = None
+
+    def iniciar(self) -> None:
+        """
+        Inicia os workers e aguarda todos os navegadores estarem prontos.
+
+        Raises:
+            RuntimeError: Se algum navegador não puder ser iniciado
+        """
+        for indice in range(self.workers):
+            thread = threading.Thread(
+                target=self._executar_worker,
+                name=f"extrator-worker-{indice}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        try:
+            self._prontos.wait()
+        except threading.BrokenBarrierError:
+            self.encerrar()
+            raise RuntimeError(f"Erro ao iniciar navegador: {self._erro_inicio}")
+
+    def encerrar(self) -> None:
+        """Cancela os jobs pendentes e encerra os workers."""
+        for job in list(self.jobs.values()):
+            if not job.finalizado:
+                job.cancelar()
+        for _ in self._threads:
+            self._fila.put(None)
+        for thread in self._threads:
+            thread.join(timeout=30)
+
+    def enviar(self, url: str, limit: Optional[int] = None, formato: str = "json") -> Job:
+        """
+        Enfileira um novo job de extração.
+
+        Args:
+            url: URL para extrair leads
+            limit: Número máximo de leads a extrair
+            formato: Formato padrão dos resultados
+
+        Returns:
+            Job criado
+
+        Raises:
+            ValueError: Se a URL não for suportada ou o formato for inválido
+        """
+        # Valida a URL antes de enfileirar para falhar cedo
+        ExtractorFactory.criar_extractor(url, limit=limit)
+
+        job = Job(url, limit=limit, formato=formato)
+        with self._lock_jobs:
+            self._remover_finalizados()
+            self.jobs[job.id] = job
+        self._fila.put(job)
+        return job
+
+    def obter(self, job_id: str) -> Optional[Job]:
+        """Retorna o job pelo ID (ou None)."""
+        return self.jobs.get(job_id)
+
+    def listar(self) -> List[Job]:
+        """Retorna os jobs ainda retidos pelo pool."""
+        with self._lock_jobs:
+            self._remover_finalizados()
+            return list(self.jobs.values())
+
+    def _remover_finalizados(self) -> None:
+        """Descarta os jobs finalizados há mais de `retencao` ou além de `max_finalizados` (com o lock)."""
+        limite = datetime.now() - timedelta(seconds=self.retencao)
+        finalizados = sorted(
+            (job for job in self.jobs.values() if job.finalizado and job.finalizado_em),
+            key=lambda job: job.finalizado_em
+        )
+        excedentes = max(len(finalizados) - self.max_finalizados, 0)
+        for indice, job in enumerate(finalizados):
+            if indice < excedentes or job.finalizado_em < limite:
+                del self.jobs[job.id]
+
+    def _executar_worker(self) -> None:
+        """Loop de um worker: mantém um navegador aberto e processa jobs da fila."""
+        with sync_playwright() as playwright:
+            try:
+                browser = playwright.chromium.launch(headless=self.headless)
+            except Exception as e:
+                self._erro_inicio = e
+                self._prontos.abort()
+                return
+
+            try:
+                self._prontos.wait()
+            except threading.BrokenBarrierError:
+                browser.close()
+                return
+
+            try:
+                while True:
+                    job = self._fila.get()
+                    if job is None:
+                        return
+                    if job.finalizado:  # cancelado enquanto estava na fila
+                        continue
+
+                    if not browser.is_connected():
+                        logger.warning("Navegador desconectado, reiniciando...")
+                        try:
+                            browser = playwright.chromium.launch(headless=self.headless)
+                        except Exception as e:
+                            # O worker continua: o próximo job tenta abrir o navegador de novo
+                            logger.exception("Falha ao reiniciar o navegador")
+                            job.alterar_status(Job.FALHOU, erro=f"Erro ao reiniciar navegador: {e}")
+                            continue
+
+                    self._executar_job(job, browser)
+            finally:
+                if browser.is_connected():
+                    browser.close()
+
+    def _executar_job(self, job: Job, browser) -> None:
+        """Executa um job usando o navegador do worker."""
+        try:
+            extractor = ExtractorFactory.criar_extractor(
+                job.url,
+                limit=job.limit,
+                callback=lambda msg: logger.debug("[%s] %s", job.id, msg),
+                browser=browser,
+                on_lead=job.adicionar_lead,
+                config=self.config
+            )
+            job.extractor = extractor
+            job.alterar_status(Job.EXECUTANDO)
+            if job.finalizado:
+                return
+
+            extractor.extract()
+            job.alterar_status(Job.CANCELADO if extractor.cancelado else Job.CONCLUIDO)
+        except Exception as e:
+            logger.exception("Falha no job %s", job.id)
+            job.alterar_status(Job.FALHOU, erro=str(e))
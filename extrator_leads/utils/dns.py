@@ -0,0 +1,201 @@
+"""Cliente DNS mínimo (UDP) para consultas de MX e A."""
+
+import random
+import socket
+import struct
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+TIPO_A = 1
+TIPO_MX = 15
+
+RCODE_OK = 0
+RCODE_NXDOMAIN = 3
+
+SERVIDOR_PADRAO = ("8.8.8.8", 53)
+
+
+class RegistroDNS(NamedTuple):
+    """Registro de resposta (para MX, `dados` é o host de destino)."""
+
+    tipo: int
+    ttl: int
+    dados: str
+    preferencia: Optional[int] = None
+
+
+class RespostaDNS(NamedTuple):
+    """Resposta de uma consulta DNS."""
+
+    rcode: int
+    registros: List[RegistroDNS]
+
+
+def servidor_do_sistema(caminho: str = "/etc/resolv.conf") -> Tuple[str, int]:
+    """
+    Retorna o primeiro nameserver configurado no sistema.
+
+    Args:
+        caminho: Arquivo resolv.conf
+
+    Returns:
+        (host, porta) do nameserver, ou o servidor padrão se não houver
+    """
+    try:
+        for linha in Path(caminho).read_text(encoding="utf-8").splitlines():
+            partes = linha.split()
+            if len(partes) >= 2 and partes[0] == "nameserver":
+                return (partes[1], 53)
+    except OSError:
+        pass
+    return SERVIDOR_PADRAO
+
+
+def interpretar_servidor(texto: str, porta_padrao: int = 53) -> Tuple[str, int]:
+    """
+    Interpreta um servidor no formato host, host:porta, IPv6 ou [IPv6]:porta.
+
+    Args:
+        texto: Servidor informado (ex: '1.1.1.1:53', '2001:4860:4860::8888', '[::1]:5353')
+        porta_padrao: Porta usada quando não informada
+
+    Returns:
+        (host, porta)
+
+    Raises:
+        ValueError: Se o formato ou a porta forem inválidos
+    """
+    texto = texto.strip()
+    if texto.startswith("["):
+        host, fechamento, resto = texto[1:].partition("]")
+        if not fechamento or (resto and not resto.startswith(":")):
+            raise ValueError(f"Servidor DNS inválido: {texto}")
+        porta = resto[1:]
+    elif texto.count(":") > 1:
+        host, porta = texto, ""  # IPv6 sem colchetes não tem porta
+    else:
+        host, _, porta = texto.partition(":")
+
+    if not host:
+        raise ValueError(f"Servidor DNS inválido: {texto}")
+    porta = int(porta) if porta else porta_padrao
+    if not 0 < porta < 65536:
+        raise ValueError(f"Porta inválida: {porta}")
+    return host, porta
+
+
+def _codificar_nome(nome: str) -> bytes:
+    saida = b""
+    for rotulo in nome.rstrip(".").split("."):
+        dados = rotulo.encode("idna")
+        saida += bytes([len(dados)]) + dados
+    return saida + b"\x00"
+
+
+def montar_consulta(nome: str, tipo: int, identificador: int) -> bytes:
+    """Monta o pacote de uma consulta recursiva (RD=1) com uma pergunta."""
+    cabecalho = struct.pack("!HHHHHH", identificador, 0x0100, 1, 0, 0, 0)
+    return cabecalho + _codificar_nome(nome) + struct.pack("!HH", tipo, 1)
+
+
+def _ler_nome(pacote: bytes, posicao: int) -> Tuple[str, int]:
+    """Lê um nome (com compressão) e retorna o nome e a posição após ele."""
+    rotulos = []
+    fim = None
+    saltos = 0
+    while True:
+        tamanho = pacote[posicao]
+        if tamanho & 0xC0 == 0xC0:
+            # Ponteiro de compressão: continua a leitura em outro ponto do pacote
+            if fim is None:
+                fim = posicao + 2
+            posicao = struct.unpack("!H", pacote[posicao:posicao + 2])[0] & 0x3FFF
+            saltos += 1
+            if saltos > 50:
+                raise ValueError("Ponteiros de compressão em laço")
+            continue
+        if tamanho == 0:
+            posicao += 1
+            break
+        rotulos.append(pacote[posicao + 1:posicao + 1 + tamanho].decode("ascii", "replace"))
+        posicao += 1 + tamanho
+    return ".".join(rotulos), fim if fim is not None else posicao
+
+
+def interpretar_resposta(pacote: bytes, identificador: int) -> RespostaDNS:
+    """
+    Interpreta o pacote de resposta.
+
+    Raises:
+        ValueError: Se o pacote for inválido ou não corresponder à consulta
+    """
+    if len(pacote) < 12:
+        raise ValueError("Resposta DNS truncada")
+    ident, flags, qdcount, ancount, _, _ = struct.unpack("!HHHHHH", pacote[:12])
+    if ident != identificador:
+        raise ValueError("Resposta DNS de outra consulta")
+
+    posicao = 12
+    for _ in range(qdcount):
+        _, posicao = _ler_nome(pacote, posicao)
+        posicao += 4
+
+    registros = []
+    for _ in range(ancount):
+        _, posicao = _ler_nome(pacote, posicao)
+        tipo, _, ttl, tamanho = struct.unpack("!HHIH", pacote[posicao:posicao + 10])
+        posicao += 10
+        dados = pacote[posicao:posicao + tamanho]
+        if tipo == TIPO_MX:
+            preferencia = struct.unpack("!H", dados[:2])[0]
+            host, _ = _ler_nome(pacote, posicao + 2)
+            registros.append(RegistroDNS(tipo, ttl, host, preferencia))
+        elif tipo == TIPO_A and tamanho == 4:
+            registros.append(RegistroDNS(tipo, ttl, socket.inet_ntoa(dados)))
+        posicao += tamanho
+
+    return RespostaDNS(flags & 0x000F, registros)
+
+
+def consultar(
+    nome: str,
+    tipo: int,
+    servidor: Optional[Tuple[str, int]] = None,
+    timeout: float = 2.0,
+    tentativas: int = 2
+) -> RespostaDNS:
+    """
+    Faz uma consulta DNS por UDP.
+
+    Args:
+        nome: Nome consultado (ex: 'exemplo.com.br')
+        tipo: TIPO_MX ou TIPO_A
+        servidor: (host, porta) do nameserver (padrão: o do sistema)
+        timeout: Tempo máximo de espera por resposta, em segundos
+        tentativas: Quantidade de envios antes de desistir
+
+    Returns:
+        Resposta com o rcode e os registros do tipo pedido
+
+    Raises:
+        TimeoutError: Se o servidor não responder
+        OSError: Se o endereço do servidor não puder ser resolvido
+    """
+    host, porta = servidor or servidor_do_sistema()
+    # A família do socket (IPv4 ou IPv6, inclusive com escopo 'fe80::1%eth0') vem do endereço
+    familia, _, _, _, endereco = socket.getaddrinfo(host, porta, type=socket.SOCK_DGRAM)[0]
+    with socket.socket(familia, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(timeout)
+        for _ in range(tentativas):
+            identificador = random.randint(0, 0xFFFF)
+            sock.sendto(montar_consulta(nome, tipo, identificador), endereco)
+            try:
+                while True:
+                    pacote, _ = sock.recvfrom(4096)
+                    try:
+                        return interpretar_resposta(pacote, identificador)
+                    except (ValueError, IndexError, struct.error):
+                        continue  # Resposta atrasada de um envio anterior ou pacote inválido
+            except socket.timeout:
+                continue
+    raise TimeoutError(f"Sem resposta do DNS para {nome}")
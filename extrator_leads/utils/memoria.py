@@ -0,0 +1,133 @@
+"""Utilitários para medir o uso de memória do processo e do navegador."""
+
+import os
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional; usa /proc como fallback (Linux)
+    psutil = None
+
+
+def _ler_rss_proc(pid: int) -> Optional[float]:
+    """
+    Lê o RSS de um processo em /proc.
+
+    Args:
+        pid: ID do processo
+
+    Returns:
+        RSS em MB ou None se não for possível ler
+    """
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                if linha.startswith("VmRSS:"):
+                    return int(linha.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _filhos_proc(pid: int) -> List[int]:
+    """
+    Lista os processos filhos diretos de um processo via /proc.
+
+    Args:
+        pid: ID do processo pai
+
+    Returns:
+        Lista de PIDs filhos
+    """
+    filhos = []
+    for tarefa in Path(f"/proc/{pid}/task").glob("*"):
+        try:
+            conteudo = (tarefa / "children").read_text()
+        except OSError:
+            continue
+        filhos.extend(int(p) for p in conteudo.split())
+    return filhos
+
+
+def _descendentes(pid: int) -> List[int]:
+    """Lista recursivamente todos os descendentes de um processo."""
+    if psutil is not None:
+        try:
+            return [filho.pid for filho in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    descendentes = []
+    pendentes = [pid]
+    while pendentes:
+        atual = pendentes.pop()
+        filhos = _filhos_proc(atual)
+        descendentes.extend(filhos)
+        pendentes.extend(filhos)
+    return descendentes
+
+
+def rss_processo_mb(pid: Optional[int] = None) -> Optional[float]:
+    """
+    Retorna o RSS (memória residente) de um processo.
+
+    Args:
+        pid: ID do processo (padrão: processo atual)
+
+    Returns:
+        RSS em MB ou None se a plataforma não permitir a medição
+    """
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return None
+    return _ler_rss_proc(pid)
+
+
+def pid_driver_playwright(objeto) -> Optional[int]:
+    """
+    Retorna o PID do driver do Playwright dono de um objeto (navegador, contexto).
+
+    Cada `sync_playwright()` tem um driver próprio, e o Chromium iniciado por
+    ele é seu descendente: a árvore do driver é a memória daquele navegador,
+    sem os navegadores de outros workers do mesmo processo. O Playwright não
+    expõe esse PID publicamente, então ele é lido dos atributos internos.
+
+    Args:
+        objeto: Objeto da API síncrona do Playwright (ex: Browser, BrowserContext)
+
+    Returns:
+        PID do driver ou None se não for possível obtê-lo
+    """
+    try:
+        return objeto._impl_obj._connection._transport._proc.pid
+    except AttributeError:
+        return None
+
+
+def rss_descendentes_mb(pid: Optional[int] = None) -> Optional[float]:
+    """
+    Retorna a soma do RSS de todos os processos descendentes.
+
+    Com Playwright, os descendentes do processo Python são o driver
+    e os processos do Chromium, então o valor aproxima a memória do navegador.
+
+    Args:
+        pid: ID do processo raiz (padrão: processo atual)
+
+    Returns:
+        RSS total em MB, ou None se a plataforma não permitir a medição
+    """
+    pid = pid or os.getpid()
+    if psutil is None and not Path("/proc").exists():
+        return None
+
+    total = 0.0
+    for filho in _descendentes(pid):
+        rss = rss_processo_mb(filho)
+        if rss:
+            total += rss
+    return total
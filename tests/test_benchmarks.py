@@ -0,0 +1,61 @@
+import time
+
+import requests
+from bs4 import BeautifulSoup
+from benchmarks import executar
+from benchmarks.servidor_maps import ServidorMapsFalso
+from benchmarks.executar import comparar_com_baseline
+
+
+def test_servidor_maps_marcacao():
+    """Testa se o servidor falso gera a marcação usada pelo GoogleMapsExtractor."""
+    with ServidorMapsFalso(total_resultados=25, tamanho_lote=10) as servidor:
+        busca = requests.get(servidor.url_busca("advogados"), timeout=5)
+        soup = BeautifulSoup(busca.text, "html.parser")
+        feed = soup.select_one('div[role="feed"]')
+        assert feed is not None
+        assert len(feed.select('a[href*="/maps/place/"]')) == 10
+
+        lote = requests.get(f"{servidor.base_url}/api/feed?offset=20", timeout=5).json()
+        assert lote["quantidade"] == 5
+        assert lote["fim"] is True
+
+        painel = requests.get(servidor.url_estabelecimento(4), timeout=5)
+        soup = BeautifulSoup(painel.text, "html.parser")
+        assert soup.select_one("h1.DUwDvf").text == "Estabelecimento Teste 0004"
+        assert soup.select_one('button[data-item-id*="phone"]')["data-item-id"] == "phone:tel:08855500004"
+        assert soup.select_one('a[data-item-id*="authority"]')["href"].startswith("https://")
+
+
+def test_comparar_com_baseline():
+    """Testa detecção de regressões em relação ao baseline."""
+    baseline = {"leads_por_segundo": 2.0, "tempo_primeiro_lead_s": 5.0, "pico_rss_mb": 100.0}
+
+    atual = {"cenario": "x", "leads_por_segundo": 1.9, "tempo_primeiro_lead_s": 5.5, "pico_rss_mb": 100.0}
+    assert comparar_com_baseline(atual, baseline, 0.2) == []
+
+    atual = {"cenario": "x", "leads_por_segundo": 1.0, "tempo_primeiro_lead_s": 8.0, "pico_rss_mb": None}
+    regressoes = comparar_com_baseline(atual, baseline, 0.2)
+    assert len(regressoes) == 2
+    assert "leads_por_segundo" in regressoes[0]
+
+
+def test_tempo_primeiro_lead_vem_do_on_lead(monkeypatch):
+    """Testa que o tempo até o primeiro lead é medido pelo on_lead, não pelas mensagens de log."""
+
+    class ExtractorFalso:
+        def __init__(self, url, limit=None, on_lead=None, **opcoes):
+            self.on_lead = on_lead
+
+        def extract(self):
+            time.sleep(0.05)
+            self.on_lead("lead")
+            return ["lead"]
+
+    monkeypatch.setattr(executar, "GoogleMapsExtractor", ExtractorFalso)
+    recebidos = []
+
+    metricas = executar.medir_extracao("x", "http://localhost", on_lead=recebidos.append)
+
+    assert metricas["leads"] == 1 and recebidos == ["lead"]
+    assert 0.05 <= metricas["tempo_primeiro_lead_s"] <= metricas["duracao_s"]
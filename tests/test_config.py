@@ -0,0 +1,97 @@
+import pytest
+
+from extrator_leads.core.config import Configuracao, carregar_configuracao
+from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+from extrator_leads.extractors.navegador import SessaoNavegador
+
+
+def test_preset_padrao_mantem_valores_historicos():
+    """Testa que sem preset nem ambiente a configuração é o balanced."""
+    config = carregar_configuracao(env_file=None, ambiente={})
+    assert config == Configuracao()
+    assert config.preset == "balanced" and config.espera_carregamento == 3000
+
+
+def test_precedencia_preset_env_file_ambiente_e_sobrescritas(tmp_path):
+    """Testa a ordem variáveis históricas < preset < .env < ambiente < sobrescritas."""
+    env = tmp_path / ".env"
+    env.write_text(
+        "EXTRATOR_PRESET=fast\nPLAYWRIGHT_TIMEOUT=15000\nHTTP_TIMEOUT=12\nHEADLESS=false\nEXTRATOR_WORKERS=6\n"
+    )
+
+    config = carregar_configuracao(env_file=str(env), ambiente={"EXTRATOR_WORKERS": "8"})
+    assert config.preset == "fast"
+    assert config.espera_rolagem == 800 and config.espera_clique == 100  # do preset
+    assert config.timeout_navegacao == 20000  # o preset vence PLAYWRIGHT_TIMEOUT
+    assert config.timeout_http == 12 and config.headless is False  # variáveis do .env.example fora do preset
+    assert config.workers == 8  # ambiente vence o .env
+
+    # Sem nada no preset (balanced), a variável histórica continua valendo; EXTRATOR_<CAMPO> vence as duas
+    config = carregar_configuracao(env_file=None, ambiente={"PLAYWRIGHT_TIMEOUT": "15000"})
+    assert config.timeout_navegacao == 15000
+    config = carregar_configuracao(
+        preset="fast", env_file=None, ambiente={"PLAYWRIGHT_TIMEOUT": "15000", "EXTRATOR_TIMEOUT_NAVEGACAO": "25000"}
+    )
+    assert config.timeout_navegacao == 25000
+
+    config = carregar_configuracao(
+        preset="thorough",
+        env_file=str(env),
+        ambiente={},
+        sobrescritas={"workers": "3", "bloquear_recursos": "image, font"}
+    )
+    assert config.preset == "thorough" and config.espera_rolagem == 2500
+    assert config.workers == 3
+    assert config.bloquear_recursos == ["image", "font"]
+
+
+def test_valores_invalidos():
+    """Testa preset desconhecido, campo inexistente e valor fora do tipo."""
+    with pytest.raises(ValueError, match="Preset inválido"):
+        carregar_configuracao(preset="turbo", env_file=None, ambiente={})
+    with pytest.raises(ValueError):
+        carregar_configuracao(env_file=None, ambiente={}, sobrescritas={"nao_existe": "1"})
+    with pytest.raises(ValueError):
+        carregar_configuracao(env_file=None, ambiente={"EXTRATOR_WORKERS": "0"})
+
+
+def test_extractor_usa_configuracao():
+    """Testa que a sessão e as retentativas seguem a configuração do extractor."""
+    config = carregar_configuracao(preset="fast", env_file=None, ambiente={}, sobrescritas={"user_agent": "teste"})
+    extractor = GoogleMapsExtractor("https://www.google.com/maps/search/x", config=config, seletores_path=None)
+
+    sessao = extractor._criar_sessao()
+    assert sessao.user_agent == "teste"
+    assert sessao.timeout == 20000
+    assert sessao.bloquear_recursos == {"image", "media", "font"}
+
+
+def test_extractor_sem_config_nao_le_o_ambiente(monkeypatch, tmp_path):
+    """Testa que, fora da CLI, o extractor usa o balanced sem ler .env nem variáveis de ambiente."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("EXTRATOR_PRESET=fast\n")
+    monkeypatch.setenv("EXTRATOR_WORKERS", "8")
+
+    extractor = GoogleMapsExtractor("https://www.google.com/maps/search/x", seletores_path=None)
+    assert extractor.config == Configuracao()
+
+
+def test_sessao_bloqueia_recursos():
+    """Testa que o filtro aborta só os tipos bloqueados e repassa os demais."""
+    sessao = SessaoNavegador(browser=object(), bloquear_recursos=["image"])
+
+    class _Rota:
+        def __init__(self, tipo):
+            self.request = type("Req", (), {"resource_type": tipo})()
+            self.acao = None
+
+        def abort(self):
+            self.acao = "abort"
+
+        def fallback(self):
+            self.acao = "fallback"
+
+    imagem, documento = _Rota("image"), _Rota("document")
+    sessao._filtrar_recurso(imagem)
+    sessao._filtrar_recurso(documento)
+    assert (imagem.acao, documento.acao) == ("abort", "fallback")
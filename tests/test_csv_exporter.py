@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from extrator_leads.core.csv_exporter import CSVExporter
+from extrator_leads.core.models import Lead
+
+
+def _lead(nome):
+    return Lead(nome=nome, telefone="88999990000", fonte="google_maps", url_origem="https://x", place_id="p1")
+
+
+def test_append_em_csv_com_colunas_antigas(tmp_path):
+    """Testa que o append segue o cabeçalho de um CSV de uma versão anterior (6 colunas)."""
+    antigo = tmp_path / "leads.csv"
+    antigo.write_text(
+        "nome,telefone,email,website,fonte,url_origem\n"
+        "Padaria A,88911112222,,,google_maps,https://x\n",
+        encoding="utf-8"
+    )
+
+    CSVExporter(output_dir=str(tmp_path), indexar=False).exportar([_lead("Padaria B")], filename="leads", append=True)
+
+    df = pd.read_csv(antigo, dtype=str, keep_default_na=False)
+    assert list(df.columns) == ["nome", "telefone", "email", "website", "fonte", "url_origem"]
+    assert list(df["nome"]) == ["Padaria A", "Padaria B"]
+
+
+def test_append_recusa_arquivo_sem_cabecalho_de_leads(tmp_path):
+    """Testa que o append não mistura leads em um CSV de outro formato."""
+    (tmp_path / "outro.csv").write_text("id,valor\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="cabeçalho de leads"):
+        CSVExporter(output_dir=str(tmp_path), indexar=False).exportar([_lead("X")], filename="outro", append=True)
+
+
+def test_falha_no_indice_gera_aviso(tmp_path, caplog):
+    """Testa que um índice inacessível não falha a exportação, mas é avisado."""
+    (tmp_path / "indice_leads.db").mkdir()
+    exporter = CSVExporter(output_dir=str(tmp_path))
+
+    with caplog.at_level("WARNING", logger="extrator_leads.core.csv_exporter"):
+        caminho = exporter.exportar([_lead("Padaria A")], filename="leads")
+
+    assert pd.read_csv(caminho)["nome"].tolist() == ["Padaria A"]
+    assert "índice" in caplog.text
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from extrator_leads.core.delta import EstadoLeads, exportar_delta, impressao_digital
+from extrator_leads.core.models import Lead
+from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+
+BUSCA = "https://www.google.com/maps/search/padarias"
+
+
+def _lead(nome, place_id, telefone=None):
+    return Lead(nome=nome, telefone=telefone, fonte="google_maps", url_origem=BUSCA, place_id=place_id)
+
+
+def test_place_id_do_link():
+    """Testa a extração do ID do lugar a partir dos links do Maps."""
+    assert GoogleMapsExtractor.extrair_place_id(
+        "https://www.google.com/maps/place/X/data=!4m7!3m6!1s0x7b0:0x1a2b!8m2!3d-3.6!4d-40.3!19sChIJabc123?hl=pt"
+    ) == "ChIJabc123"
+    assert GoogleMapsExtractor.extrair_place_id("/maps/place/X/data=!4m2!3m1!1s0x0:0x1f") == "0x0:0x1f"
+    assert GoogleMapsExtractor.extrair_place_id(BUSCA) is None
+
+
+def test_impressao_ignora_formatacao():
+    """Testa que só mudanças reais alteram a impressão digital."""
+    assert impressao_digital(_lead("Padaria", "a", "(88) 99999-0000")) == \
+        impressao_digital(_lead("PADARIA ", "a", "+55 88 99999-0000"))
+    assert impressao_digital(_lead("Padaria", "a", "88999990000")) != \
+        impressao_digital(_lead("Padaria", "a", "88999991111"))
+
+
+def test_estado_detecta_novos_alterados_e_removidos(tmp_path):
+    """Testa o delta entre duas execuções da mesma busca."""
+    estado = EstadoLeads(str(tmp_path / "estado.db"))
+
+    primeira = estado.registrar(BUSCA, [_lead("Padaria A", "a"), _lead("Padaria B", "b"), _lead("Padaria C", "c")])
+    assert len(primeira.novos) == 3 and primeira.total == 3
+
+    segunda = estado.registrar(BUSCA, [
+        _lead("Padaria A", "a"),
+        _lead("Padaria B", "b", "88999990000"),
+        _lead("Padaria D", "d"),
+    ])
+    assert [d["place_id"] for d in segunda.novos] == ["d"]
+    assert [d["place_id"] for d in segunda.alterados] == ["b"]
+    assert [d["place_id"] for d in segunda.removidos] == ["c"]
+
+    # Sem mudanças, o delta fica vazio; outra busca tem estado próprio
+    assert estado.registrar(BUSCA, [_lead("Padaria A", "a"), _lead("Padaria B", "b", "88999990000"), _lead("Padaria D", "d")]).total == 0
+    assert len(estado.registrar("outra", [_lead("Padaria A", "a")]).novos) == 1
+
+    caminho = exportar_delta(segunda, str(tmp_path / "delta.csv"))
+    df = pd.read_csv(caminho, dtype=str, keep_default_na=False)
+    assert list(df["mudanca"]) == ["novo", "alterado", "removido"]
+    assert "place_id" in df.columns
+
+
+def test_estado_execucao_parcial_nao_remove(tmp_path):
+    """Testa que execuções parciais não marcam leads como removidos."""
+    estado = EstadoLeads(str(tmp_path / "estado.db"))
+    estado.registrar(BUSCA, [_lead("Padaria A", "a"), _lead("Padaria B", "b")])
+
+    parcial = estado.registrar(BUSCA, [_lead("Padaria A", "a")], completo=False)
+    assert parcial.removidos == []
+
+    completa = estado.registrar(BUSCA, [_lead("Padaria A", "a")])
+    assert [d["place_id"] for d in completa.removidos] == ["b"]
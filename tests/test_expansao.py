@@ -0,0 +1,107 @@
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from extrator_leads.core.expansao import ExpansorBuscas, gerar_urls_busca, ler_pares_csv
+from extrator_leads.core.models import Lead
+
+
+def _href(n):
+    return f"https://www.google.com/maps/place/Lugar+{n}/data=!4m2!3m1!1s0x0:0x{n:x}?authuser=0"
+
+
+class _ExpansorFalso(ExpansorBuscas):
+    """Expansor sem navegador: as buscas devolvem links fixos."""
+
+    def __init__(self, resultados, **kwargs):
+        super().__init__(list(resultados), **kwargs)
+        self.resultados = resultados
+        self.detalhados = []
+        self.threads = set()
+
+    @contextmanager
+    def _abrir_navegador(self):
+        yield threading.current_thread().name
+
+    def _coletar(self, browser, url):
+        self.threads.add(browser)
+        return self.resultados[url]
+
+    def _detalhar(self, browser, url, hrefs):
+        self.detalhados.extend(hrefs)
+        return [Lead(nome=f"Lugar {h}", fonte="google_maps", url_origem=url) for h in hrefs], []
+
+
+def test_gerar_urls_busca(tmp_path):
+    """Testa a combinação de termos e localidades em URLs de busca."""
+    urls = gerar_urls_busca(["advogados", "dentistas"], ["Sobral CE", "Fortaleza"])
+    assert urls[0] == "https://www.google.com/maps/search/advogados+em+Sobral+CE"
+    assert len(urls) == 4
+
+    pares = tmp_path / "pares.csv"
+    pares.write_text("termo,local\nadvogados,Sobral CE\nadvogados,Sobral CE\npadarias,Crato\n")
+    assert ler_pares_csv(str(pares)) == [
+        "https://www.google.com/maps/search/advogados+em+Sobral+CE",
+        "https://www.google.com/maps/search/padarias+em+Crato",
+    ]
+
+    (tmp_path / "invalido.csv").write_text("cidade\nSobral\n")
+    with pytest.raises(ValueError):
+        ler_pares_csv(str(tmp_path / "invalido.csv"))
+
+
+def test_expansao_deduplica_lugares_entre_buscas():
+    """Testa que lugares encontrados por várias buscas são detalhados uma vez só."""
+    resultados = {
+        "busca-a": [_href(1), _href(2), _href(3)],
+        "busca-b": [_href(2).replace("authuser=0", "hl=pt"), _href(4)],
+        "busca-c": [_href(1), _href(4), _href(5)],
+    }
+    expansor = _ExpansorFalso(resultados, workers=2)
+
+    resultado = expansor.executar()
+
+    assert (resultado.buscas, resultado.encontrados, resultado.unicos) == (3, 8, 5)
+    assert len(resultado.leads) == 5
+    assert len(expansor.detalhados) == 5
+    assert len(expansor.threads) <= 2
+
+
+def test_expansao_falha_ao_iniciar_navegador():
+    """Testa o erro quando nenhum navegador inicia."""
+
+    class _SemNavegador(_ExpansorFalso):
+        @contextmanager
+        def _abrir_navegador(self):
+            raise OSError("chromium ausente")
+            yield
+
+    with pytest.raises(RuntimeError, match="chromium ausente"):
+        _SemNavegador({"busca-a": [_href(1)]}, workers=2).executar()
+
+
+def test_expansao_relata_erro_entre_as_fases():
+    """Testa que um erro ao montar as tarefas da fase 2 não vira um resultado vazio."""
+
+    class _ErroNaBarreira(_ExpansorFalso):
+        def _agrupar_por_busca(self, fila):
+            raise KeyError("lugar")
+
+    with pytest.raises(RuntimeError, match="detalhes"):
+        _ErroNaBarreira({"busca-a": [_href(1)], "busca-b": [_href(2)]}, workers=2).executar()
+
+
+def test_expansao_detalhes_orfaos_viram_falhas():
+    """Testa que, se todos os workers morrem na fase 2, os lugares não detalhados são reportados."""
+
+    class _NavegadorMorre(_ExpansorFalso):
+        def _processar_detalhes(self, browser, detalhes):
+            raise RuntimeError("navegador caiu")
+
+    resultados = {"busca-a": [_href(1), _href(2)], "busca-b": [_href(3)]}
+    resultado = _NavegadorMorre(resultados, workers=2).executar()
+
+    assert resultado.leads == []
+    assert sorted(falha.url for falha in resultado.falhas) == sorted(_href(n) for n in (1, 2, 3))
+    assert all("navegador caiu" in falha.motivo for falha in resultado.falhas)
@@ -0,0 +1,122 @@
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from extrator_leads.core.config import Configuracao
+from extrator_leads.extractors.facebook import FacebookExtractor, extrair_dados_pagina
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _fixture(nome: str) -> str:
+    return (FIXTURES / nome).read_text(encoding="utf-8")
+
+
+class _HandlerSilencioso(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    """Servidor HTTP local que serve os HTMLs de tests/fixtures."""
+    handler = functools.partial(_HandlerSilencioso, directory=str(FIXTURES))
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class _ExtractorSemNavegador(FacebookExtractor):
+    """Substitui o navegador por HTML fixo, registrando as URLs renderizadas."""
+
+    def __init__(self, *args, html_navegador=None, **kwargs):
+        super().__init__(*args, config=Configuracao(), seletores_path=None, **kwargs)
+        self.html_navegador = html_navegador
+        self.renderizadas = []
+
+    def _renderizar_com_navegador(self, urls):
+        self.renderizadas.extend(urls)
+        return {url: self.html_navegador for url in urls} if self.html_navegador else {}
+
+
+def test_dados_da_pagina_completa():
+    """Testa Open Graph, JSON-LD, links tel:/mailto: e o link externo embrulhado."""
+    dados = extrair_dados_pagina(_fixture("facebook_pagina.html"))
+    assert dados == {
+        "nome": "Padaria Pão Quente",
+        "telefone": "+55 88 99876-5432",
+        "email": "contato@paoquente.com.br",
+        "website": "https://paoquente.com.br/",
+        "place_id": "104857392847561",
+    }
+
+
+def test_dados_pela_descricao():
+    """Testa o título sem '- Facebook' e telefone/email lidos da descrição."""
+    dados = extrair_dados_pagina(_fixture("facebook_descricao.html"))
+    assert dados["nome"] == "Oficina do Zé"
+    assert dados["telefone"] == "(85) 3456-7890"
+    assert dados["email"] == "oficinadoze@gmail.com"
+    assert dados["website"] is None
+
+
+def test_links_da_meta_nao_viram_website():
+    """Testa que os links do rodapé da Meta (diretos ou embrulhados) não são o website da página."""
+    dados = extrair_dados_pagina(_fixture("facebook_rodape.html"))
+    assert dados["nome"] == "Mercadinho Central"
+    assert dados["website"] is None
+
+
+def test_extrai_paginas_por_http_sem_navegador(servidor):
+    """Testa que páginas com dados no HTML não abrem o navegador."""
+    extractor = _ExtractorSemNavegador(f"{servidor}/facebook_pagina.html")
+    leads = extractor.extrair_paginas([f"{servidor}/facebook_pagina.html", f"{servidor}/facebook_descricao.html"])
+
+    assert [lead.nome for lead in leads] == ["Padaria Pão Quente", "Oficina do Zé"]
+    assert leads[0].fonte == "facebook" and leads[0].place_id == "104857392847561"
+    assert str(leads[0].website) == "https://paoquente.com.br/"
+    assert extractor.renderizadas == [] and extractor.falhas == []
+
+
+def test_muro_de_login_usa_navegador(servidor):
+    """Testa o fallback para o navegador só nas páginas sem dados (login ou erro HTTP)."""
+    login, inexistente = f"{servidor}/facebook_login.html", f"{servidor}/nao_existe.html"
+    extractor = _ExtractorSemNavegador(login, html_navegador=_fixture("facebook_pagina.html"))
+
+    leads = extractor.extrair_paginas([login, f"{servidor}/facebook_descricao.html", inexistente])
+    assert extractor.renderizadas == [login, inexistente]
+    assert len(leads) == 3 and leads[0].url_origem == login
+
+
+def test_extract_sem_dados_reporta_falha(servidor):
+    """Testa que, sem fallback, a página de login vira falha."""
+    extractor = _ExtractorSemNavegador(f"{servidor}/facebook_login.html", fallback_navegador=False)
+    with pytest.raises(Exception, match="Nome não encontrado"):
+        extractor.extract()
+    assert extractor.renderizadas == []
+
+
+def test_extract_com_varias_paginas(servidor):
+    """Testa que extract() processa a URL principal e as demais páginas do lote, sem repetir."""
+    principal = f"{servidor}/facebook_pagina.html"
+    extractor = _ExtractorSemNavegador(
+        principal, paginas=[f"{servidor}/facebook_descricao.html", principal, f"{servidor}/facebook_descricao.html"]
+    )
+
+    leads = extractor.extract()
+    assert [lead.nome for lead in leads] == ["Padaria Pão Quente", "Oficina do Zé"]
+
+
+def test_falhas_reportadas_pelo_on_falha(servidor):
+    """Testa que cada página que falha chega ao on_falha (usado pelo painel ao vivo)."""
+    falhas = []
+    login = f"{servidor}/facebook_login.html"
+    extractor = _ExtractorSemNavegador(login, fallback_navegador=False, on_falha=falhas.append)
+
+    extractor.extrair_paginas([login, f"{servidor}/facebook_pagina.html"])
+    assert [(falha.url, falha.motivo) for falha in falhas] == [(login, "Nome não encontrado")]
@@ -0,0 +1,104 @@
+import sqlite3
+import time
+from extrator_leads.core.models import Lead
+from extrator_leads.fila.sqlite import DestinoSQLite, FilaSQLite
+
+URL = "https://www.google.com/maps/search/restaurantes"
+
+
+def test_fila_arrendar_e_concluir(tmp_path):
+    """Testa enfileiramento, arrendamento exclusivo e conclusão."""
+    fila = FilaSQLite(str(tmp_path / "fila.db"))
+    assert fila.enfileirar(URL, limit=10) is True
+    assert fila.enfileirar(URL) is False  # duplicada
+
+    item = fila.arrendar("worker-1", visibilidade=60)
+    assert item.url == URL and item.limit == 10 and item.tentativas == 1
+    assert fila.arrendar("worker-2", visibilidade=60) is None
+    assert fila.estatisticas()["em_execucao"] == 1
+
+    assert fila.concluir(item) is True
+    assert fila.estatisticas()["concluido"] == 1
+
+
+def test_fila_rearrenda_item_expirado(tmp_path):
+    """Testa que um item de worker morto volta para a fila após a visibilidade."""
+    fila = FilaSQLite(str(tmp_path / "fila.db"))
+    fila.enfileirar(URL)
+
+    item_morto = fila.arrendar("worker-1", visibilidade=0.05)
+    time.sleep(0.1)
+    item = fila.arrendar("worker-2", visibilidade=60)
+    assert item.id == item_morto.id
+    assert item.tentativas == 2
+
+    # O worker original não pode mais concluir nem renovar o item
+    assert fila.concluir(item_morto) is False
+    assert fila.renovar(item_morto, 60) is False
+    assert fila.concluir(item) is True
+
+
+def test_fila_falha_apos_max_tentativas(tmp_path):
+    """Testa que o item é marcado como falho ao esgotar as tentativas."""
+    fila = FilaSQLite(str(tmp_path / "fila.db"), max_tentativas=2)
+    fila.enfileirar(URL)
+
+    fila.falhar(fila.arrendar("w", 60), "timeout")
+    fila.falhar(fila.arrendar("w", 60), "timeout")
+
+    assert fila.arrendar("w", 60) is None
+    assert fila.estatisticas()["falhou"] == 1
+    assert fila.falhas() == [{"url": URL, "erro": "timeout", "tentativas": 2}]
+
+
+def test_fila_falha_item_que_sempre_expira(tmp_path):
+    """Testa que um item que derruba o worker (sem falhar()) para de ser arrendado."""
+    fila = FilaSQLite(str(tmp_path / "fila.db"), max_tentativas=2)
+    fila.enfileirar(URL)
+
+    assert fila.arrendar("w1", visibilidade=0.05).tentativas == 1
+    time.sleep(0.1)
+    assert fila.arrendar("w2", visibilidade=0.05).tentativas == 2
+    time.sleep(0.1)
+
+    assert fila.arrendar("w3", visibilidade=60) is None
+    assert fila.estatisticas()["falhou"] == 1
+    assert fila.falhas() == [{"url": URL, "erro": "Arrendamento expirado sem conclusão", "tentativas": 2}]
+
+
+def test_destino_sqlite_substitui_leads_do_item(tmp_path):
+    """Testa que reprocessar um item não duplica os leads no destino."""
+    fila = FilaSQLite(str(tmp_path / "fila.db"))
+    destino = DestinoSQLite(str(tmp_path / "leads.db"))
+    fila.enfileirar(URL)
+    item = fila.arrendar("w", 60)
+
+    lead = Lead(nome="Empresa Teste", telefone="(88) 99999-0000", fonte="google_maps", url_origem=URL)
+    destino.gravar([lead], item)
+    destino.gravar([lead], item)
+
+    assert destino.total() == 1
+    assert [l.nome for l in destino.ler_leads()] == ["Empresa Teste"]
+
+
+def test_destino_sqlite_migra_banco_antigo(tmp_path):
+    """Testa que um banco sem place_id/email_status ganha as colunas e as preserva."""
+    caminho = tmp_path / "leads.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.execute(
+            "CREATE TABLE leads (id INTEGER PRIMARY KEY AUTOINCREMENT, nome TEXT NOT NULL, telefone TEXT, "
+            "email TEXT, website TEXT, fonte TEXT NOT NULL, url_origem TEXT NOT NULL, item_id INTEGER, "
+            "criado_em REAL NOT NULL)"
+        )
+    conn.close()
+    fila = FilaSQLite(str(tmp_path / "fila.db"))
+    destino = DestinoSQLite(str(caminho))
+    fila.enfileirar(URL)
+    item = fila.arrendar("w", 60)
+
+    lead = Lead(nome="Empresa Teste", fonte="google_maps", url_origem=URL,
+                place_id="0x1:0x2", email_status="valido")
+    destino.gravar([lead], item)
+
+    [lido] = destino.ler_leads()
+    assert (lido.place_id, lido.email_status) == ("0x1:0x2", "valido")
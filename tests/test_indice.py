@@ -0,0 +1,66 @@
+import os
+from datetime import datetime
+
+from extrator_leads.core.csv_exporter import CSVExporter
+from extrator_leads.core.indice import IndiceLeads
+from extrator_leads.core.models import Lead
+
+
+def _lead(nome, telefone=None, website=None, fonte="google_maps"):
+    return Lead(nome=nome, telefone=telefone, website=website, fonte=fonte, url_origem="https://maps.google.com")
+
+
+def test_exportar_atualiza_indice(tmp_path):
+    """Testa que cada exportação é indexada e as consultas filtram os leads."""
+    exporter = CSVExporter(output_dir=str(tmp_path))
+    exporter.exportar([
+        _lead("Padaria Central", telefone="88999990000"),
+        _lead("Oficina do Zé", telefone="88988880000", website="https://oficinadoze.com.br"),
+        _lead("Loja Online", fonte="facebook", telefone="88977770000"),
+    ], filename="leads_20250101_120000")
+    exporter.exportar([_lead("Padaria Nova", telefone="88966660000")], filename="leads_20250101_120000", append=True)
+
+    indice = IndiceLeads(str(tmp_path))
+    assert indice.sincronizar() == 0  # nada mudou por fora
+
+    nomes = [d["nome"] for d in indice.consultar(fonte="google_maps", com=["telefone"], sem=["website"])]
+    assert sorted(nomes) == ["Padaria Central", "Padaria Nova"]
+    assert [d["nome"] for d in indice.consultar(dominio="oficinadoze")] == ["Oficina do Zé"]
+    assert [d["arquivo"] for d in indice.consultar(nome="padaria central")] == ["leads_20250101_120000.csv"]
+
+
+def test_sincronizar_reindexa_alterados_e_removidos(tmp_path):
+    """Testa a sincronização com arquivos criados, alterados e apagados por fora."""
+    exporter = CSVExporter(output_dir=str(tmp_path), indexar=False)
+    antigo = exporter.exportar([_lead("Padaria Central")], filename="leads_20240101_000000")
+    exporter.exportar([_lead("Oficina do Zé")], filename="leads_20250601_000000")
+    (tmp_path / "delta_20250601_000000.csv").write_text("nome,fonte,mudanca\nX,google_maps,novo\n")
+
+    indice = IndiceLeads(str(tmp_path))
+    assert indice.sincronizar() == 3
+    assert len(list(indice.consultar())) == 2  # arquivos delta não são indexados
+
+    assert [d["nome"] for d in indice.consultar(desde=datetime(2025, 1, 1))] == ["Oficina do Zé"]
+
+    os.remove(antigo)
+    exporter.exportar([_lead("Oficina do Zé"), _lead("Mercado Bom")], filename="leads_20250601_000000")
+    assert indice.sincronizar() == 1
+    assert sorted(d["nome"] for d in indice.consultar()) == ["Mercado Bom", "Oficina do Zé"]
+
+    assert indice.reconstruir() == 2
+    assert len(list(indice.consultar(limite=1))) == 1
+
+
+def test_append_em_arquivo_fora_do_indice(tmp_path):
+    """Testa que o append a um CSV ainda não indexado indexa também as linhas que já existiam."""
+    (tmp_path / "antigo.csv").write_text(
+        "nome,telefone,email,website,fonte,url_origem\n"
+        "Padaria A,88911112222,,,google_maps,https://x\n"
+        "Padaria B,88933334444,,,google_maps,https://x\n",
+        encoding="utf-8"
+    )
+    CSVExporter(output_dir=str(tmp_path)).exportar([_lead("Padaria C")], filename="antigo", append=True)
+
+    indice = IndiceLeads(str(tmp_path))
+    assert indice.sincronizar() == 0
+    assert sorted(d["nome"] for d in indice.consultar()) == ["Padaria A", "Padaria B", "Padaria C"]
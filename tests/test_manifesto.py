@@ -0,0 +1,77 @@
+import os
+
+from extrator_leads.core.csv_exporter import CSVExporter
+from extrator_leads.core.manifesto import ManifestoExportacoes
+from extrator_leads.core.models import Lead
+
+
+def _lead(nome, fonte="google_maps", url="https://www.google.com/maps/search/padarias"):
+    return Lead(nome=nome, fonte=fonte, url_origem=url)
+
+
+def test_exportar_registra_no_manifesto(tmp_path):
+    """Testa que exportações e appends atualizam as contagens do manifesto."""
+    exporter = CSVExporter(output_dir=str(tmp_path), indexar=False)
+    caminho = exporter.exportar([_lead("Padaria A"), _lead("Padaria B")], filename="leads")
+    exporter.exportar([_lead("Loja C", fonte="facebook", url="https://facebook.com/c")], filename="leads", append=True)
+
+    entrada = exporter.manifesto.ler()["leads.csv"]
+    assert entrada["linhas"] == 3
+    assert entrada["fontes"] == {"google_maps": 2, "facebook": 1}
+    assert entrada["urls_origem"] == ["https://www.google.com/maps/search/padarias", "https://facebook.com/c"]
+    assert entrada["bytes"] == (tmp_path / "leads.csv").stat().st_size
+
+    # Sobrescrever recomeça as contagens
+    exporter.exportar([_lead("Padaria A")], filename="leads")
+    assert exporter.manifesto.ler()["leads.csv"]["linhas"] == 1
+    assert not list(tmp_path.glob(".manifest.json.*.tmp"))
+
+
+def test_catalogo_registra_arquivos_externos(tmp_path):
+    """Testa a listagem com arquivos fora do manifesto e apagados."""
+    exporter = CSVExporter(output_dir=str(tmp_path), indexar=False)
+    apagado = exporter.exportar([_lead("Padaria A")], filename="leads_1")
+    exporter.exportar([_lead("Padaria B")], filename="leads_2")
+    (tmp_path / "externo.csv").write_text("nome,fonte,url_origem\nX,google_maps,u\nY,google_maps,u\n")
+    (tmp_path / apagado.split("/")[-1]).unlink()
+
+    manifesto = ManifestoExportacoes(str(tmp_path))
+    catalogo = {e["arquivo"]: e for e in manifesto.catalogo()}
+    assert set(catalogo) == {"leads_2.csv", "externo.csv"}
+    assert "linhas" not in catalogo["externo.csv"]
+
+    catalogo = {e["arquivo"]: e for e in manifesto.catalogo(atualizar=True)}
+    assert catalogo["externo.csv"]["linhas"] == 2
+    assert set(manifesto.ler()) == {"leads_2.csv", "externo.csv"}
+
+
+def test_append_em_arquivo_fora_do_manifesto(tmp_path):
+    """Testa que o append a um CSV não registrado conta também as linhas que já existiam."""
+    (tmp_path / "antigo.csv").write_text("nome,fonte,url_origem\nX,facebook,u\nY,facebook,u\n")
+    exporter = CSVExporter(output_dir=str(tmp_path), indexar=False)
+    exporter.exportar([_lead("Padaria A")], filename="antigo", append=True)
+
+    entrada = exporter.manifesto.ler()["antigo.csv"]
+    assert entrada["linhas"] == 3
+    assert entrada["fontes"] == {"facebook": 2, "google_maps": 1}
+
+
+def test_catalogo_detecta_edicao_de_mesmo_tamanho(tmp_path):
+    """Testa que uma edição que mantém o tamanho é detectada pela data de modificação."""
+    exporter = CSVExporter(output_dir=str(tmp_path), indexar=False)
+    caminho = tmp_path / exporter.exportar([_lead("Padaria A")], filename="leads").split("/")[-1]
+    caminho.write_text(caminho.read_text().replace("google_maps", "google_mapz"))
+    stat = caminho.stat()
+    os.utime(caminho, (stat.st_atime, stat.st_mtime + 10))
+
+    catalogo = exporter.manifesto.catalogo(atualizar=True)
+    assert catalogo[0]["fontes"] == {"google_mapz": 1}
+
+
+def test_falha_no_manifesto_nao_falha_a_exportacao(tmp_path):
+    """Testa que o CSV é exportado mesmo se o manifesto não puder ser gravado."""
+    (tmp_path / "manifest.json").mkdir()
+    exporter = CSVExporter(output_dir=str(tmp_path), indexar=False)
+
+    caminho = exporter.exportar([_lead("Padaria A")], filename="leads")
+    assert (tmp_path / "leads.csv").exists() and caminho.endswith("leads.csv")
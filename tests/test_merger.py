@@ -0,0 +1,84 @@
+import pandas as pd
+
+from extrator_leads.core.merger import (
+    MescladorLeads,
+    chaves_lead,
+    normalizar_dominio,
+    normalizar_telefone,
+)
+
+
+def _csv(caminho, linhas):
+    pd.DataFrame(linhas).to_csv(caminho, index=False)
+    return str(caminho)
+
+
+def test_normalizacao_das_chaves():
+    """Testa a normalização de telefone, domínio e nome."""
+    assert normalizar_telefone("+55 (88) 99999-0000") == normalizar_telefone("88999990000")
+    assert normalizar_dominio("https://www.Exemplo.com.br/contato") == "exemplo.com.br"
+    assert normalizar_dominio("https://www.facebook.com/padaria") is None
+    assert chaves_lead({"nome": "Café São José", "fonte": "google_maps"}) == ["nome:google_maps:cafe sao jose"]
+    assert chaves_lead({"nome": "", "fonte": "google_maps"}) == []
+
+
+def test_mesclar_deduplica_entre_arquivos(tmp_path):
+    """Testa a deduplicação por telefone, domínio e nome, com procedência."""
+    recente = _csv(tmp_path / "leads_2.csv", [
+        {"nome": "Padaria Central", "telefone": "+5588999990000", "website": "", "fonte": "google_maps", "url_origem": "u1"},
+        {"nome": "Oficina do Zé", "telefone": "", "website": "https://oficinadoze.com.br", "fonte": "google_maps", "url_origem": "u2"},
+    ])
+    antigo = _csv(tmp_path / "leads_1.csv", [
+        # Mesmo telefone com outra formatação
+        {"nome": "Padaria Central Ltda", "telefone": "(88) 99999-0000", "website": "", "fonte": "google_maps", "url_origem": "u3"},
+        # Mesmo domínio
+        {"nome": "Oficina Zé", "telefone": "", "website": "http://www.oficinadoze.com.br/", "fonte": "google_maps", "url_origem": "u4"},
+        # Mesmo nome em outra fonte é outro lead
+        {"nome": "Padaria Central", "telefone": "", "website": "", "fonte": "facebook", "url_origem": "u5"},
+        {"nome": "", "telefone": "", "website": "", "fonte": "google_maps", "url_origem": "u6"},
+    ])
+    destino = tmp_path / "consolidado.csv"
+
+    resumo = MescladorLeads(tamanho_bloco=2).mesclar([recente, antigo], str(destino))
+
+    assert (resumo.arquivos, resumo.lidos, resumo.gravados) == (2, 6, 3)
+    assert (resumo.duplicados, resumo.invalidos) == (2, 1)
+
+    df = pd.read_csv(destino, dtype=str, keep_default_na=False)
+    assert list(df["url_origem"]) == ["u1", "u2", "u5"]
+    assert list(df["arquivo_origem"]) == ["leads_2.csv", "leads_2.csv", "leads_1.csv"]
+    assert not list(tmp_path.glob(".*.part"))
+
+
+def test_mesclar_preserva_procedencia_de_consolidado(tmp_path):
+    """Testa que um consolidado anterior pode ser mesclado de novo sem perder a procedência."""
+    origem = _csv(tmp_path / "leads_1.csv", [
+        {"nome": "Padaria Central", "telefone": "88999990000", "website": "", "fonte": "google_maps", "url_origem": "u1"},
+    ])
+    primeiro = tmp_path / "consolidado_1.csv"
+    MescladorLeads().mesclar([origem], str(primeiro))
+
+    segundo = tmp_path / "consolidado_2.csv"
+    resumo = MescladorLeads().mesclar([str(primeiro), origem, str(segundo)], str(segundo))
+
+    assert resumo.arquivos == 2
+    df = pd.read_csv(segundo, dtype=str, keep_default_na=False)
+    assert list(df["arquivo_origem"]) == ["leads_1.csv"]
+
+
+def test_mesclar_ignora_arquivos_delta(tmp_path):
+    """Testa que um delta (com coluna 'mudanca') não ressuscita leads removidos."""
+    leads = _csv(tmp_path / "leads_2.csv", [
+        {"nome": "Padaria A", "telefone": "+5588999990001", "website": "", "fonte": "google_maps", "url_origem": "u1"},
+    ])
+    delta = _csv(tmp_path / "leads_2_delta.csv", [
+        {"mudanca": "removido", "nome": "Padaria B", "telefone": "+5588999990002", "website": "", "fonte": "google_maps", "url_origem": "u2"},
+    ])
+    destino = tmp_path / "consolidado.csv"
+
+    resumo = MescladorLeads().mesclar([leads, delta], str(destino))
+
+    assert resumo.arquivos == 1
+    assert resumo.ignorados == ["leads_2_delta.csv"]
+    df = pd.read_csv(destino, dtype=str, keep_default_na=False)
+    assert list(df["nome"]) == ["Padaria A"]
@@ -0,0 +1,151 @@
+from types import SimpleNamespace
+
+import pytest
+from extrator_leads.extractors import navegador
+from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+from extrator_leads.extractors.navegador import SessaoNavegador
+
+
+class _Tracing:
+    def __init__(self):
+        self.caminhos = []
+
+    def start(self, **kwargs):
+        pass
+
+    def stop(self, path=None):
+        self.caminhos.append(path)
+
+
+class _Contexto:
+    def __init__(self, tracing):
+        self.tracing = tracing
+        self.fechado = False
+        self.pages = []
+
+    def new_page(self):
+        return object()
+
+    def close(self):
+        self.fechado = True
+
+
+class _Browser:
+    def __init__(self):
+        self.tracing = _Tracing()
+        self.contextos = []
+
+    def new_context(self, **kwargs):
+        self.contextos.append(_Contexto(self.tracing))
+        return self.contextos[-1]
+
+
+def test_sessao_reciclar_troca_contexto():
+    """Testa que reciclar fecha o contexto anterior e grava um trace por contexto."""
+    browser = _Browser()
+    with SessaoNavegador(browser=browser, trace_path="/tmp/trace.zip") as sessao:
+        pagina_inicial = sessao.page
+        nova_pagina = sessao.reciclar()
+        assert nova_pagina is not pagina_inicial
+        assert browser.contextos[0].fechado is True
+        assert browser.contextos[1].fechado is False
+
+    assert browser.contextos[1].fechado is True
+    assert browser.tracing.caminhos == ["/tmp/trace.zip", "/tmp/trace_2.zip"]
+
+
+def test_google_maps_precisa_reciclar():
+    """Testa o critério de reciclagem por quantidade de estabelecimentos."""
+    extractor = GoogleMapsExtractor("https://www.google.com/maps/search/x", reciclar_a_cada=3)
+    assert extractor._precisa_reciclar(2) is False
+    assert extractor._precisa_reciclar(3) is True
+
+    extractor = GoogleMapsExtractor("https://www.google.com/maps/search/x")
+    assert extractor._precisa_reciclar(1000) is False
+
+
+def test_limite_de_memoria_mede_so_o_navegador_da_sessao(monkeypatch):
+    """Testa que a reciclagem por memória mede a árvore do driver da sessão, não a do processo inteiro."""
+    # Dois workers, cada um com seu driver: 300 MB no do outro, 100 MB no desta sessão
+    memoria = {None: 400.0, 111: 100.0, 222: 300.0}
+    monkeypatch.setattr(navegador, "rss_descendentes_mb", lambda pid=None: memoria[pid])
+
+    browser = _Browser()
+    browser._impl_obj = SimpleNamespace(_connection=SimpleNamespace(_transport=SimpleNamespace(_proc=SimpleNamespace(pid=111))))
+    extractor = GoogleMapsExtractor("https://www.google.com/maps/search/x", limite_memoria_mb=200, seletores_path=None)
+
+    with SessaoNavegador(browser=browser) as sessao:
+        assert sessao.rss_navegador_mb() == 100.0
+        assert extractor._precisa_reciclar(1, sessao) is False
+
+    # Sem como identificar o driver, mede todos os descendentes do processo
+    with SessaoNavegador(browser=_Browser()) as sessao:
+        assert sessao.rss_navegador_mb() == 400.0
+        assert extractor._precisa_reciclar(1, sessao) is True
+
+
+def test_argumentos_posicionais_chegam_ao_base_extractor():
+    """Testa que GoogleMapsExtractor(url, 10, callback) mantém o significado de limit e callback."""
+    mensagens = []
+    extractor = GoogleMapsExtractor("https://www.google.com/maps/search/x", 10, mensagens.append, seletores_path=None)
+    assert extractor.limit == 10 and extractor.reciclar_a_cada is None
+
+    extractor._log("ok")
+    assert mensagens == ["ok"]
+
+
+def test_sessao_reproduz_har_sem_rede(tmp_path):
+    """Testa que o modo reprodução bloqueia a rede e registra todas as partes do HAR."""
+    (tmp_path / "captura.har").write_text("{}")
+    (tmp_path / "captura_2.har").write_text("{}")
+
+    rotas = []
+    browser = _Browser()
+    contexto_original = browser.new_context
+
+    def new_context(**kwargs):
+        contexto = contexto_original(**kwargs)
+        contexto.route = lambda padrao, handler: rotas.append(("route", padrao))
+        contexto.route_from_har = lambda har, **kw: rotas.append(("har", har, kw.get("not_found")))
+        return contexto
+
+    browser.new_context = new_context
+    har = str(tmp_path / "captura.har")
+    with SessaoNavegador(browser=browser, har_path=har, har_modo="reproduzir"):
+        pass
+
+    assert rotas == [
+        ("route", "**/*"),
+        ("har", har, "fallback"),
+        ("har", str(tmp_path / "captura_2.har"), "fallback"),
+    ]
+
+
+def test_sessao_gravacao_descarta_partes_antigas(tmp_path):
+    """Testa que uma nova gravação apaga as partes de uma gravação anterior mais longa."""
+    for nome in ("captura.har", "captura_2.har", "captura_3.har"):
+        (tmp_path / nome).write_text("{}")
+
+    gravados = []
+    browser = _Browser()
+    contexto_original = browser.new_context
+
+    def new_context(**kwargs):
+        contexto = contexto_original(**kwargs)
+        contexto.route_from_har = lambda har, **kw: gravados.append(har)
+        return contexto
+
+    browser.new_context = new_context
+    har = str(tmp_path / "captura.har")
+    with SessaoNavegador(browser=browser, har_path=har, har_modo="gravar") as sessao:
+        assert list(tmp_path.iterdir()) == []
+        sessao.reciclar()
+
+    assert gravados == [har, str(tmp_path / "captura_2.har")]
+
+
+def test_sessao_reproduz_har_inexistente(tmp_path):
+    """Testa erro ao reproduzir um HAR que não existe."""
+    with pytest.raises(FileNotFoundError):
+        with SessaoNavegador(browser=_Browser(), har_path=str(tmp_path / "x.har"), har_modo="reproduzir"):
+            pass
@@ -0,0 +1,101 @@
+import io
+from types import SimpleNamespace
+
+from rich.console import Console
+
+from extrator_leads.core.config import Configuracao
+from extrator_leads.core.models import Lead
+from extrator_leads.core.retry import FalhaExtracao
+from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+from extrator_leads.painel import PainelExtracao, tabela_leads
+
+
+class _Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def _console():
+    return Console(file=io.StringIO(), force_terminal=True, width=120)
+
+
+def _lead(i):
+    return Lead(nome=f"Padaria {i}", telefone="88999990000", fonte="google_maps", url_origem="https://x")
+
+
+def test_painel_limita_redesenhos_e_janela():
+    """Testa que milhares de leads não redesenham o painel a cada lead nem crescem a janela."""
+    relogio = _Relogio()
+    with PainelExtracao(_console(), janela=5, max_fps=4, relogio=relogio) as painel:
+        for i in range(1000):
+            relogio.agora += 0.01  # 100 leads/s durante 10s
+            painel.registrar_lead(_lead(i))
+
+    assert painel.total == 1000
+    assert [lead.nome for lead in painel.recentes] == [f"Padaria {i}" for i in range(995, 1000)]
+    # Um redesenho ao abrir e no máximo 4 por segundo depois
+    assert painel.redesenhos <= 1 + 4 * 10 + 1
+
+
+def test_painel_taxa_erros_e_eta():
+    """Testa a taxa na janela móvel, a contagem de erros e a estimativa de término."""
+    relogio = _Relogio()
+    painel = PainelExtracao(_console(), janela_taxa=10, relogio=relogio)
+
+    for i in range(20):
+        relogio.agora += 0.5
+        painel.registrar_mensagem(f"[{i + 1}/100] Extraindo...")
+        painel.registrar_lead(_lead(i))
+    # Só falhas reportadas contam; mensagens com ✗ (ex: falha definitiva da mesma URL) não
+    painel.registrar_falha(FalhaExtracao(url="https://x/1", motivo="timeout"))
+    painel.registrar_mensagem("  ✗ Falha definitiva (2x): https://x/1 - timeout")
+
+    assert painel.taxa() == 2.0
+    assert painel.erros == 1
+    assert painel.eta() == 40.0
+
+    # Leads antigos saem da janela da taxa
+    relogio.agora += 30
+    assert painel.taxa() == 0.0 and painel.eta() is None
+
+
+def test_tabela_final_resume_acima_do_limite():
+    """Testa que muitas linhas viram apenas o resumo por campo."""
+    poucos = tabela_leads([_lead(i) for i in range(3)], limite=10)
+    assert poucos.row_count == 3
+
+    muitos = tabela_leads([_lead(i) for i in range(500)], limite=10)
+    assert muitos.row_count == 4
+    console = _console()
+    console.print(muitos)
+    assert "Resumo de 500 leads" in console.file.getvalue()
+
+
+class _ExtractorInstavel(GoogleMapsExtractor):
+    """O lugar 'a' falha só na primeira vez; o 'b' falha sempre."""
+
+    def __init__(self, **kwargs):
+        super().__init__("https://www.google.com/maps/search/x", config=Configuracao(espera_retentativa=0),
+                         seletores_path=None, **kwargs)
+        self.tentativas = {}
+
+    def _extrair_por_navegacao(self, page, url):
+        self.tentativas[url] = self.tentativas.get(url, 0) + 1
+        if url == "b" or self.tentativas[url] == 1:
+            raise TimeoutError("timeout")
+        return Lead(nome=f"Lugar {url}", fonte=self.fonte, url_origem=self.url)
+
+
+def test_painel_conta_so_falhas_definitivas():
+    """Testa que itens recuperados pelas retentativas não ficam contados como erro no painel."""
+    painel = PainelExtracao(_console())
+    extractor = _ExtractorInstavel(on_falha=painel.registrar_falha)
+    sessao = SimpleNamespace(page=None, nova_pagina=lambda: SimpleNamespace(close=lambda: None))
+
+    leads = extractor._extrair_lugares(sessao, ["a", "b"], na_busca=False)
+
+    assert [lead.nome for lead in leads] == ["Lugar a"]
+    assert painel.erros == len(extractor.falhas) == 1
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from extrator_leads.extractors.perfil import PerfilNavegador
+
+
+def _criar_perfil(diretorio: Path) -> PerfilNavegador:
+    (diretorio / "Default" / "Cache").mkdir(parents=True)
+    (diretorio / "Default" / "Cache" / "data_0").write_bytes(b"x" * 2 * 1024 * 1024)
+    (diretorio / "Default" / "Cookies").write_bytes(b"cookies")
+    (diretorio / "SingletonLock").write_text("host-123")
+    return PerfilNavegador(str(diretorio))
+
+
+def test_perfil_usa_copia_isolada_quando_em_uso(tmp_path):
+    """Testa que uma execução concorrente recebe uma cópia isolada do perfil."""
+    perfil = _criar_perfil(tmp_path / "perfil")
+
+    with perfil.abrir() as principal:
+        assert principal == str(perfil.diretorio)
+
+        with perfil.abrir() as copia:
+            assert copia != principal
+            assert (Path(copia) / "Default" / "Cookies").read_bytes() == b"cookies"
+            assert not (Path(copia) / "SingletonLock").exists()
+
+        assert not Path(copia).exists()
+
+    # Liberado o lock, o perfil base volta a ser usado
+    with perfil.abrir() as diretorio:
+        assert diretorio == str(perfil.diretorio)
+
+
+def test_perfil_purgar_preserva_cookies(tmp_path):
+    """Testa que a purga remove os caches mas mantém os cookies."""
+    perfil = _criar_perfil(tmp_path / "perfil")
+    assert perfil.tamanho_mb() > 2
+
+    assert perfil.purgar(limite_mb=10) is False
+    assert perfil.purgar(limite_mb=1) is True
+    assert not (perfil.diretorio / "Default" / "Cache").exists()
+    assert (perfil.diretorio / "Default" / "Cookies").exists()
+    assert perfil.tamanho_mb() < 1
+
+
+def test_perfil_em_uso_nao_e_purgado(tmp_path):
+    """Testa que a purga recusa um perfil aberto por outra execução."""
+    perfil = _criar_perfil(tmp_path / "perfil")
+
+    with perfil.abrir():
+        with pytest.raises(RuntimeError, match="em uso"):
+            perfil.purgar()
+        assert (perfil.diretorio / "Default" / "Cache" / "data_0").exists()
+
+    assert perfil.purgar() is True
@@ -0,0 +1,127 @@
+from types import SimpleNamespace
+
+import pytest
+
+from extrator_leads.core.config import Configuracao
+from extrator_leads.core.models import Lead
+from extrator_leads.core.prazo import Prazo
+from extrator_leads.extractors.google_maps import GoogleMapsExtractor
+
+BUSCA = "https://www.google.com/maps/search/padarias"
+
+
+class _Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_prazo_reserva_e_trecho_final():
+    """Testa o tempo disponível (descontada a reserva), o trecho apertado e os timeouts."""
+    relogio = _Relogio()
+    prazo = Prazo(100, reserva=5, relogio=relogio)
+    assert prazo.disponivel() == 95 and not prazo.apertado
+    assert prazo.limitar_ms(30000) == 30000
+
+    relogio.agora = 80
+    assert prazo.apertado and not prazo.esgotado
+    assert prazo.limitar_ms(30000) == 15000
+
+    relogio.agora = 96
+    assert prazo.esgotado and prazo.restante() == 4
+
+    prazo.registrar_pulo("retentativas", 2)
+    prazo.registrar_pulo("retentativas")
+    assert prazo.resumo() == ["retentativas: 3"]
+
+    with pytest.raises(ValueError):
+        Prazo(0)
+
+
+class _ExtractorCronometrado(GoogleMapsExtractor):
+    """Cada estabelecimento leva 10s no relógio falso; o telefone vem da busca no HTML."""
+
+    def __init__(self, relogio, **kwargs):
+        super().__init__(BUSCA, config=Configuracao(), seletores_path=None, **kwargs)
+        self.relogio = relogio
+        self.buscas_no_html = 0
+
+    def _extrair_por_navegacao(self, page, url):
+        self.relogio.agora += 10
+        telefone = None
+        if not self._pular_se_apertado("busca de telefone no HTML"):
+            self.buscas_no_html += 1
+            telefone = "88999990000"
+        return Lead(nome=f"Lugar {url}", telefone=telefone, fonte=self.fonte, url_origem=self.url)
+
+
+def test_extracao_para_antes_do_prazo():
+    """Testa que a extração para antes do fim, pula os fallbacks no trecho final e resume o que pulou."""
+    relogio = _Relogio()
+    prazo = Prazo(100, reserva=10, relogio=relogio)
+    extractor = _ExtractorCronometrado(relogio, prazo=prazo)
+
+    leads = extractor._extrair_lugares(SimpleNamespace(page=None), [str(i) for i in range(20)], na_busca=False)
+
+    # 90s disponíveis, 10s por lugar: o 9º não cabe com folga; o 8º já cai no trecho apertado (< 20s)
+    assert len(leads) == 8
+    assert extractor.buscas_no_html == 7
+    assert relogio.agora <= prazo.segundos - prazo.reserva
+    assert prazo.pulos == {"busca de telefone no HTML": 1, "estabelecimentos não extraídos": 12}
+    assert extractor.falhas == []
+
+
+def test_sem_prazo_extrai_tudo():
+    """Testa que sem prazo nada é pulado."""
+    extractor = _ExtractorCronometrado(_Relogio())
+    leads = extractor._extrair_lugares(SimpleNamespace(page=None), [str(i) for i in range(20)], na_busca=False)
+    assert len(leads) == 20 and extractor.buscas_no_html == 20
+
+
+class _PaginaPainel:
+    """Página falsa do painel de detalhes que registra os timeouts pedidos ao Playwright."""
+
+    def __init__(self, relogio):
+        self.relogio = relogio
+        self.timeouts = []
+        self.first = self
+
+    def locator(self, seletor):
+        return self
+
+    def scroll_into_view_if_needed(self, timeout):
+        self.timeouts.append(timeout)
+
+    def click(self, timeout):
+        self.timeouts.append(timeout)
+
+    def wait_for_timeout(self, ms):
+        self.timeouts.append(ms)
+        self.relogio.agora += ms / 1000
+
+    def wait_for_selector(self, seletor, timeout):
+        self.timeouts.append(timeout)
+
+    def evaluate(self, script, *args):
+        return None
+
+    def query_selector(self, seletor):
+        return SimpleNamespace(inner_text=lambda: "Padaria Central", is_visible=lambda: True,
+                               get_attribute=lambda nome: None, dispose=lambda: None)
+
+
+def test_esperas_do_painel_respeitam_o_prazo():
+    """Testa que nenhuma espera do painel passa do tempo que resta no prazo."""
+    relogio = _Relogio()
+    prazo = Prazo(100, reserva=0, relogio=relogio)
+    relogio.agora = 99.5
+    extractor = GoogleMapsExtractor(BUSCA, config=Configuracao(espera_botoes=2000, espera_website=1000),
+                                    seletores_path=None, prazo=prazo)
+    page = _PaginaPainel(relogio)
+
+    lead = extractor._extrair_do_painel(page, "/maps/place/Padaria+Central")
+
+    assert lead.nome == "Padaria Central"
+    assert page.timeouts and max(page.timeouts) <= 500
@@ -0,0 +1,29 @@
+from extrator_leads.core.profiler import ProfilerExtracao
+
+
+def _trabalho_lento():
+    return sum(i * i for i in range(200_000))
+
+
+def test_profiler_gera_arquivos_e_resumo(tmp_path):
+    """Testa se o profiler grava os arquivos e identifica as funções quentes."""
+    with ProfilerExtracao(output_dir=str(tmp_path), prefixo="teste") as profiler:
+        _trabalho_lento()
+
+    assert profiler.caminho_stats == tmp_path / "teste.prof"
+    assert profiler.caminho_stats.exists()
+    assert "_trabalho_lento" in profiler.caminho_resumo.read_text(encoding="utf-8")
+    assert profiler.caminho_trace is None
+
+    quentes = profiler.funcoes_quentes(top=5)
+    assert len(quentes) <= 5
+    assert any("_trabalho_lento" in nome or "genexpr" in nome for nome, _, _ in quentes)
+
+    # Sem chamadas ao Playwright, não há operações de página
+    assert profiler.operacoes_pagina() == []
+
+
+def test_profiler_caminho_trace(tmp_path):
+    """Testa se o caminho do trace é definido quando solicitado."""
+    profiler = ProfilerExtracao(output_dir=str(tmp_path), trace=True, prefixo="teste")
+    assert profiler.caminho_trace == tmp_path / "teste_trace.zip"
@@ -0,0 +1,61 @@
+from extrator_leads.core.retry import FilaRetentativas
+
+
+def test_fila_retentativas_backoff_exponencial():
+    """Testa o cálculo da espera entre rodadas."""
+    fila = FilaRetentativas(espera_inicial=1.0, fator=2.0, espera_maxima=5.0)
+    assert [fila.espera(r) for r in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_fila_retentativas_recupera_e_reporta_falhas():
+    """Testa que URLs transitórias são recuperadas e as persistentes reportadas."""
+    esperas = []
+    fila = FilaRetentativas(max_tentativas=3, espera_inicial=1.0, dormir=esperas.append)
+    fila.registrar("https://maps/place/a", "Timeout")
+    fila.registrar("https://maps/place/b", "Timeout")
+    assert len(fila) == 2
+
+    chamadas = {"a": 0}
+
+    def extrair(url):
+        if url.endswith("/a"):
+            chamadas["a"] += 1
+            if chamadas["a"] < 2:
+                raise TimeoutError("Timeout de novo")
+            return "lead-a"
+        raise ValueError("Nome não encontrado")
+
+    resultados = fila.processar(extrair)
+
+    assert resultados == ["lead-a"]
+    assert esperas == [1.0, 2.0, 4.0]
+    assert len(fila.falhas) == 1
+    assert fila.falhas[0].url == "https://maps/place/b"
+    assert fila.falhas[0].motivo == "Nome não encontrado"
+    assert fila.falhas[0].tentativas == 4  # falha original + 3 rodadas
+
+
+def test_fila_retentativas_interrompe():
+    """Testa que o processamento para quando solicitado."""
+    fila = FilaRetentativas(dormir=lambda s: None)
+    fila.registrar("https://maps/place/a", "Timeout")
+    assert fila.processar(lambda url: url, deve_parar=lambda: True) == []
+    assert len(fila.falhas) == 1
+
+
+def test_fila_retentativas_nao_dorme_alem_do_tempo_disponivel():
+    """Testa que a rodada cuja espera não cabe no tempo restante é pulada sem dormir."""
+    esperas = []
+    fila = FilaRetentativas(max_tentativas=3, espera_inicial=2.0, dormir=esperas.append)
+    fila.registrar("https://maps/place/a", "Timeout")
+
+    def extrair(url):
+        raise TimeoutError("Timeout de novo")
+
+    restante = iter([10.0, 3.0])
+    assert fila.processar(extrair, tempo_disponivel=lambda: next(restante)) == []
+
+    # 1ª rodada: 2s cabem em 10s; 2ª: 4s não cabem em 3s
+    assert esperas == [2.0]
+    assert fila.sem_tempo is True
+    assert len(fila.falhas) == 1 and fila.falhas[0].tentativas == 2
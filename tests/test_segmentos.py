@@ -0,0 +1,58 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+from extrator_leads.core.indice import IndiceLeads
+from extrator_leads.core.manifesto import ManifestoExportacoes
+from extrator_leads.core.models import Lead
+from extrator_leads.core.segmentos import EscritorSegmentos
+
+
+def _lead(i):
+    return Lead(nome=f"Padaria {i}", telefone=f"8899999{i:04d}", fonte="google_maps", url_origem="https://maps")
+
+
+def test_segmentos_rotacionam_por_linhas(tmp_path):
+    """Testa a rotação por quantidade de leads e a publicação atômica."""
+    finalizados = []
+    with EscritorSegmentos(str(tmp_path), compressao="gzip", max_linhas=2, callback=finalizados.append) as escritor:
+        for i in range(3):
+            escritor.escrever(_lead(i))
+            if i == 0:
+                # Segmento em andamento ainda não é visível com o nome final
+                assert [p.name for p in tmp_path.glob("leads_*")] == ["leads_0001.csv.gz.part"]
+
+    assert [p.split("/")[-1] for p in finalizados] == ["leads_0001.csv.gz", "leads_0002.csv.gz"]
+    assert not list(tmp_path.glob("*.part"))
+
+    with gzip.open(tmp_path / "leads_0001.csv.gz", "rt", encoding="utf-8") as arquivo:
+        df = pd.read_csv(arquivo, dtype=str)
+    assert list(df["nome"]) == ["Padaria 0", "Padaria 1"]
+    assert "place_id" in df.columns
+
+    manifesto = ManifestoExportacoes(str(tmp_path)).ler()
+    assert manifesto["leads_0002.csv.gz"]["linhas"] == 1
+
+    # Segmentos comprimidos também entram no índice de consulta
+    indice = IndiceLeads(str(tmp_path))
+    indice.sincronizar()
+    assert len(list(indice.consultar())) == 3
+
+
+def test_segmentos_rotacionam_por_bytes_e_continuam_numeracao(tmp_path):
+    """Testa a rotação por tamanho e que uma nova execução não sobrescreve segmentos."""
+    with EscritorSegmentos(str(tmp_path), compressao=None, max_bytes=100) as escritor:
+        for i in range(4):
+            escritor.escrever(_lead(i))
+    assert len(escritor.segmentos) > 1
+
+    with EscritorSegmentos(str(tmp_path), compressao=None) as escritor_seguinte:
+        escritor_seguinte.escrever(_lead(9))
+    assert escritor_seguinte.segmentos[0].endswith(f"leads_{len(escritor.segmentos) + 1:04d}.csv")
+
+
+def test_segmentos_compressao_invalida(tmp_path):
+    """Testa a validação da compressão."""
+    with pytest.raises(ValueError):
+        EscritorSegmentos(str(tmp_path), compressao="bzip2")
@@ -0,0 +1,99 @@
+from extrator_leads.core.seletores import ResolvedorSeletores
+
+
+SELETORES = {"name": ["h1.primario", "h1.secundario", "h1.terciario"]}
+
+
+def _consulta(validos):
+    """Cria uma consulta que só encontra valor nos seletores informados."""
+    return lambda seletor: "Padaria Central" if seletor in validos else None
+
+
+def test_resolvedor_reordena_pelo_acerto():
+    """Testa que o seletor que funciona passa a ser tentado primeiro."""
+    resolvedor = ResolvedorSeletores(SELETORES)
+    assert resolvedor.candidatos("name") == SELETORES["name"]
+
+    for _ in range(3):
+        assert resolvedor.resolver("name", _consulta({"h1.terciario"})) == "Padaria Central"
+
+    assert resolvedor.candidatos("name")[0] == "h1.terciario"
+
+    # Com o seletor certo na frente, uma consulta tenta apenas ele
+    tentados = []
+    resolvedor.resolver("name", lambda s: tentados.append(s) or "Padaria Central")
+    assert tentados == ["h1.terciario"]
+
+
+def test_resolvedor_persiste_estatisticas(tmp_path):
+    """Testa que as estatísticas sobrevivem entre execuções."""
+    caminho = tmp_path / "seletores.json"
+    resolvedor = ResolvedorSeletores(SELETORES, caminho=str(caminho))
+    resolvedor.resolver("name", _consulta({"h1.secundario"}))
+    resolvedor.salvar()
+
+    recarregado = ResolvedorSeletores(SELETORES, caminho=str(caminho))
+    assert recarregado.candidatos("name")[0] == "h1.secundario"
+    linhas = {l["seletor"]: l for l in recarregado.resumo()}
+    assert linhas["h1.primario"]["tentativas"] == 1
+    assert linhas["h1.secundario"]["acertos"] == 1
+
+    recarregado.limpar()
+    assert not caminho.exists()
+    assert ResolvedorSeletores(SELETORES, caminho=str(caminho)).candidatos("name") == SELETORES["name"]
+
+
+def test_resolvedor_alerta_seletor_primario_quebrado():
+    """Testa o alerta quando o seletor primário para de funcionar."""
+    resolvedor = ResolvedorSeletores(SELETORES, min_amostras=5)
+    assert resolvedor.alertas() == []
+
+    # O secundário passa a salvar a extração enquanto o primário não acha nada
+    for _ in range(5):
+        assert resolvedor.resolver("name", _consulta({"h1.secundario"})) == "Padaria Central"
+
+    alertas = resolvedor.alertas()
+    assert len(alertas) == 1
+    assert "h1.primario" in alertas[0]
+
+
+def test_resolvedor_alerta_campo_vazio():
+    """Testa o alerta quando nenhum seletor encontra o campo."""
+    resolvedor = ResolvedorSeletores(SELETORES, min_amostras=5)
+    for _ in range(5):
+        assert resolvedor.resolver("name", _consulta(set())) is None
+
+    assert any("nenhum seletor" in alerta for alerta in resolvedor.alertas())
+
+
+def test_resolvedor_ordem_fixa_para_campo_opcional():
+    """Testa que um campo de ordem fixa não promove o fallback genérico."""
+    seletores = {"website": ["a.site", "a.generico"]}
+    resolvedor = ResolvedorSeletores(seletores, ordem_fixa=["website"])
+
+    # Lugares sem website: só o fallback genérico acha algum link
+    for _ in range(5):
+        resolvedor.resolver("website", lambda s: "https://outro-link" if s == "a.generico" else None)
+
+    assert resolvedor.candidatos("website") == ["a.site", "a.generico"]
+    assert resolvedor.resolver("website", lambda s: f"valor de {s}") == "valor de a.site"
+
+
+def test_resolvedor_soma_execucoes_concorrentes(tmp_path):
+    """Testa que duas execuções que salvam no mesmo arquivo não perdem as contagens uma da outra."""
+    caminho = str(tmp_path / "seletores.json")
+    primeira = ResolvedorSeletores(SELETORES, caminho=caminho)
+    segunda = ResolvedorSeletores(SELETORES, caminho=caminho)
+    assert primeira.estatisticas == {} and segunda.estatisticas == {}
+
+    for _ in range(2):
+        primeira.resolver("name", _consulta({"h1.primario"}))
+    segunda.resolver("name", _consulta({"h1.secundario"}))
+    primeira.salvar()
+    segunda.salvar()
+    segunda.salvar()  # sem novos resultados, não soma de novo
+
+    linhas = {l["seletor"]: l for l in ResolvedorSeletores(SELETORES, caminho=caminho).resumo()}
+    assert linhas["h1.primario"]["tentativas"] == 3 and linhas["h1.primario"]["acertos"] == 2
+    assert linhas["h1.secundario"]["acertos"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
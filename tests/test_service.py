@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import requests
+from extrator_leads.core.models import Lead
+from extrator_leads.service.api import ServidorExtracao
+from extrator_leads.service import jobs
+from extrator_leads.service.jobs import Job, PoolNavegadores
+
+
+def _lead(nome):
+    return Lead(nome=nome, telefone="(88) 99999-0000", fonte="google_maps", url_origem="https://maps.google.com")
+
+
+def test_job_acompanhar_transmite_leads():
+    """Testa se acompanhar entrega os leads conforme chegam até o fim do job."""
+    job = Job("https://www.google.com/maps/search/restaurantes")
+
+    def produzir():
+        job.alterar_status(Job.EXECUTANDO)
+        for i in range(3):
+            job.adicionar_lead(_lead(f"Empresa {i}"))
+        job.alterar_status(Job.CONCLUIDO)
+
+    thread = threading.Thread(target=produzir)
+    thread.start()
+    nomes = [lead.nome for lead in job.acompanhar(timeout=0.1)]
+    thread.join()
+
+    assert nomes == ["Empresa 0", "Empresa 1", "Empresa 2"]
+    assert job.status == Job.CONCLUIDO
+
+
+def test_job_status_finalizado_nao_muda():
+    """Testa que um job cancelado não volta a executar."""
+    job = Job("https://www.google.com/maps/search/restaurantes")
+    job.cancelar()
+    job.alterar_status(Job.EXECUTANDO)
+    assert job.status == Job.CANCELADO
+
+
+def test_api_ciclo_de_vida_job():
+    """Testa criação, consulta, cancelamento e resultados de um job pela API."""
+    # Pool sem workers iniciados: os jobs ficam na fila
+    pool = PoolNavegadores(workers=1)
+    servidor = ServidorExtracao(("127.0.0.1", 0), pool)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{servidor.server_address[1]}"
+
+    try:
+        resp = requests.post(f"{base}/jobs", json={"url": "https://www.google.com/maps/search/x", "limit": 5})
+        assert resp.status_code == 202
+        job_id = resp.json()["id"]
+
+        assert requests.get(f"{base}/jobs/{job_id}").json()["status"] == Job.NA_FILA
+        assert requests.post(f"{base}/jobs", json={"url": "https://site-aleatorio.com"}).status_code == 400
+        assert requests.get(f"{base}/jobs/abc123").status_code == 404
+
+        pool.obter(job_id).adicionar_lead(_lead("Empresa Teste"))
+        assert requests.delete(f"{base}/jobs/{job_id}").json()["status"] == Job.CANCELADO
+
+        linhas = requests.get(f"{base}/jobs/{job_id}/results").text.splitlines()
+        assert [json.loads(l)["nome"] for l in linhas] == ["Empresa Teste"]
+
+        csv = requests.get(f"{base}/jobs/{job_id}/results?format=csv").text.splitlines()
+        assert csv[0] == "nome,telefone,email,website,fonte,url_origem,place_id,email_status"
+        assert csv[1].startswith("Empresa Teste,88999990000")
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+def test_pool_descarta_jobs_finalizados_antigos():
+    """Testa que jobs finalizados saem do pool pela retenção e pelo máximo guardado."""
+    pool = PoolNavegadores(workers=1, retencao=60, max_finalizados=2)
+    enviados = [pool.enviar("https://www.google.com/maps/search/x") for _ in range(4)]
+    for job in enviados[:3]:
+        job.cancelar()
+    enviados[0].finalizado_em = datetime.now() - timedelta(seconds=120)
+
+    # O antigo sai pela retenção; dos outros dois finalizados, ambos cabem no máximo
+    assert [job.id for job in pool.listar()] == [job.id for job in enviados[1:]]
+
+    enviados[3].cancelar()
+    assert [job.id for job in pool.listar()] == [job.id for job in enviados[2:]]
+
+
+class _NavegadorFalso:
+    def __init__(self, conectado):
+        self.conectado = conectado
+
+    def is_connected(self):
+        return self.conectado
+
+    def close(self):
+        self.conectado = False
+
+
+def test_worker_sobrevive_a_falha_ao_reiniciar_navegador(monkeypatch):
+    """Testa que uma falha ao reabrir o navegador falha o job sem matar o worker."""
+    lancamentos = iter([_NavegadorFalso(conectado=False), RuntimeError("sem chromium"), _NavegadorFalso(True)])
+
+    def lancar(headless):
+        resultado = next(lancamentos)
+        if isinstance(resultado, Exception):
+            raise resultado
+        return resultado
+
+    @contextmanager
+    def playwright_falso():
+        yield SimpleNamespace(chromium=SimpleNamespace(launch=lancar))
+
+    executados = []
+    monkeypatch.setattr(jobs, "sync_playwright", playwright_falso)
+    monkeypatch.setattr(PoolNavegadores, "_executar_job", lambda self, job, browser: executados.append(job.id))
+
+    pool = PoolNavegadores(workers=1)
+    pool.iniciar()
+    try:
+        primeiro = pool.enviar("https://www.google.com/maps/search/x")
+        segundo = pool.enviar("https://www.google.com/maps/search/y")
+        for _ in range(100):
+            if executados:
+                break
+            time.sleep(0.01)
+
+        assert primeiro.status == Job.FALHOU and "sem chromium" in primeiro.erro
+        assert executados == [segundo.id]
+    finally:
+        pool.encerrar()
@@ -0,0 +1,187 @@
+import socket
+import struct
+import threading
+
+import pytest
+
+from extrator_leads.core.models import Lead
+from extrator_leads.core.verificacao_email import VerificacaoEmSegundoPlano, VerificadorEmails
+from extrator_leads.utils import dns
+
+# Zona do servidor de teste: domínio -> {tipo: [(ttl, dados)]}
+ZONA = {
+    "comercio.com.br": {dns.TIPO_MX: [(600, "mx.comercio.com.br")]},
+    "so-a.com.br": {dns.TIPO_A: [(600, "10.0.0.1")]},
+    "nulo.com.br": {dns.TIPO_MX: [(600, "")]},
+    "vazio.com.br": {},
+}
+
+
+def _nome(nome: str) -> bytes:
+    if not nome:
+        return b"\x00"
+    return b"".join(bytes([len(r)]) + r.encode() for r in nome.split(".")) + b"\x00"
+
+
+class ServidorDNSFalso:
+    """Servidor DNS local que responde a partir de ZONA e conta as consultas."""
+
+    def __init__(self, familia=socket.AF_INET, host="127.0.0.1"):
+        self.sock = socket.socket(familia, socket.SOCK_DGRAM)
+        self.sock.bind((host, 0))
+        self.endereco = self.sock.getsockname()[:2]
+        self.consultas = []
+        threading.Thread(target=self._servir, daemon=True).start()
+
+    def _servir(self):
+        while True:
+            try:
+                pacote, origem = self.sock.recvfrom(512)
+            except OSError:
+                return
+            ident = struct.unpack("!H", pacote[:2])[0]
+            nome, fim = dns._ler_nome(pacote, 12)
+            tipo = struct.unpack("!H", pacote[fim:fim + 2])[0]
+            self.consultas.append((nome, tipo))
+
+            pergunta = pacote[12:fim + 4]
+            if nome not in ZONA:
+                self.sock.sendto(struct.pack("!HHHHHH", ident, 0x8183, 1, 0, 0, 0) + pergunta, origem)
+                continue
+
+            respostas = b""
+            registros = ZONA[nome].get(tipo, [])
+            for ttl, dados in registros:
+                if tipo == dns.TIPO_MX:
+                    rdata = struct.pack("!H", 10) + _nome(dados)
+                else:
+                    rdata = socket.inet_aton(dados)
+                # Nome do registro como ponteiro de compressão para a pergunta
+                respostas += struct.pack("!HHHIH", 0xC00C, tipo, 1, ttl, len(rdata)) + rdata
+            cabecalho = struct.pack("!HHHHHH", ident, 0x8180, 1, len(registros), 0, 0)
+            self.sock.sendto(cabecalho + pergunta + respostas, origem)
+
+    def fechar(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def servidor():
+    servidor = ServidorDNSFalso()
+    yield servidor
+    servidor.fechar()
+
+
+def test_status_dos_dominios(servidor):
+    """Testa MX, fallback para A, MX nulo, domínio sem registros e inexistente."""
+    verificador = VerificadorEmails(servidor=servidor.endereco, timeout=1.0)
+
+    assert verificador.status_dominio("comercio.com.br") == "valido"
+    assert verificador.status_dominio("so-a.com.br") == "valido"
+    assert verificador.status_dominio("nulo.com.br") == "sem_mx"
+    assert verificador.status_dominio("vazio.com.br") == "sem_mx"
+    assert verificador.status_dominio("nao-existe.com.br") == "dominio_inexistente"
+
+
+def test_verificar_consulta_cada_dominio_uma_vez(servidor):
+    """Testa que leads do mesmo domínio compartilham a consulta e o cache (inclusive negativo)."""
+    agora = [0.0]
+    verificador = VerificadorEmails(servidor=servidor.endereco, timeout=1.0, ttl_negativo=60, relogio=lambda: agora[0])
+    leads = [
+        Lead(nome=f"Loja {i}", email=f"contato{i}@{dominio}", fonte="google_maps", url_origem="https://x")
+        for i, dominio in enumerate(["comercio.com.br", "nao-existe.com.br"] * 50)
+    ] + [Lead(nome="Sem email", fonte="google_maps", url_origem="https://x")]
+
+    verificador.verificar(leads)
+    assert [lead.email_status for lead in leads[:2]] == ["valido", "dominio_inexistente"]
+    assert leads[-1].email_status is None
+    assert len(servidor.consultas) == 2
+
+    verificador.verificar(leads)
+    assert len(servidor.consultas) == 2
+
+    # A resposta negativa expira antes da positiva (TTL 600)
+    agora[0] = 120
+    verificador.verificar(leads)
+    assert servidor.consultas[2:] == [("nao-existe.com.br", dns.TIPO_MX)]
+
+
+def test_sem_resposta_nao_fica_em_cache():
+    """Testa que falhas de rede viram 'erro' e não são guardadas."""
+    mudo = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    mudo.bind(("127.0.0.1", 0))
+    try:
+        verificador = VerificadorEmails(servidor=mudo.getsockname(), timeout=0.1)
+        assert verificador.status_dominio("comercio.com.br") == "erro"
+        assert verificador._do_cache("comercio.com.br") is None
+    finally:
+        mudo.close()
+
+
+def test_servidor_ipv6():
+    """Testa a consulta a um nameserver IPv6."""
+    try:
+        servidor = ServidorDNSFalso(socket.AF_INET6, "::1")
+    except OSError:
+        pytest.skip("IPv6 indisponível")
+    try:
+        verificador = VerificadorEmails(servidor=servidor.endereco, timeout=1.0)
+        assert verificador.status_dominio("comercio.com.br") == "valido"
+    finally:
+        servidor.fechar()
+
+
+def test_interpretar_servidor():
+    """Testa os formatos aceitos por --dns-server e os lidos do resolv.conf."""
+    assert dns.interpretar_servidor("1.1.1.1") == ("1.1.1.1", 53)
+    assert dns.interpretar_servidor("1.1.1.1:5353") == ("1.1.1.1", 5353)
+    assert dns.interpretar_servidor("2001:4860:4860::8888") == ("2001:4860:4860::8888", 53)
+    assert dns.interpretar_servidor("[::1]:5353") == ("::1", 5353)
+    for invalido in ("[::1", "[::1]5353", ":53", "host:porta", "host:70000"):
+        with pytest.raises(ValueError):
+            dns.interpretar_servidor(invalido)
+
+
+def test_resolv_conf_ipv6(tmp_path):
+    """Testa que um nameserver IPv6 do resolv.conf é usado como está."""
+    resolv = tmp_path / "resolv.conf"
+    resolv.write_text("# gerado\nnameserver 2001:db8::53\nnameserver 10.0.0.1\n")
+    assert dns.servidor_do_sistema(str(resolv)) == ("2001:db8::53", 53)
+
+
+def test_verificacao_em_segundo_plano_nao_bloqueia(servidor):
+    """Testa que enviar() não espera o DNS e os leads chegam ao destino na ordem, já verificados."""
+    liberar = threading.Event()
+    verificador = VerificadorEmails(servidor=servidor.endereco, timeout=1.0)
+    consultar = verificador._consultar
+    verificador._consultar = lambda dominio: liberar.wait(5) and consultar(dominio)
+
+    entregues = []
+    with VerificacaoEmSegundoPlano(verificador, entregues.append) as verificacao:
+        for i, email in enumerate(["a@comercio.com.br", None, "b@nao-existe.com.br"]):
+            verificacao.enviar(Lead(nome=f"Loja {i}", email=email, fonte="google_maps", url_origem="https://x"))
+        assert entregues == []  # a extração seguiu sem esperar a primeira consulta
+        liberar.set()
+
+    assert [lead.nome for lead in entregues] == ["Loja 0", "Loja 1", "Loja 2"]
+    assert [lead.email_status for lead in entregues] == ["valido", None, "dominio_inexistente"]
+
+
+def test_verificacao_em_segundo_plano_sobrevive_a_erro_inesperado(servidor):
+    """Testa que uma exceção na consulta marca o lead como 'erro' e a entrega continua."""
+    verificador = VerificadorEmails(servidor=servidor.endereco, timeout=1.0)
+    consultar = verificador._consultar
+
+    def _consultar(dominio):
+        if dominio == "quebrado.com.br":
+            raise RuntimeError("falha inesperada")
+        return consultar(dominio)
+
+    verificador._consultar = _consultar
+
+    entregues = []
+    with VerificacaoEmSegundoPlano(verificador, entregues.append) as verificacao:
+        for i, email in enumerate(["a@quebrado.com.br", "b@comercio.com.br"]):
+            verificacao.enviar(Lead(nome=f"Loja {i}", email=email, fonte="google_maps", url_origem="https://x"))
+
+    assert [lead.email_status for lead in entregues] == ["erro", "valido"]